@@ -0,0 +1,282 @@
+"""
+Benchmark the fallback/consensus engine (`enforce_service_mode`) in each
+mode, with mock services that have a configurable latency distribution and
+failure rate. No network calls are made.
+
+For each mode and level of concurrency, `concurrency` threads make calls at
+the same time until `calls` calls have been made (or one call per thread,
+whichever is more). Measured are throughput, latency percentiles, how many
+service calls were made per fetch, and the most threads alive at once.
+Results are printed as JSON, so runs from different versions can be
+compared:
+
+    python benchmarks/engine.py --output before.json
+    (change something)
+    python benchmarks/engine.py --output after.json --compare before.json
+
+A full run at the default concurrency levels takes several minutes, most of
+it at 10,000 concurrent calls.
+
+usage: python benchmarks/engine.py [--concurrency 1,10,100,1000,10000]
+    [--modes single,paranoid=3,average=3,private,fast=1] [--calls 200]
+    [--services 'lognormal:0.02:0.05,exponential:0.01:0.2,constant:0.05:0']
+"""
+from __future__ import print_function
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import threading
+
+from moneywagon.core import Service, ServiceError, NoService, enforce_service_mode, __version__
+from moneywagon import AddressBalance
+from moneywagon.circuit_breaker import circuit_breakers
+from moneywagon.service_stats import service_stats
+from moneywagon.single_flight import single_flight
+from moneywagon.instance_pool import service_instances
+from moneywagon.executor import default_executor
+
+DEFAULT_SERVICES = "lognormal:0.02:0.05,lognormal:0.04:0.02,exponential:0.01:0.20,constant:0.05:0"
+DEFAULT_MODES = "single,paranoid=3,average=3,private,fast=1"
+DEFAULT_CONCURRENCY = "1,10,100,1000,10000"
+BALANCE = 1.5
+
+LATENCY_DISTRIBUTIONS = {
+    # name -> function of (rand, scale) returning seconds. `scale` is the median.
+    'constant': lambda rand, scale: scale,
+    'uniform': lambda rand, scale: rand.uniform(0, 2 * scale),
+    'exponential': lambda rand, scale: rand.expovariate(0.6931 / scale) if scale else 0,
+    'lognormal': lambda rand, scale: rand.lognormvariate(0, 0.75) * scale,
+}
+
+def make_service(index, distribution, scale, failure_rate):
+    """
+    Returns a mock service class whose `get_balance` sleeps for a time drawn
+    from `distribution` and fails `failure_rate` of the time.
+    """
+    draw = LATENCY_DISTRIBUTIONS[distribution]
+    rand = random.Random(index)
+    lock = threading.Lock()
+    calls = [0]
+
+    def get_balance(self, crypto, address, confirmations=1):
+        with lock:
+            calls[0] += 1
+            latency, failed = draw(rand, scale), rand.random() < failure_rate
+        time.sleep(latency)
+        if failed:
+            raise ServiceError("mock failure")
+        return BALANCE
+
+    name = "Mock%s%s" % (distribution.title(), index)
+    return type(name, (Service,), {
+        'service_id': 0, 'supported_cryptos': ['btc'], 'get_balance': get_balance,
+        'calls': calls, 'distribution': distribution, 'scale': scale,
+        'failure_rate': failure_rate,
+    })
+
+def parse_services(spec):
+    services = []
+    for i, item in enumerate(spec.split(',')):
+        distribution, scale, failure_rate = item.split(':')
+        services.append(make_service(i, distribution, float(scale), float(failure_rate)))
+    return services
+
+def parse_modes(spec):
+    """
+    'paranoid=3' -> ('paranoid=3', {'paranoid': 3}). 'private' on its own
+    uses a 10ms maximum random pause.
+    """
+    modes = []
+    for item in spec.split(','):
+        name, sep, level = item.partition('=')
+        if name == 'single':
+            modes.append((item, {}))
+        elif name == 'private':
+            modes.append((item, {'private': float(level) if sep else 0.01}))
+        else:
+            modes.append((item, {name: int(level) if sep else 2}))
+    return modes
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))
+    return values[index]
+
+
+class ThreadMonitor(object):
+    """
+    Samples the number of live threads every `interval` seconds.
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_scenario(services, label, modes, concurrency, calls, addresses_per_call):
+    circuit_breakers.reset()
+    service_stats.reset()
+    service_instances.clear()
+    for service in services:
+        service.calls[0] = 0
+
+    total = max(calls, concurrency)
+    remaining = [total]
+    counter_lock = threading.Lock()
+    latencies, errors = [], []
+    start_barrier = threading.Barrier(concurrency + 1)
+
+    def caller(n):
+        start_barrier.wait()
+        while True:
+            with counter_lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+                call_number = remaining[0]
+
+            if 'private' in modes:
+                kwargs = {'crypto': 'btc', 'addresses': [
+                    "1Address%s_%s" % (call_number, i) for i in range(addresses_per_call)
+                ]}
+            else:
+                kwargs = {'crypto': 'btc', 'address': "1Address%s" % call_number}
+
+            t0 = time.time()
+            try:
+                enforce_service_mode(list(services), AddressBalance, kwargs, modes=dict(modes))
+                error = None
+            except (NoService, NotImplementedError) as exc:
+                error = exc.__class__.__name__
+            latency = time.time() - t0
+            with counter_lock:
+                latencies.append(latency)
+                if error:
+                    errors.append(error)
+
+    baseline_threads = threading.active_count()
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    with ThreadMonitor() as monitor:
+        start_barrier.wait()
+        t0 = time.time()
+        for thread in threads:
+            thread.join()
+        wall = time.time() - t0
+
+    service_calls = sum(s.calls[0] for s in services)
+    return {
+        'mode': label,
+        'modes': modes,
+        'concurrency': concurrency,
+        'calls': len(latencies),
+        'errors': len(errors),
+        'error_rate': len(errors) / float(len(latencies)),
+        'wall_seconds': wall,
+        'throughput': len(latencies) / wall if wall else None,
+        'latency': {
+            'mean': sum(latencies) / len(latencies),
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p99': percentile(latencies, 99),
+            'p999': percentile(latencies, 99.9),
+            'max': max(latencies),
+        },
+        'service_calls': service_calls,
+        'service_calls_per_fetch': service_calls / float(len(latencies)),
+        'threads': {
+            'peak': monitor.peak,
+            # threads started by moneywagon, not counting the caller threads.
+            'peak_engine': max(0, monitor.peak - baseline_threads - concurrency - 1),
+            'executor_max_workers': default_executor.max_workers,
+        },
+    }
+
+def compare(old, new):
+    """
+    Print the change in throughput and p99 latency between two runs.
+    """
+    previous = dict(((r['mode'], r['concurrency']), r) for r in old['results'])
+    for result in new['results']:
+        before = previous.get((result['mode'], result['concurrency']))
+        if not before:
+            continue
+        print("%-12s c=%-6s throughput: %+7.1f%%  p99: %+7.1f%%" % (
+            result['mode'], result['concurrency'],
+            (result['throughput'] / before['throughput'] - 1) * 100,
+            (result['latency']['p99'] / before['latency']['p99'] - 1) * 100,
+        ), file=sys.stderr)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', default=DEFAULT_CONCURRENCY, help='comma separated levels')
+    parser.add_argument('--modes', default=DEFAULT_MODES)
+    parser.add_argument('--calls', type=int, default=200, help='minimum calls per scenario')
+    parser.add_argument('--services', default=DEFAULT_SERVICES,
+        help='comma separated distribution:median seconds:failure rate')
+    parser.add_argument('--addresses', type=int, default=3, help='addresses per call in private mode')
+    parser.add_argument('--single-flight', action='store_true',
+        help='let identical concurrent calls share results (off, as every call is unique)')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    parser.add_argument('--compare', help='JSON from an earlier run to compare against')
+    argv = parser.parse_args()
+
+    single_flight.enabled = argv.single_flight
+    services = parse_services(argv.services)
+    results = []
+    for label, modes in parse_modes(argv.modes):
+        for concurrency in [int(c) for c in argv.concurrency.split(',')]:
+            result = run_scenario(services, label, modes, concurrency, argv.calls, argv.addresses)
+            results.append(result)
+            print("%-12s c=%-6s %8.1f calls/s  p50: %7.1fms  p99: %7.1fms  errors: %s  peak threads: %s" % (
+                label, concurrency, result['throughput'], result['latency']['p50'] * 1000,
+                result['latency']['p99'] * 1000, result['errors'], result['threads']['peak']
+            ), file=sys.stderr)
+
+    report = {
+        'moneywagon_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.time(),
+        'config': {
+            'services': argv.services, 'modes': argv.modes, 'concurrency': argv.concurrency,
+            'calls': argv.calls, 'addresses': argv.addresses, 'single_flight': argv.single_flight,
+            'executor_max_workers': default_executor.max_workers,
+            'executor_max_per_service': default_executor.max_per_service,
+        },
+        'results': results,
+    }
+
+    if argv.output:
+        with open(argv.output, 'w') as f:
+            f.write(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if argv.compare:
+        with open(argv.compare) as f:
+            compare(json.load(f), report)
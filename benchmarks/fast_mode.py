@@ -0,0 +1,60 @@
+"""
+Compare the latency of the default (sequential fallback) fetching mode with
+fast mode, using mock services with random latency and failures. No network
+calls are made.
+
+usage: python benchmarks/fast_mode.py [calls]
+"""
+from __future__ import print_function
+
+import sys
+import time
+import random
+
+from moneywagon.core import Service, ServiceError, NoService, enforce_service_mode
+from moneywagon import CurrentPrice
+
+def make_service(name, median_latency, failure_rate):
+    def get_current_price(self, crypto, fiat):
+        time.sleep(random.lognormvariate(0, 0.75) * median_latency)
+        if random.random() < failure_rate:
+            raise ServiceError("mock failure")
+        return 100.0
+
+    return type(name, (Service,), {
+        'service_id': 0, 'get_current_price': get_current_price
+    })
+
+SERVICES = [
+    make_service("SlowExchange", 0.20, 0.05),
+    make_service("MediumExchange", 0.08, 0.10),
+    make_service("FlakyExchange", 0.03, 0.40),
+    make_service("FastExchange", 0.05, 0.02),
+]
+
+def percentile(values, p):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))
+    return values[index]
+
+def run(modes, calls):
+    latencies = []
+    errors = 0
+    for i in range(calls):
+        t0 = time.time()
+        try:
+            enforce_service_mode(
+                list(SERVICES), CurrentPrice, {'crypto': 'btc', 'fiat': 'usd'}, modes=dict(modes)
+            )
+        except NoService:
+            errors += 1
+        latencies.append(time.time() - t0)
+    return latencies, errors
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for label, modes in [('single', {}), ('fast=1', {'fast': 1}), ('fast=2', {'fast': 2})]:
+        latencies, errors = run(modes, calls)
+        print("%-8s p50: %6.1fms  p99: %6.1fms  (%s calls, %s errors)" % (
+            label, percentile(latencies, 50) * 1000, percentile(latencies, 99) * 1000, calls, errors
+        ))
@@ -0,0 +1,45 @@
+"""
+Measure how long `import moneywagon` takes in a fresh interpreter, and how
+long it takes to then load the service registry and crypto_data (which are
+loaded lazily on first use).
+
+usage: python benchmarks/import_time.py [runs]
+"""
+from __future__ import print_function
+
+import sys
+import subprocess
+
+CASES = [
+    ('import moneywagon', "import moneywagon"),
+    ('+ crypto_data lookup', "import moneywagon; moneywagon.crypto_data['btc']"),
+    ('+ ALL_SERVICES', "import moneywagon; moneywagon.ALL_SERVICES"),
+    ('moneywagon --help', None),
+]
+
+TIMER = (
+    "import time; t0 = time.time(); exec(%r); print(time.time() - t0)"
+)
+
+def time_case(code, runs):
+    timings = []
+    for i in range(runs):
+        if code is None:
+            # whole CLI start up, including interpreter start.
+            cmd = [sys.executable, '-c', (
+                "import time, subprocess, sys; t0 = time.time(); "
+                "subprocess.check_call([sys.executable, 'bin/moneywagon', '--help'], stdout=subprocess.DEVNULL); "
+                "print(time.time() - t0)"
+            )]
+        else:
+            cmd = [sys.executable, '-c', TIMER % code]
+        timings.append(float(subprocess.check_output(cmd).decode().strip()))
+    return sorted(timings)
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for label, code in CASES:
+        timings = time_case(code, runs)
+        print("%-22s min: %6.1fms  median: %6.1fms  (%s runs)" % (
+            label, timings[0] * 1000, timings[len(timings) // 2] * 1000, runs
+        ))
@@ -1,22 +1,55 @@
 from __future__ import print_function
 import sys
 from binascii import hexlify
-from tabulate import tabulate
 import hashlib
 
 from base58 import b58decode_check, b58encode_check
 
 from .core import (
     AutoFallbackFetcher, enforce_service_mode, get_optimal_services, get_magic_bytes,
-    RevertToPrivateMode, CurrencyNotSupported, NoService, NoServicesDefined, Service
+    RevertToPrivateMode, CurrencyNotSupported, NoService, NoServicesDefined, Service,
+    LazyCryptoData, get_crypto_data, DeadlineExceeded
+)
+from .session_pool import SessionPool, configure_session_pool
+from .cache import ResponseCache, ChainDataStore, use_chain_data_store
+from .circuit_breaker import circuit_breakers, get_circuit_breaker_states
+from .instrumentation import instrumentation, histograms, HistogramSink, JSONLinesSink
+from .credentials import credentials, reload_credentials
+from .instance_pool import service_instances
+from .history import iter_transactions, TransactionIterator, TransactionPage, HistorySync
+from .deadline import Deadline, start_deadline
+from .bulk import (
+    BulkBalance, BulkTransactions, get_address_balances_bulk, iter_single_transactions,
+    get_single_transactions
 )
-from .historical_price import Quandl
-from .crypto_data import crypto_data
 from bitcoin import sha256, pubtoaddr, privtopub, encode_privkey, encode_pubkey, privkey_to_address
-from moneywagon.services import _get_all_services
 
-ALL_SERVICES = _get_all_services()
-EXCHANGE_SERVICES = _get_all_services(just_exchange=True)
+_service_lists = {
+    'ALL_SERVICES': {},
+    'EXCHANGE_SERVICES': {'just_exchange': True},
+}
+
+def __getattr__(name):
+    """
+    Builds `ALL_SERVICES` and `EXCHANGE_SERVICES` on first access.
+    """
+    if name not in _service_lists:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    from moneywagon.services import _get_all_services
+    value = globals()[name] = _get_all_services(**_service_lists[name])
+    return value
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, build the lists now.
+    ALL_SERVICES = __getattr__('ALL_SERVICES')
+    EXCHANGE_SERVICES = __getattr__('EXCHANGE_SERVICES')
+
+# The service modules and crypto_data are only imported when first needed.
+# The (small) crypto_data submodule is imported now, importing it for the
+# first time later would replace this mapping with the module.
+from . import crypto_data
+crypto_data = LazyCryptoData()
 
 is_py2 = False
 if sys.version_info <= (3,0):
@@ -69,6 +102,7 @@ def get_current_price(crypto, fiat, services=None, convert_to=None, helper_price
     if that does not work, it tries converting to an intermediate cryptocurrency
     if available.
     """
+    modes = start_deadline(modes) # shared by the composite fetches
     fiat = fiat.lower()
     args = {'crypto': crypto, 'fiat': fiat, 'convert_to': convert_to}
 
@@ -138,6 +172,10 @@ def get_address_balance(crypto, address=None, addresses=None, services=None, **m
     if not services:
         services = get_optimal_services(crypto, 'address_balance')
 
+    if addresses and modes.get('bulk'):
+        # split into chunks fetched from many services at once.
+        return get_address_balances_bulk(crypto, addresses, services=services, **modes)
+
     args = {'crypto': crypto}
 
     if address:
@@ -162,6 +200,7 @@ def get_address_balance(crypto, address=None, addresses=None, services=None, **m
     return results
 
 def get_historical_transactions(crypto, address=None, addresses=None, services=None, **modes):
+    modes = start_deadline(modes)
     if not services:
         services = get_optimal_services(crypto, 'historical_transactions')
 
@@ -221,6 +260,7 @@ def get_single_transaction(crypto, txid, services=None, **modes):
 
 
 def get_unspent_outputs(crypto, address=None, addresses=None, services=None, **modes):
+    modes = start_deadline(modes)
     if not services:
         services = get_optimal_services(crypto, 'unspent_outputs')
 
@@ -287,10 +327,11 @@ def get_optimal_fee(crypto, tx_bytes, **modes):
     Get the optimal fee based on how big the transaction is. Currently this
     is only provided for BTC. Other currencies will return $0.02 in satoshi.
     """
+    modes = start_deadline(modes)
     try:
         services = get_optimal_services(crypto, 'get_optimal_fee')
     except NoServicesDefined:
-        convert = get_current_price(crypto, 'usd')
+        convert = get_current_price(crypto, 'usd', deadline=modes.get('deadline'))
         fee = int(0.02 / convert * 1e8)
 
         if modes.get('report_services'):
@@ -479,14 +520,24 @@ class OptimalFee(AutoFallbackFetcher):
 
 
 class SingleTransaction(AutoFallbackFetcher):
-    def action(self, crypto, txid):
+    def action(self, crypto, txid=None, txids=None):
         crypto = crypto.lower()
+        if txids:
+            return self._try_services("get_single_transaction_multi", crypto, txids=txids)
         return self._try_services("get_single_transaction", crypto, txid)
 
     @classmethod
     def strip_for_consensus(cls, result):
         return "%.8f %.8f" % (result['total_in'], result['total_out'])
 
+    def cache_forever(self, result, crypto, txid=None, txids=None):
+        # transactions fetched in batches are stored one by one by `BulkTransactions`.
+        return bool(txid and result.get('confirmations'))
+
+    def chain_store_key(self, crypto, txid=None, txids=None):
+        if txid:
+            return "tx:%s" % txid.lower()
+
     def no_service_msg(self, crypto, txid=None, txids=None):
         return "Could not get transaction info for: %s:%s" % (crypto, txid or ', '.join(txids))
 
@@ -499,6 +550,13 @@ class GetBlock(AutoFallbackFetcher):
             'get_block', crypto, block_number=block_number, block_hash=block_hash, latest=latest
         )
 
+    def cache_forever(self, result, crypto, block_number=None, block_hash=None, latest=False):
+        return bool(block_hash)
+
+    def chain_store_key(self, crypto, block_number=None, block_hash=None, latest=False):
+        if block_hash:
+            return "block:%s" % block_hash.lower()
+
     def no_service_msg(self, crypto, block_number=None, block_hash=None, latest=False):
         block = block_number or block_hash or ('latest' if latest else 'None')
         return "Could not get %s block: %s" % (
@@ -625,6 +683,7 @@ class HistoricalPrice(object):
     historical price API service at the moment.
     """
     def __init__(self, responses=None, verbose=False):
+        from .historical_price import Quandl
         self.service = Quandl(responses, verbose=verbose)
 
     def action(self, crypto, fiat, at_time):
@@ -648,6 +707,8 @@ def service_table(format='simple', authenticated=False):
     """
     Returns a string depicting all services currently installed.
     """
+    from tabulate import tabulate
+    from moneywagon import ALL_SERVICES
     if authenticated:
         all_services = ExchangeUniverse.get_authenticated_services()
     else:
@@ -679,6 +740,7 @@ def wif_to_hex(wif):
 
 class ExchangeUniverse(object):
     def __init__(self, verbose=False, services=None, timeout=6):
+        from moneywagon import ALL_SERVICES
         self._all_pairs = {}
         self.services = [
             x(verbose=verbose, timeout=timeout) if not isinstance(x, Service) else x
@@ -688,7 +750,8 @@ class ExchangeUniverse(object):
 
     @classmethod
     def get_authenticated_services(self):
-        return [x for x in ALL_SERVICES if x().api_key]
+        from moneywagon import ALL_SERVICES
+        return [x for x in ALL_SERVICES if credentials.get(x.name).get('api_key')]
 
     def get_benchmarks(self):
         ret = {}
@@ -0,0 +1,160 @@
+"""
+Robust aggregation of numeric results, such as prices and fees, from many
+services. Used by the `aggregate` mode of `enforce_service_mode`:
+
+    get_current_price('btc', 'usd', aggregate='median')
+    get_current_price('btc', 'usd', aggregate='trimmed', trim=0.25)
+    get_optimal_fee('btc', 1024, aggregate='mad', aggregate_timeout=2)
+
+Every service is called at once. Whatever has come back after
+`aggregate_timeout` seconds is aggregated, calls still running are
+abandoned. Unlike `average`, one service returning a wildly wrong value
+can not move the result far.
+"""
+from __future__ import print_function
+
+import time
+from concurrent import futures
+
+DEFAULT_TIMEOUT = 5.0 # seconds to wait for services to respond
+DEFAULT_TRIM = 0.2 # fraction cut from each end by the trimmed mean
+DEFAULT_THRESHOLD = 3.0 # how many (scaled) MADs from the median is an outlier
+MAD_SCALE = 1.4826 # makes the MAD comparable to a standard deviation
+TIE_TOLERANCE = 0.01 # when the MAD is zero, fraction of the median a value may be off by
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def aggregate_median(values):
+    """
+    Returns the median of `values` and the indexes of the values used
+    (all of them).
+    """
+    return median(values), list(range(len(values)))
+
+
+def aggregate_trimmed(values, trim=DEFAULT_TRIM):
+    """
+    Mean of `values` after cutting `trim` of them off each end. When too
+    few values remain, the median is used instead.
+    """
+    cut = int(len(values) * trim)
+    if len(values) - 2 * cut < 1:
+        return aggregate_median(values)
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    used = order[cut:len(order) - cut]
+    return sum(values[i] for i in used) / float(len(used)), sorted(used)
+
+
+def aggregate_mad(values, threshold=DEFAULT_THRESHOLD):
+    """
+    Mean of the values no more than `threshold` median absolute deviations
+    from the median. When more than half the values are equal the MAD is
+    zero, then values within `TIE_TOLERANCE` of the median are used.
+    """
+    middle = median(values)
+    deviations = [abs(v - middle) for v in values]
+    limit = threshold * MAD_SCALE * median(deviations)
+    if not limit:
+        limit = TIE_TOLERANCE * abs(middle)
+    used = [i for i, v in enumerate(values) if abs(v - middle) <= limit]
+    return sum(values[i] for i in used) / float(len(used)), used
+
+
+AGGREGATES = {
+    'median': (aggregate_median, None, None),
+    'trimmed': (aggregate_trimmed, 'trim', 'trimmed'),
+    'mad': (aggregate_mad, 'outlier_threshold', 'outlier'),
+}
+
+
+class AggregateReport(list):
+    """
+    What `report_services` returns in aggregate mode: the list of services
+    whose values went into the result, plus `sources`, a list of dicts, one
+    for every service called:
+
+        {'service': name, 'status': 'used', 'value': 101.5, 'latency': 0.35, 'error': None}
+
+    `status` is one of 'used', 'trimmed', 'outlier', 'error' or 'late'.
+    """
+    def __init__(self, services, sources):
+        super(AggregateReport, self).__init__(services)
+        self.sources = sources
+
+
+def get_aggregate_results(FetcherClass, services, kwargs, how, modes, **fetcher_kwargs):
+    """
+    Calls every service at once and aggregates the values that come back
+    within `aggregate_timeout` seconds. Returned is an `AggregateReport` and
+    the aggregated value.
+    """
+    from .core import NoService, DeadlineExceeded, RevertToPrivateMode, _submit_fetches
+    from .executor import default_executor
+
+    if how not in AGGREGATES:
+        raise ValueError("Unknown aggregate: %s (use one of: %s)" % (how, ", ".join(sorted(AGGREGATES))))
+    aggregate, option, rejected_status = AGGREGATES[how]
+
+    wait = modes.get('aggregate_timeout') or DEFAULT_TIMEOUT
+    if fetcher_kwargs.get('deadline') is not None:
+        wait = fetcher_kwargs['deadline'].cap(wait)
+    # no request should outlive the wait, its value would be thrown away.
+    fetcher_kwargs['timeout'] = min(fetcher_kwargs.get('timeout') or wait, wait)
+
+    start = time.time()
+    fetches = _submit_fetches(FetcherClass, services, kwargs, None, True, fetcher_kwargs)
+    finished = {}
+    for future in fetches:
+        future.add_done_callback(lambda f: finished.setdefault(f, time.time()))
+
+    try:
+        done, not_done = futures.wait(fetches, timeout=max(wait - (time.time() - start), 0))
+    finally:
+        for future in fetches:
+            default_executor.abandon(future)
+
+    sources, values, used_services = [], [], []
+    for future, fetcher in fetches.items():
+        source = {'service': fetcher.services[0].name, 'status': 'late', 'value': None, 'latency': None, 'error': None}
+        sources.append(source)
+        if future not in done:
+            continue
+        source['latency'] = finished.get(future, time.time()) - start
+        try:
+            source['value'] = future.result()
+        except RevertToPrivateMode:
+            raise
+        except (NoService, NotImplementedError) as exc:
+            source.update(status='error', error=str(exc))
+        else:
+            values.append((source, fetcher))
+
+    if not values:
+        deadline = fetcher_kwargs.get('deadline')
+        error = DeadlineExceeded if deadline is not None and deadline.expired else NoService
+        raise error("Aggregate mode got no results within %.2f seconds: %s" % (
+            wait, ", ".join("%s: %s" % (s['service'], s['error'] or s['status']) for s in sources)
+        ))
+
+    args = [modes[option]] if option and modes.get(option) is not None else []
+    result, used = aggregate([source['value'] for source, fetcher in values], *args)
+    for i, (source, fetcher) in enumerate(values):
+        if i in used:
+            source['status'] = 'used'
+            used_services.append(fetcher._successful_service)
+        else:
+            source['status'] = rejected_status
+
+    if fetcher_kwargs.get('verbose'):
+        print("Aggregate mode (%s): %s" % (how, ", ".join(
+            "%s=%s (%s)" % (s['service'], s['value'], s['status']) for s in sources
+        )))
+
+    return AggregateReport(used_services, sources), result
@@ -0,0 +1,586 @@
+"""
+Asyncio versions of the high level moneywagon functions.
+
+    from moneywagon import aio
+
+    async with aio.AsyncClient() as client:
+        balances = await asyncio.gather(*[
+            client.get_address_balance('btc', address) for address in addresses
+        ])
+
+Or for one-off calls, `await aio.get_address_balance('btc', address)`.
+
+Requests are made with aiohttp (pip install aiohttp). If aiohttp is not
+installed, requests are made from a thread pool instead. Services are not
+rewritten for asyncio: each service method is run as normal, and when it
+makes an external request that has not been fetched yet, the event loop
+fetches it without blocking and runs the method again from the start, this
+time answering the request from what was fetched. This way all of the
+existing parsing code in the `Service` classes is used unchanged.
+
+Supported modes: `paranoid`, `average`, `fast`, `random`, `adaptive`,
+`verbose`, `timeout`, `deadline`, `responses` and `report_services`.
+Multiple addresses are fetched concurrently when no service supports
+fetching them in one call.
+"""
+import time
+import random
+import asyncio
+import functools
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from moneywagon import (
+    AddressBalance, UnspentOutputs, HistoricalTransactions, SingleTransaction,
+    CurrentPrice, PushTx
+)
+from .core import (
+    get_optimal_services, NoService, SkipThisService, RevertToPrivateMode, RateLimited,
+    DeadlineExceeded, useragent, _check_consensus, _prepare_consensus, _fast_result
+)
+from .deadline import as_deadline, start_deadline
+from .rate_limit import rate_limiters
+from .session_pool import default_session_pool, positional_argument
+from .cache import ResponseCache
+
+
+class NeedsFetch(BaseException):
+    """
+    Raised from inside a service method when it makes an external request
+    that has not been fetched yet. This is a BaseException so that
+    `except Exception` blocks inside service classes do not swallow it.
+    """
+    def __init__(self, method, url, args, kwargs):
+        super(NeedsFetch, self).__init__(url)
+        self.method = method
+        self.url = url
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ReplayServiceMixin(object):
+    """
+    Mixed into a Service class so its blocking methods can be driven by the
+    event loop. The n-th external request made by a method call is answered
+    with the n-th item of `self._prefetched`, a list of (method, url,
+    response) tuples. Requests past the end of that list raise `NeedsFetch`.
+    """
+    _prefetched = ()
+    _request_index = 0
+
+    def _external_request(self, method, url, *args, **kwargs):
+        index = self._request_index
+        self._request_index += 1
+        self.last_url = url
+
+        if index >= len(self._prefetched):
+            raise NeedsFetch(method, url, args, kwargs)
+
+        fetched_method, fetched_url, response = self._prefetched[index]
+        if (fetched_method, fetched_url) != (method, url):
+            # the method did not make the same requests when run again.
+            raise SkipThisService("%s request %s was %s %s, but is now %s %s" % (
+                self.name, index + 1, fetched_method.upper(), fetched_url, method.upper(), url
+            ))
+
+        if isinstance(response, Exception):
+            raise response
+
+        self.last_raw_response = response
+        self.check_error(response)
+        return response
+
+
+_replay_classes = {}
+
+def replay_class(ServiceClass):
+    """
+    Returns a subclass of `ServiceClass` that can be driven by the event loop.
+    """
+    cls = _replay_classes.get(ServiceClass)
+    if cls is None:
+        cls = _replay_classes[ServiceClass] = type(
+            ServiceClass.__name__, (ReplayServiceMixin, ServiceClass),
+            {'name': ServiceClass.name}
+        )
+    return cls
+
+
+def _make_response(status_code, headers, content, url):
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
+
+
+class AsyncClient(object):
+    """
+    Holds the HTTP session and the per-service concurrency limits. Use one
+    client for many calls so connections are reused.
+
+    `per_service_concurrency` - most number of calls made to any one
+      service at once.
+    `max_requests_per_call` - most number of external requests one service
+      method may make.
+    """
+    def __init__(self, per_service_concurrency=10, verbose=False, timeout=None,
+                 responses=None, max_requests_per_call=20):
+        self.per_service_concurrency = per_service_concurrency
+        self.verbose = verbose
+        self.timeout = timeout
+        self.responses = responses if responses is not None else ResponseCache()
+        self.max_requests_per_call = max_requests_per_call
+        self._semaphores = {}
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None and aiohttp:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.per_service_concurrency)
+            )
+        return self._session
+
+    def _semaphore(self, service):
+        semaphore = self._semaphores.get(service.name)
+        if semaphore is None:
+            semaphore = self._semaphores[service.name] = asyncio.Semaphore(
+                getattr(service, 'max_concurrency', None) or self.per_service_concurrency
+            )
+        return semaphore
+
+    ############################################################################
+
+    async def _request(self, service, method, url, args, kwargs, timeout):
+        """
+        Make the external request. Returned is a `requests.Response` so the
+        service's parsing code works unchanged.
+        """
+        kwargs = dict(kwargs)
+        if args:
+            # same as the blocking requests, see `SessionPool.request`.
+            kwargs[positional_argument(method)] = args[0]
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers['User-Agent'] = useragent
+        auth = kwargs.pop('auth', None)
+
+        if auth is not None and not isinstance(auth, (tuple, requests.auth.HTTPBasicAuth)):
+            session = None # custom auth classes only work with requests
+        else:
+            session = self._get_session()
+
+        if session is None:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(
+                default_session_pool.request, method, url,
+                headers=headers, auth=auth, verify=service.ssl_verify,
+                timeout=timeout, **kwargs
+            )
+            return await loop.run_in_executor(None, call)
+
+        if isinstance(auth, requests.auth.HTTPBasicAuth):
+            auth = aiohttp.BasicAuth(auth.username, auth.password)
+        elif auth is not None:
+            auth = aiohttp.BasicAuth(*auth)
+
+        async with session.request(
+                method.upper(), url, headers=headers, auth=auth,
+                data=kwargs.get('data'),
+                json=kwargs.get('json'), params=kwargs.get('params'),
+                ssl=None if service.ssl_verify else False,
+                timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            content = await resp.read()
+            return _make_response(resp.status, resp.headers, content, str(resp.url))
+
+    async def _fetch(self, service, need, deadline=None):
+        """
+        Fetch the request the service asked for. Returned is either the
+        response or the exception the service should see. With a `deadline`,
+        the request is given only what is left of it.
+        """
+        if need.method == 'get':
+            cached = self.responses.get(need.url)
+            if cached is not None:
+                service._emit_request(need.method, need.url, 0, cached, 'hit')
+                return cached
+
+        timeout = service.timeout
+        if deadline is not None:
+            if deadline.expired:
+                return DeadlineExceeded("Deadline of %ss passed before calling %s" % (deadline.seconds, need.url))
+            timeout = deadline.cap(timeout)
+
+        wait = rate_limiters.reserve(service)
+        if wait is None:
+            return RateLimited("%s rate limit reached" % service.name)
+        if deadline is not None and wait > deadline.remaining():
+            return DeadlineExceeded("%s rate limit wait is longer than the deadline allows" % service.name)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        start = time.time()
+        try:
+            response = await self._request(service, need.method, need.url, need.args, need.kwargs, timeout)
+        except (asyncio.TimeoutError, requests.exceptions.Timeout) as exc:
+            if timeout != service.timeout:
+                # not the service's fault, it was given less than its full timeout.
+                error = DeadlineExceeded("Deadline of %ss passed while calling %s" % (deadline.seconds, need.url))
+            elif isinstance(exc, asyncio.TimeoutError):
+                error = requests.exceptions.Timeout("Timed out: %s" % need.url)
+            else:
+                error = exc
+        except requests.exceptions.ConnectionError as exc:
+            error = exc
+        except Exception as exc:
+            if not (aiohttp and isinstance(exc, aiohttp.ClientError)):
+                raise
+            error = requests.exceptions.ConnectionError(str(exc))
+        else:
+            error = None
+
+        service._emit_request(
+            need.method, need.url, time.time() - start, None if error else response, 'miss', error
+        )
+        if error:
+            return error
+
+        if self.verbose:
+            print("Got Response: %s (took %.3fs)" % (need.url, time.time() - start))
+
+        if response.status_code == 429 or 'Retry-After' in response.headers:
+            rate_limiters.penalize(service, response.headers.get('Retry-After'))
+
+        if need.method == 'get' and response.status_code == 200:
+            self.responses.set(need.url, response, method_name=service.current_method)
+
+        return response
+
+    async def _attempt(self, fetcher, service, method_name, crypto, kwargs):
+        """
+        Async version of `AutoFallbackFetcher._attempt`. The service method is
+        run, and each time it needs an external request, the request is
+        fetched and the method is run again.
+        """
+        started = time.time()
+        service._prefetched = []
+        async with self._semaphore(service):
+            for i in range(self.max_requests_per_call + 1):
+                service._request_index = 0
+                try:
+                    # the asyncio semaphore above limits calls to the service, not the thread pool's.
+                    return fetcher._attempt(service, method_name, crypto, (), kwargs, started=started, slot=False)
+                except NeedsFetch as need:
+                    response = await self._fetch(service, need, fetcher.deadline)
+                    service._prefetched.append((need.method, need.url, response))
+
+        raise NoService("%s made more than %s requests" % (service.name, self.max_requests_per_call))
+
+    async def _try_services(self, fetcher, method_name, kwargs):
+        """
+        Async version of `AutoFallbackFetcher._try_services`.
+        """
+        crypto = kwargs['crypto'].lower()
+        store_key, stored = fetcher._check_chain_store(crypto, (), kwargs)
+        if stored is not None:
+            return stored
+
+        if fetcher.random_wait_seconds > 0:
+            await asyncio.sleep(fetcher._random_pause())
+
+        found = None
+        for service in fetcher._candidates(method_name, crypto):
+            if fetcher._deadline_passed():
+                break
+            call, ret = await self._attempt(fetcher, service, method_name, crypto, kwargs)
+            if call:
+                found = call, ret
+                break
+
+        return fetcher._finish(found, method_name, crypto, store_key, (), kwargs)
+
+    async def _first_results(self, fetchers, method_name, kwargs, fast, finish):
+        """
+        Used by fast mode. Runs every fetcher at once and returns the first
+        `fast` results as [fetcher, value] pairs. The fetches still running
+        are cancelled.
+        """
+        deadline = fetchers[0].deadline if fetchers else None
+        tasks = dict(
+            (asyncio.ensure_future(self._try_services(fetcher, method_name, dict(kwargs))), fetcher)
+            for fetcher in fetchers
+        )
+        pending = set(tasks)
+        results, errors = [], []
+        try:
+            while pending and len(results) < fast:
+                done, pending = await asyncio.wait(
+                    pending, timeout=deadline.remaining() if deadline else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceeded("Deadline of %ss passed with %s calls still running" % (
+                        deadline.seconds, len(pending)
+                    ))
+                for task in done:
+                    try:
+                        value = task.result()
+                    except (NoService, NotImplementedError) as exc:
+                        errors.append(str(exc))
+                        continue
+                    results.append([tasks[task], finish(value) if finish else value])
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if len(results) < fast:
+            raise NoService("Fast mode needed %s results, only got %s: %s" % (
+                fast, len(results), ", ".join(errors)
+            ))
+        return results[:fast]
+
+    async def enforce_service_mode(self, services, FetcherClass, method_name, kwargs, modes, finish=None):
+        """
+        Async version of `enforce_service_mode`. Instead of calling
+        `FetcherClass.action`, `method_name` is called on the services with
+        `kwargs`, and the result is passed through `finish`.
+        """
+        services = [replay_class(s) for s in services]
+        if modes.get('random', False):
+            random.shuffle(services)
+
+        fetcher_kwargs = dict(
+            verbose=modes.get('verbose', self.verbose),
+            timeout=modes.get('timeout', self.timeout),
+            responses=modes.get('responses', self.responses),
+            adaptive=modes.get('adaptive', False) and not modes.get('random', False),
+            random_wait_seconds=modes.get('random_wait_seconds', 0),
+            deadline=as_deadline(modes.get('deadline', None)),
+        )
+        average_level = modes.get('average', 0)
+        paranoid_level = modes.get('paranoid', 0)
+        fast_level = modes.get('fast', 0)
+
+        if fast_level >= 1 and average_level <= 1 and paranoid_level <= 1:
+            # every service is called at once without falling back to the others.
+            fetchers = [FetcherClass(services=[service], **fetcher_kwargs) for service in services]
+            results = await self._first_results(fetchers, method_name, kwargs, fast_level, finish)
+            used_services, value = _fast_result(results)
+            if modes.get('report_services'):
+                return used_services, value
+            return value
+
+        num_results = max(average_level, paranoid_level, 1)
+
+        fetchers = []
+        for service in services[:num_results]:
+            tail = [x for x in services if x is not service]
+            if num_results > 1:
+                random.shuffle(tail)
+            fetchers.append(FetcherClass(services=[service] + tail, **fetcher_kwargs))
+
+        values = await asyncio.gather(*[
+            self._try_services(fetcher, method_name, dict(kwargs)) for fetcher in fetchers
+        ])
+        results = [
+            [fetcher, finish(value) if finish else value]
+            for fetcher, value in zip(fetchers, values)
+        ]
+
+        if average_level > 1:
+            to_compare, used_services = _prepare_consensus(FetcherClass, results)
+            value = sum(to_compare) / len(to_compare)
+        elif paranoid_level > 1:
+            used_services = _check_consensus(FetcherClass, results)
+            value = results[0][1]
+        else:
+            used_services = [fetchers[0]._successful_service]
+            value = results[0][1]
+
+        if modes.get('report_services'):
+            return used_services, value
+        return value
+
+    async def _each_address(self, func, crypto, addresses, services, modes):
+        """
+        Used when no service can handle multiple addresses in one call. Each
+        address is fetched concurrently. Returned is a dict of address -> result.
+        """
+        modes = dict(modes, report_services=False)
+        values = await asyncio.gather(*[
+            func(crypto, address=address, services=services, **modes) for address in addresses
+        ])
+        return dict(zip(addresses, values))
+
+    ############################################################################
+
+    async def get_address_balance(self, crypto, address=None, addresses=None, services=None, **modes):
+        if not services:
+            services = get_optimal_services(crypto, 'address_balance')
+
+        # the multi call and any per address fallback share one budget.
+        modes = start_deadline(modes)
+
+        if address:
+            return await self.enforce_service_mode(
+                services, AddressBalance, 'get_balance',
+                dict(crypto=crypto, address=address, confirmations=1), modes
+            )
+
+        if not addresses:
+            raise Exception("Either address or addresses but not both")
+
+        def add_total(results):
+            if 'total_balance' not in results:
+                results['total_balance'] = sum(results.values())
+            return results
+
+        try:
+            return await self.enforce_service_mode(
+                services, AddressBalance, 'get_balance_multi',
+                dict(crypto=crypto, addresses=addresses, confirmations=1), modes, finish=add_total
+            )
+        except RevertToPrivateMode:
+            results = add_total(await self._each_address(
+                self.get_address_balance, crypto, addresses, services, modes
+            ))
+            return ([], results) if modes.get('report_services') else results
+
+    async def get_unspent_outputs(self, crypto, address=None, addresses=None, services=None, **modes):
+        if not services:
+            services = get_optimal_services(crypto, 'unspent_outputs')
+
+        modes = start_deadline(modes)
+
+        def sort_utxos(utxos):
+            return sorted(utxos, key=lambda x: x['output'])
+
+        if address:
+            return await self.enforce_service_mode(
+                services, UnspentOutputs, 'get_unspent_outputs',
+                dict(crypto=crypto, address=address), modes, finish=sort_utxos
+            )
+
+        try:
+            return await self.enforce_service_mode(
+                services, UnspentOutputs, 'get_unspent_outputs_multi',
+                dict(crypto=crypto, addresses=addresses), modes, finish=sort_utxos
+            )
+        except RevertToPrivateMode:
+            by_address = await self._each_address(
+                self.get_unspent_outputs, crypto, addresses, services, modes
+            )
+            utxos = sort_utxos([u for utxos in by_address.values() for u in utxos])
+            return ([], utxos) if modes.get('report_services') else utxos
+
+    async def get_historical_transactions(self, crypto, address=None, addresses=None, services=None, **modes):
+        if not services:
+            services = get_optimal_services(crypto, 'historical_transactions')
+
+        modes = start_deadline(modes)
+
+        def sort_txs(txs):
+            return sorted(txs, key=lambda tx: tx['date'], reverse=True)
+
+        if address:
+            return await self.enforce_service_mode(
+                services, HistoricalTransactions, 'get_transactions',
+                dict(crypto=crypto, address=address), modes, finish=sort_txs
+            )
+
+        try:
+            return await self.enforce_service_mode(
+                services, HistoricalTransactions, 'get_transactions_multi',
+                dict(crypto=crypto, addresses=addresses), modes, finish=sort_txs
+            )
+        except RevertToPrivateMode:
+            by_address = await self._each_address(
+                self.get_historical_transactions, crypto, addresses, services, modes
+            )
+            txs, seen = [], set()
+            for tx in sort_txs([tx for txs in by_address.values() for tx in txs]):
+                # the same tx may involve more than one of the addresses.
+                if tx['txid'] not in seen:
+                    seen.add(tx['txid'])
+                    txs.append(tx)
+            return ([], txs) if modes.get('report_services') else txs
+
+    async def get_single_transaction(self, crypto, txid, services=None, **modes):
+        if not services:
+            services = get_optimal_services(crypto, 'single_transaction')
+
+        return await self.enforce_service_mode(
+            services, SingleTransaction, 'get_single_transaction',
+            dict(crypto=crypto.lower(), txid=txid), modes
+        )
+
+    async def get_current_price(self, crypto, fiat, services=None, **modes):
+        """
+        Unlike the blocking version, prices are not converted through an
+        intermediate currency when no service supports the pair directly.
+        """
+        fiat = fiat.lower()
+        if crypto.lower() == fiat:
+            return ([], 1.0) if modes.get('report_services') else 1.0
+
+        if not services:
+            services = get_optimal_services(crypto, 'current_price')
+
+        modes = start_deadline(modes)
+        errors = []
+        for key in [fiat, '*']:
+            if not services.get(key):
+                continue
+            try:
+                return await self.enforce_service_mode(
+                    services[key], CurrentPrice, 'get_current_price',
+                    dict(crypto=crypto, fiat=fiat), modes
+                )
+            except NoService as exc:
+                errors.append(str(exc))
+
+        raise NoService("Can not find current price for %s->%s %s" % (crypto, fiat, " ".join(errors)))
+
+    async def push_tx(self, crypto, tx_hex, services=None, **modes):
+        if not services:
+            services = get_optimal_services(crypto, 'push_tx')
+
+        return await self.enforce_service_mode(
+            services, PushTx, 'push_tx', dict(crypto=crypto, tx_hex=tx_hex), modes
+        )
+
+
+def _one_off(name):
+    async def func(*args, **kwargs):
+        async with AsyncClient() as client:
+            return await getattr(client, name)(*args, **kwargs)
+
+    func.__name__ = name
+    func.__doc__ = "Async version of `moneywagon.%s` using a temporary `AsyncClient`." % name
+    return func
+
+get_address_balance = _one_off('get_address_balance')
+get_unspent_outputs = _one_off('get_unspent_outputs')
+get_historical_transactions = _one_off('get_historical_transactions')
+get_single_transaction = _one_off('get_single_transaction')
+get_current_price = _one_off('get_current_price')
+push_tx = _one_off('push_tx')
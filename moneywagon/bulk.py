@@ -0,0 +1,309 @@
+"""
+Fetching for very large sets of addresses or transactions. The items are
+split into chunks no larger than each service accepts at once, and the
+chunks are fetched from many services at the same time. Items in a chunk
+that fails are retried on a different service.
+
+    bulk = BulkBalance('btc')
+    balances = bulk.fetch(addresses)
+    bulk.failed # address -> error, for addresses no service could fetch
+
+    for txid, tx in BulkTransactions('btc').iter(txids):
+        ... # as each one arrives
+
+Services without a batch method (`get_balance_multi`,
+`get_single_transaction_multi`) are used one item at a time.
+
+With a `deadline`, items not fetched by the time it passes are put in
+`failed` instead of being tried on more services.
+"""
+from __future__ import print_function
+
+from collections import deque
+from concurrent import futures
+
+from .core import NoService, get_optimal_services
+from .cache import get_chain_data_store
+from .capabilities import implements
+from .circuit_breaker import circuit_breakers, CLOSED
+from .deadline import as_deadline
+from .executor import default_executor
+
+DEFAULT_CHUNK_SIZE = 100 # for services that do not set a limit of their own
+
+
+class BulkFetcher(object):
+    """
+    Subclasses set which service methods to use, and the service attribute
+    holding how many items a batch call accepts.
+
+    `max_attempts` is how many services an item is tried on before it is
+    given up on. `chunk_size` caps the chunk size for every service.
+    `deadline` is the number of seconds (or a `Deadline`) each call to
+    `iter` or `fetch` may take in total.
+    """
+    service_type = None # crypto_data service type, for the default services
+    single_method = None
+    multi_method = None
+    limit_attribute = None
+    item_name = 'item'
+
+    def __init__(self, crypto, services=None, max_attempts=3, chunk_size=None, verbose=False, timeout=None, deadline=None):
+        self.crypto = crypto.lower()
+        self.services = services or get_optimal_services(crypto, self.service_type)
+        self.max_attempts = max_attempts
+        self.chunk_size = chunk_size
+        self.verbose = verbose
+        self.timeout = timeout
+        self.deadline = deadline
+        self._deadline = None # started when fetching begins
+        self.failed = {}
+        self.calls = {} # service name -> number of chunks fetched from it
+
+    def _chunk_size(self, service):
+        if not implements(service, self.multi_method):
+            return 1
+        size = getattr(service, self.limit_attribute, None) or DEFAULT_CHUNK_SIZE
+        return min(size, self.chunk_size) if self.chunk_size else size
+
+    def _fetch_chunk(self, service, items):
+        """
+        Returns a dict of item -> value. Items missing from it are retried
+        elsewhere.
+        """
+        if len(items) == 1 and not implements(service, self.multi_method):
+            return {items[0]: self._fetch_one(service, items[0])}
+        return self._fetch_many(service, items)
+
+    def _fetch_one(self, service, item):
+        raise NotImplementedError()
+
+    def _fetch_many(self, service, items):
+        raise NotImplementedError()
+
+    def fetch(self, items):
+        """
+        Returns a dict of item -> value. Items that could not be fetched are
+        left out, and put in `self.failed`.
+        """
+        return dict(self.iter(items))
+
+    def iter(self, items):
+        """
+        Yields (item, value) tuples in the order they come back.
+        """
+        services = [s for s in self.services if
+            implements(s, self.multi_method) or implements(s, self.single_method)
+        ]
+        if not services:
+            raise NoService("No services to get %s %ss from" % (self.crypto, self.item_name))
+
+        # items waiting to be fetched, grouped by the services they have failed on.
+        waiting = {frozenset(): deque(dict.fromkeys(items))}
+        errors = {}
+        in_flight = {} # future -> (service, items, tried)
+        busy = dict((s.name, 0) for s in services)
+        names = set(busy)
+        self.failed = {}
+        self.calls = {}
+        deadline = self._deadline = as_deadline(self.deadline)
+        expired = lambda: deadline is not None and deadline.expired
+
+        def give_up(item, error):
+            self.failed[item] = error
+            if self.verbose:
+                print("Bulk fetch: giving up on %s: %s" % (item, error))
+
+        def take(service):
+            size = self._chunk_size(service)
+            for tried in sorted(waiting, key=len):
+                queue = waiting[tried]
+                if service.name in tried or not queue:
+                    continue
+                return [queue.popleft() for i in range(min(size, len(queue)))], tried
+            return None, None
+
+        try:
+            while True:
+                # hand a chunk to every service that has room for one
+                for service in ([] if expired() else services):
+                    limit = getattr(service, 'max_concurrency', None) or default_executor.max_per_service
+                    while busy[service.name] < limit and len(in_flight) < default_executor.max_workers:
+                        # the call itself takes the probe if the breaker is half-open.
+                        if circuit_breakers.is_open(service):
+                            break
+                        chunk, tried = take(service)
+                        if not chunk:
+                            break
+                        busy[service.name] += 1
+                        future = default_executor.submit(self._fetch_chunk, service, chunk)
+                        in_flight[future] = (service, chunk, tried)
+                        if circuit_breakers.enabled and circuit_breakers.get(service).state != CLOSED:
+                            break # one probe chunk at a time
+
+                # items every service has failed on (or that can't be sent anywhere)
+                for tried in list(waiting):
+                    if waiting[tried] and (len(tried) >= self.max_attempts or names <= tried or not in_flight or expired()):
+                        while waiting[tried]:
+                            item = waiting[tried].popleft()
+                            give_up(item, "Deadline of %ss passed" % deadline.seconds if expired()
+                                else errors.get(item, "No service available"))
+
+                if not in_flight:
+                    return
+
+                done, pending = futures.wait(
+                    in_flight, timeout=deadline.remaining() if deadline else None,
+                    return_when=futures.FIRST_COMPLETED
+                )
+                if not done:
+                    # out of time, chunks still running are abandoned.
+                    for service, chunk, tried in in_flight.values():
+                        for item in chunk:
+                            give_up(item, "Deadline of %ss passed waiting on %s" % (deadline.seconds, service.name))
+                    return
+
+                for future in done:
+                    service, chunk, tried = in_flight.pop(future)
+                    busy[service.name] -= 1
+                    try:
+                        values = future.result()
+                    except (NoService, NotImplementedError) as exc:
+                        values, error = {}, "%s: %s" % (service.name, exc)
+                    else:
+                        self.calls[service.name] = self.calls.get(service.name, 0) + 1
+                        error = "%s: %s missing from response" % (service.name, self.item_name)
+
+                    retry = tried | set([service.name])
+                    for item in chunk:
+                        if item in values:
+                            yield item, values[item]
+                        else:
+                            errors[item] = error
+                            waiting.setdefault(retry, deque()).append(item)
+        finally:
+            # the caller stopped iterating, don't start any chunks not yet running.
+            for future in in_flight:
+                default_executor.abandon(future)
+
+
+class BulkBalance(BulkFetcher):
+    service_type = 'address_balance'
+    single_method = 'get_balance'
+    multi_method = 'get_balance_multi'
+    limit_attribute = 'max_addresses_per_call'
+    item_name = 'address'
+
+    def __init__(self, crypto, services=None, confirmations=1, **kwargs):
+        self.confirmations = confirmations
+        super(BulkBalance, self).__init__(crypto, services=services, **kwargs)
+
+    def _fetcher(self, service):
+        from moneywagon import AddressBalance
+        return AddressBalance(
+            services=[service], verbose=self.verbose, timeout=self.timeout, deadline=self._deadline
+        )
+
+    def _fetch_one(self, service, address):
+        return self._fetcher(service).action(self.crypto, address=address, confirmations=self.confirmations)
+
+    def _fetch_many(self, service, addresses):
+        balances = self._fetcher(service).action(
+            self.crypto, addresses=addresses, confirmations=self.confirmations
+        )
+        balances.pop('total_balance', None)
+        return balances
+
+
+class BulkTransactions(BulkFetcher):
+    """
+    Transactions already in the chain data store are returned first,
+    without calling any service. Confirmed transactions fetched in batches
+    are added to the store.
+    """
+    service_type = 'single_transaction'
+    single_method = 'get_single_transaction'
+    multi_method = 'get_single_transaction_multi'
+    limit_attribute = 'max_txids_per_call'
+    item_name = 'transaction'
+
+    def _fetcher(self, service):
+        from moneywagon import SingleTransaction
+        return SingleTransaction(
+            services=[service], verbose=self.verbose, timeout=self.timeout, deadline=self._deadline
+        )
+
+    def _fetch_one(self, service, txid):
+        return self._fetcher(service).action(self.crypto, txid)
+
+    def _fetch_many(self, service, txids):
+        store = get_chain_data_store()
+        ret = {}
+        for tx in self._fetcher(service).action(self.crypto, txids=txids):
+            ret[tx['txid']] = tx
+            if store is not None and tx.get('confirmations'):
+                store.set(self.crypto, "tx:%s" % tx['txid'].lower(), tx)
+        return ret
+
+    def iter(self, txids):
+        store = get_chain_data_store()
+        if store is None:
+            for ret in super(BulkTransactions, self).iter(txids):
+                yield ret
+            return
+
+        missing = []
+        for txid in txids:
+            tx = store.get(self.crypto, "tx:%s" % txid.lower())
+            if tx is None:
+                missing.append(txid)
+            else:
+                yield txid, tx
+
+        for ret in super(BulkTransactions, self).iter(missing):
+            yield ret
+
+
+def _raise_for_failures(bulk, items):
+    if bulk.failed:
+        raise NoService("Could not get %s of %s %s %ss. Last error: %s" % (
+            len(bulk.failed), len(items), bulk.crypto, bulk.item_name, list(bulk.failed.values())[-1]
+        ))
+
+def get_address_balances_bulk(crypto, addresses, services=None, **modes):
+    """
+    Returns a dict of address -> balance, plus 'total_balance'. Raises
+    `NoService` if the balance of any address could not be fetched. Use
+    `BulkBalance` directly to get partial results. With `report_services`,
+    the services that returned balances are returned along with it.
+    """
+    bulk = BulkBalance(
+        crypto, services=services, confirmations=modes.get('confirmations', 1),
+        verbose=modes.get('verbose', False), timeout=modes.get('timeout'), deadline=modes.get('deadline')
+    )
+    results = bulk.fetch(addresses)
+    _raise_for_failures(bulk, addresses)
+    results['total_balance'] = sum(results.values())
+    if modes.get('report_services'):
+        return [s for s in bulk.services if s.name in bulk.calls], results
+    return results
+
+def iter_single_transactions(crypto, txids, services=None, **modes):
+    """
+    Yields (txid, transaction) tuples as each one is fetched. Each txid falls
+    back to other services on its own. Raises `NoService` at the end if any
+    could not be fetched.
+    """
+    bulk = BulkTransactions(
+        crypto, services=services, verbose=modes.get('verbose', False), timeout=modes.get('timeout'),
+        deadline=modes.get('deadline')
+    )
+    for ret in bulk.iter(txids):
+        yield ret
+    _raise_for_failures(bulk, txids)
+
+def get_single_transactions(crypto, txids, services=None, **modes):
+    """
+    Returns a dict of txid -> transaction.
+    """
+    return dict(iter_single_transactions(crypto, txids, services=services, **modes))
@@ -0,0 +1,281 @@
+"""
+Caching of external responses and chain data.
+
+`ResponseCache` replaces the plain dict that used to be held in
+`Service.responses`. Entries expire after a per-method TTL and the least
+recently used entries are evicted once the cache holds too many entries or
+too many bytes. One instance can be shared by many services (and many
+fetchers) by passing it in as the `responses` argument.
+
+`ChainDataStore` persists immutable chain data (confirmed transactions, blocks
+fetched by hash) to disk.
+"""
+import os
+import sys
+import json
+import time
+import datetime
+import threading
+from collections import OrderedDict
+
+
+# How long (in seconds) a response fetched by each service method stays valid.
+# `None` means the response never expires.
+DEFAULT_METHOD_TTLS = {
+    'get_current_price': 15,
+    'get_balance': 15,
+    'get_balance_multi': 15,
+    'get_unspent_outputs': 15,
+    'get_unspent_outputs_multi': 15,
+    'get_transactions': 30,
+    'get_transactions_multi': 30,
+    'get_transactions_page': 30,
+    'get_optimal_fee': 60,
+    'get_orderbook': 5,
+    'get_pairs': 3600,
+}
+
+class ResponseCache(object):
+    """
+    Thread safe LRU cache with per-entry expiry.
+
+    `max_entries` - most number of responses held at once.
+    `max_bytes` - most number of bytes (of response bodies) held at once.
+    `default_ttl` - seconds until an entry expires when the method it was
+      fetched by has no entry in `method_ttls`.
+    `method_ttls` - dict of service method name -> ttl in seconds. Updates
+      the values in `DEFAULT_METHOD_TTLS`.
+    """
+    def __init__(self, max_entries=1000, max_bytes=50 * 1024 * 1024, default_ttl=60, method_ttls=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.method_ttls = dict(DEFAULT_METHOD_TTLS)
+        self.method_ttls.update(method_ttls or {})
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+
+        self._entries = OrderedDict() # key -> [value, expires_at, size]
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return "<ResponseCache: %s entries, %s bytes, %s hits, %s misses>" % (
+            len(self), self.total_bytes, self.hits, self.misses
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def keys(self):
+        with self._lock:
+            return [k for k, e in self._entries.items() if not self._is_expired(e)]
+
+    def ttl_for(self, method_name):
+        """
+        Returns the ttl for responses fetched by the passed in service method.
+        """
+        return self.method_ttls.get(method_name, self.default_ttl)
+
+    @staticmethod
+    def _is_expired(entry):
+        expires_at = entry[1]
+        return expires_at is not None and expires_at <= time.time()
+
+    @staticmethod
+    def _size_of(value):
+        content = getattr(value, 'content', None)
+        if content is not None:
+            return len(content)
+        return sys.getsizeof(value)
+
+    def _remove(self, key):
+        value, expires_at, size = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return default
+
+            # mark as most recently used
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, ttl=-1, method_name=None):
+        """
+        Add a value to the cache. If `ttl` is not given, the ttl is looked up
+        by `method_name`. A ttl of `None` means the value never expires, a ttl
+        of 0 means the value is not cached at all.
+        """
+        if ttl == -1:
+            ttl = self.ttl_for(method_name) if method_name else self.default_ttl
+
+        if ttl == 0:
+            with self._lock:
+                if key in self._entries:
+                    self._remove(key)
+            return
+
+        size = self._size_of(value)
+        expires_at = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = [value, expires_at, size]
+            self.total_bytes += size
+            self._evict()
+
+    def make_permanent(self, key):
+        """
+        Mark an entry as never expiring. Used for immutable data such as
+        confirmed transactions and blocks fetched by hash.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] = None
+
+    def _evict(self):
+        while self._entries and (
+                len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': float(self.hits) / lookups if lookups else 0.0,
+        }
+
+
+class ChainDataStore(object):
+    """
+    Persistent store for immutable chain data, backed by an SQLite database.
+    Holds the normalized moneywagon dicts (not the raw service responses) of
+    confirmed transactions and blocks fetched by hash, so that once an item
+    is stored, no service has to be called for it again, even across process
+    restarts. Note that the `confirmations` field of stored items reflects
+    the time it was first fetched.
+
+    Pass `path=':memory:'` for a store that only lasts the life of the process.
+    """
+    name = "Chain Data Store"
+    last_url = None
+
+    def __init__(self, path='~/.moneywagon_chain_data.sqlite'):
+        import sqlite3
+        if path != ':memory:':
+            path = os.path.expanduser(path)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS chain_data ("
+                "crypto TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (crypto, key))"
+            )
+            self._conn.commit()
+
+    def __repr__(self):
+        return "<ChainDataStore: %s (%s items)>" % (self.path, len(self))
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chain_data").fetchone()[0]
+
+    @staticmethod
+    def _encode(obj):
+        if isinstance(obj, datetime.datetime):
+            return {'__datetime__': obj.isoformat(), 'naive': obj.tzinfo is None}
+        raise TypeError("Type not serializable")
+
+    @staticmethod
+    def _decode(obj):
+        if '__datetime__' in obj:
+            import arrow
+            dt = arrow.get(obj['__datetime__']).datetime
+            return dt.replace(tzinfo=None) if obj.get('naive') else dt
+        return obj
+
+    def get(self, crypto, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM chain_data WHERE crypto = ? AND key = ?",
+                (crypto.lower(), key)
+            ).fetchone()
+
+        if not row:
+            return None
+        return json.loads(row[0], object_hook=self._decode)
+
+    def set(self, crypto, key, value):
+        data = json.dumps(value, default=self._encode)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chain_data (crypto, key, data) VALUES (?, ?, ?)",
+                (crypto.lower(), key, data)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM chain_data")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_chain_data_store = None
+
+def use_chain_data_store(store):
+    """
+    Enable the process wide chain data store. `store` can either be a
+    `ChainDataStore` instance, or a path to the SQLite database file. Pass in
+    `None` to disable.
+    """
+    global _chain_data_store
+    if store is not None and not isinstance(store, ChainDataStore):
+        store = ChainDataStore(store)
+    _chain_data_store = store
+    return store
+
+def get_chain_data_store():
+    return _chain_data_store
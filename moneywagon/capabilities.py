@@ -0,0 +1,108 @@
+"""
+An index of which services can do what, built once from `crypto_data`.
+
+Whether a service supports a method is found by looking at which `get_*`
+methods its class overrides, instead of calling the method and catching
+`NotImplementedError`.
+"""
+import threading
+
+from .core import Service
+
+_implements = {}
+
+def implements(ServiceClass, method_name):
+    """
+    Returns True if `ServiceClass` (or one of its bases other than `Service`)
+    defines `method_name`. Classes that do not subclass `Service` are assumed
+    to implement every method they have.
+    """
+    key = (ServiceClass, method_name)
+    ret = _implements.get(key)
+    if ret is None:
+        ret = hasattr(ServiceClass, method_name)
+        for klass in getattr(ServiceClass, '__mro__', ()):
+            if klass is Service:
+                ret = False
+                break
+            if method_name in vars(klass):
+                break
+        _implements[key] = ret
+    return ret
+
+
+class CapabilityIndex(object):
+    """
+    Maps crypto -> service type -> services, used by `get_optimal_services`.
+    Lists are stored as tuples and copied on the way out, so the index (and
+    crypto_data) can not be changed by callers that shuffle or sort the
+    services they are given.
+    """
+    def __init__(self):
+        self._by_crypto = None
+        self._lock = threading.Lock()
+
+    def _build(self):
+        from .crypto_data import crypto_data
+
+        by_crypto = {}
+        for currency, data in list(crypto_data.items()):
+            if currency == '':
+                continue # template
+            if 'services' not in data:
+                by_crypto[currency] = None
+                continue
+
+            entry = by_crypto[currency] = {}
+            for type_of_service, services in data['services'].items():
+                if type_of_service == 'current_price':
+                    # price services are defined as a dict of fiat -> services
+                    entry[type_of_service] = dict(
+                        (fiat, tuple(s)) for fiat, s in services.items()
+                    )
+                else:
+                    entry[type_of_service] = tuple(services)
+
+        self._by_crypto = by_crypto
+
+    def _index(self):
+        if self._by_crypto is None:
+            with self._lock:
+                if self._by_crypto is None:
+                    self._build()
+        return self._by_crypto
+
+    def rebuild(self):
+        """
+        Call after changing crypto_data.
+        """
+        with self._lock:
+            self._build()
+
+    def services_for(self, crypto, type_of_service):
+        """
+        Returns the services defined in crypto_data for this currency and type
+        of service, as a new list (or a new dict of fiat -> list for
+        'current_price'). Raises KeyError if the currency is not known, and
+        returns None if it has no services of that type.
+        """
+        index = self._index()
+        if crypto not in index:
+            # maybe added to crypto_data after the index was built.
+            from .crypto_data import crypto_data
+            if crypto not in crypto_data:
+                raise KeyError(crypto)
+            self.rebuild()
+            index = self._index()
+
+        entry = index.get(crypto)
+        if entry is None:
+            raise KeyError(crypto) # currency has no services defined at all
+
+        services = entry.get(type_of_service)
+        if isinstance(services, dict):
+            return dict((fiat, list(s)) for fiat, s in services.items())
+        return list(services) if services is not None else None
+
+
+capability_index = CapabilityIndex()
@@ -0,0 +1,180 @@
+"""
+Per-service circuit breakers used by `AutoFallbackFetcher`.
+
+When a service keeps failing with `ServiceError`, connection errors or
+timeouts, its breaker "opens" and the service is skipped without being
+called. After a cooldown period one "probe" call is let through (the
+"half-open" state). If the probe succeeds the breaker closes again, if it
+fails the breaker stays open for another cooldown period.
+"""
+import time
+import threading
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+    """
+    `failure_threshold` is how many failures in a row open the breaker.
+    `cooldown` is how many seconds the breaker stays open before a probe
+      call is allowed through.
+    """
+    def __init__(self, name, failure_threshold=5, cooldown=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<CircuitBreaker: %s (%s)>" % (self.name, self.state)
+
+    def allow_request(self):
+        """
+        Returns True if the service may be called.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN and time.time() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probing = False
+
+            if self.state == HALF_OPEN and not self._probing:
+                # only one probe call at a time
+                self._probing = True
+                return True
+
+            return False
+
+    def is_open(self):
+        """
+        Returns True if calls to the service would be refused right now.
+        Unlike `allow_request`, this does not take the half-open probe.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            if self.state == OPEN:
+                return time.time() - self.opened_at < self.cooldown
+            return self._probing
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.times_opened += 1
+                self.state = OPEN
+                self.opened_at = time.time()
+                self._probing = False
+
+    def release(self):
+        """
+        Called when a call was let through but nothing was learned about
+        whether the service is up, so another probe may be made.
+        """
+        with self._lock:
+            self._probing = False
+
+    def reset(self):
+        self.record_success()
+
+    def status(self):
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0, self.cooldown - (time.time() - self.opened_at))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'times_opened': self.times_opened,
+                'retry_in': retry_in,
+            }
+
+
+class CircuitBreakerRegistry(object):
+    """
+    Holds one `CircuitBreaker` for each service, created on first use.
+    Set `enabled` to False to never skip any service.
+    """
+    def __init__(self, failure_threshold=5, cooldown=30, enabled=True):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.enabled = enabled
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, service):
+        name = getattr(service, 'name', service)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = self._breakers[name] = CircuitBreaker(
+                        name, self.failure_threshold, self.cooldown
+                    )
+        return breaker
+
+    def is_open(self, service):
+        return self.enabled and self.get(service).is_open()
+
+    def configure(self, failure_threshold=None, cooldown=None, enabled=None):
+        """
+        Change the settings for all breakers, existing and future.
+        """
+        if failure_threshold is not None:
+            self.failure_threshold = failure_threshold
+        if cooldown is not None:
+            self.cooldown = cooldown
+        if enabled is not None:
+            self.enabled = enabled
+
+        with self._lock:
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = self.failure_threshold
+                breaker.cooldown = self.cooldown
+
+    def states(self):
+        """
+        Returns a dict of service name -> status of its breaker.
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return dict((b.name, b.status()) for b in breakers)
+
+    def open_services(self):
+        return sorted(name for name, s in self.states().items() if s['state'] != CLOSED)
+
+    def reset(self, service=None):
+        """
+        Close the breaker for the passed in service, or all breakers if no
+        service is given.
+        """
+        if service is not None:
+            self.get(service).reset()
+            return
+
+        with self._lock:
+            self._breakers = {}
+
+
+circuit_breakers = CircuitBreakerRegistry()
+
+def get_circuit_breaker_states():
+    return circuit_breakers.states()
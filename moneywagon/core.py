@@ -1,17 +1,42 @@
 from __future__ import print_function
 import random
+import datetime
 import json
+import copy
 from subprocess import check_output, CalledProcessError, STDOUT
 import requests
 import time
-import datetime
-import os
-import pkg_resources
+import types
+import threading
 
 from bitcoin import serialize
 from concurrent import futures
 
-__version__ = pkg_resources.get_distribution('moneywagon').version
+from .session_pool import default_session_pool
+from .cache import ResponseCache, get_chain_data_store
+from .service_stats import service_stats
+from .circuit_breaker import circuit_breakers
+from .rate_limit import rate_limiters
+from .single_flight import single_flight, freeze
+from .executor import default_executor
+from .instrumentation import instrumentation, url_template
+from .credentials import credentials
+from .instance_pool import service_instances
+from .deadline import as_deadline
+
+try:
+    from importlib.metadata import version as _distribution_version
+except ImportError:
+    # python < 3.8, pkg_resources is much slower to import.
+    import pkg_resources
+    _distribution_version = lambda name: pkg_resources.get_distribution(name).version
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+__version__ = _distribution_version('moneywagon')
 useragent = "Moneywagon %s" % __version__
 
 class ServiceDisagreement(Exception):
@@ -26,6 +51,12 @@ class SkipThisService(NoService):
 class ServiceError(NoService):
     pass
 
+class RateLimited(SkipThisService):
+    pass
+
+class DeadlineExceeded(NoService):
+    pass
+
 class CurrencyNotSupported(Exception):
     pass
 
@@ -38,6 +69,52 @@ class NoData(Exception):
 class RevertToPrivateMode(NotImplementedError):
     pass
 
+def describe_exception(exc):
+    if exc is None:
+        return None
+    return "%s: %s" % (exc.__class__.__name__, exc)
+
+class CallState(object):
+    """
+    A `Service` attribute that holds state of the call in progress, such as
+    the last url fetched. Its value is kept per thread, so one service
+    instance can be used by many threads at once.
+    """
+    def __init__(self, name):
+        self.name = name
+
+    @staticmethod
+    def _local(obj):
+        local = obj.__dict__.get('_call_state')
+        if local is None:
+            local = obj.__dict__.setdefault('_call_state', threading.local())
+        return local
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        return getattr(self._local(obj), self.name, None)
+
+    def __set__(self, obj, value):
+        setattr(self._local(obj), self.name, value)
+
+class ServiceCall(object):
+    """
+    The service that returned a result, along with the url and raw response
+    of its last request for that result. This is what `report_services`
+    returns. Other attributes are looked up on the service itself.
+    """
+    def __init__(self, service):
+        self.service = service
+        self.last_url = service.last_url
+        self.last_raw_response = service.last_raw_response
+
+    def __getattr__(self, name):
+        return getattr(self.service, name)
+
+    def __repr__(self):
+        return repr(self.service)
+
 class ClassProperty(property):
     """
     From http://stackoverflow.com/a/1383402/118495
@@ -55,6 +132,12 @@ class Service(object):
     api_homepage = '' # link to page defining the API.
     protocol = 'https'
     supported_cryptos = None # must be a list of lower case currency codes.
+    rate_limit = None # max requests per second this service allows, None means no limit.
+    rate_limit_burst = 1 # how many requests can be made at once before `rate_limit` kicks in.
+    rate_limit_wait = 1.0 # most seconds to wait on the rate limit before skipping to the next service.
+    max_concurrency = None # most calls made to this service at once, None means the shared executor's default.
+    max_addresses_per_call = None # most addresses the `*_multi` methods accept in one call, None means no known limit.
+    max_txids_per_call = None # same, for `get_single_transaction_multi`.
     explorer_address_url = None # url to block explerer page. Use {address} and {crypto} as placeholders.
     explorer_tx_url = None # {txid}
     explorer_blocknum_url = None # {blocknum}
@@ -64,6 +147,15 @@ class Service(object):
     exchange_fee_rate = None
     api_key = False
     symbol_mapping = None
+    session_pool = None # SessionPool instance, None means use the shared default pool.
+
+    # state of the call in progress, kept per thread.
+    current_method = CallState('current_method') # name of the `get_*` method being called, for cache ttl
+    current_crypto = CallState('current_crypto') # currency of that call, for instrumentation
+    current_deadline = CallState('current_deadline') # `Deadline` of that call, caps request timeouts
+    call_responses = CallState('call_responses') # `ResponseCache` of the fetcher making that call, checked first
+    last_url = CallState('last_url')
+    last_raw_response = CallState('last_raw_response')
 
     @ClassProperty
     @classmethod
@@ -71,30 +163,23 @@ class Service(object):
         return cls.__name__
 
     def __init__(self, verbose=False, responses=None, timeout=None, random_wait_seconds=0, api_key=None, api_secret=None):
-        self.responses = responses or {} # for caching
+        # for caching, a `ResponseCache` (or plain dict) that can be shared across services.
+        self.responses = responses if responses is not None else ResponseCache()
         self.verbose = verbose
-        self.last_url = None
-        self.last_raw_response = None
         self.timeout = timeout
         self.random_wait_seconds = random_wait_seconds
         self.api_key = api_key
         self.api_secret = api_secret
         self.total_external_fetch_duration = datetime.timedelta(0)
 
-        try:
-            with open(os.path.expanduser('~/.exchange_keys')) as f:
-                config = json.loads(f.read())
-
-            for key, value in config[self.name].items():
-                if not hasattr(self, key) or not getattr(self, key):
-                    # only load if no other values have been passed in.
-                    setattr(self, key, str(value))
-        except KeyError:
-            pass # no key found
-        except Exception as exc:
-            if verbose:
-                print("config file broke", str(exc))
+        # keys from ~/.exchange_keys, which is only read once per process.
+        for key, value in credentials.get(self.name).items():
+            if not hasattr(self, key) or not getattr(self, key):
+                # only load if no other values have been passed in.
+                setattr(self, key, str(value))
 
+        if credentials.error and verbose:
+            print("config file broke", credentials.error)
 
     def __repr__(self):
         return "<Service: %s (%s in cache)>" % (self.__class__.__name__, len(self.responses))
@@ -114,10 +199,10 @@ class Service(object):
         such as SkipThisService
         """
         if response.status_code == 500:
-            raise ServiceError("500 - " + response.content)
+            raise ServiceError("500 - " + response.text)
 
         if response.status_code == 503:
-            if "DDoS protection by Cloudflare" in response.content:
+            if "DDoS protection by Cloudflare" in response.text:
                 raise ServiceError("Foiled by Cloudfare's DDoS protection")
             raise ServiceError("503 - Temporarily out of service.")
 
@@ -211,11 +296,15 @@ class Service(object):
     def _external_request(self, method, url, *args, **kwargs):
         """
         Wrapper for requests.get with useragent automatically set.
-        And also all requests are reponses are cached.
+        And also all requests are reponses are cached. Connections are made
+        through a pooled keep-alive session shared by all services.
         """
         self.last_url = url
-        if url in self.responses.keys() and method == 'get':
-            return self.responses[url] # return from cache if its there
+        if method == 'get':
+            cached = self._cached_response(url)
+            if cached is not None:
+                self._emit_request(method, url, 0, cached, 'hit')
+                return cached # return from cache if its there
 
         headers = kwargs.pop('headers', None)
         custom = {'User-Agent': useragent}
@@ -228,23 +317,108 @@ class Service(object):
         if self.timeout:
             # add timeout parameter to requests.get if one was passed in on construction...
             kwargs['timeout'] = self.timeout
+        elif default_executor.in_worker():
+            # a request that never returns would hold its pool thread forever.
+            kwargs['timeout'] = default_executor.request_timeout
+        key_kwargs = dict(kwargs)
+
+        deadline = self.current_deadline
+        capped = False
+        if deadline is not None:
+            if deadline.expired:
+                raise DeadlineExceeded("Deadline of %ss passed before calling %s" % (deadline.seconds, url))
+            # only what is left of the call's budget.
+            timeout = kwargs.get('timeout')
+            kwargs['timeout'] = deadline.cap(timeout)
+            capped = kwargs['timeout'] != timeout
+
+        start = time.time()
+        try:
+            if method == 'get':
+                # identical GETs made at the same time by other threads wait on
+                # this one instead of making their own request.
+                # calls with a deadline only share with calls under the same one.
+                key = ('request', url, freeze(args), freeze(key_kwargs), deadline)
+                response, shared = single_flight.do(
+                    key, lambda: self._make_request(method, url, *args, **kwargs)
+                )
+                if shared and self.verbose:
+                    print("Shared in-flight response: %s" % url)
+            else:
+                response, shared = self._make_request(method, url, *args, **kwargs), False
+        except Exception as exc:
+            self._emit_request(method, url, time.time() - start, None, 'miss', exc)
+            if isinstance(exc, requests.exceptions.Timeout) and capped:
+                # not the service's fault, it was given less than its full timeout.
+                raise DeadlineExceeded("Deadline of %ss passed while calling %s" % (deadline.seconds, url))
+            raise
 
-        start = datetime.datetime.now()
-        response = getattr(requests, method)(url, verify=self.ssl_verify, *args, **kwargs)
-        self.total_external_fetch_duration += datetime.datetime.now() - start
-
-        if self.verbose:
-            print("Got Response: %s (took %s)" % (url, (datetime.datetime.now() - start)))
+        self._emit_request(method, url, time.time() - start, response, 'shared' if shared else 'miss')
 
         self.last_raw_response = response
-
         self.check_error(response)
 
         if method == 'get':
-            self.responses[url] = response # cache for later
+            self._cache_response(url, response) # cache for later
 
         return response
 
+    def _make_request(self, method, url, *args, **kwargs):
+        """
+        Make the actual HTTP request, after waiting on this service's rate limit.
+        """
+        wait = rate_limiters.reserve(self)
+        if wait is None:
+            raise RateLimited("%s rate limit reached" % self.name)
+        deadline = self.current_deadline
+        if deadline is not None and wait > deadline.remaining():
+            raise DeadlineExceeded("%s rate limit wait is longer than the deadline allows" % self.name)
+        if wait > 0:
+            if self.verbose:
+                print("Rate limit: waiting %.2f seconds for %s" % (wait, self.name))
+            time.sleep(wait)
+
+        start = time.time()
+        pool = self.session_pool or default_session_pool
+        response = pool.request(method, url, verify=self.ssl_verify, *args, **kwargs)
+
+        if self.verbose:
+            print("Got Response: %s (took %.3fs)" % (url, time.time() - start))
+
+        if response.status_code == 429 or 'Retry-After' in response.headers:
+            rate_limiters.penalize(self, response.headers.get('Retry-After'))
+
+        return response
+
+    def _emit_request(self, method, url, latency, response, cache, exc=None):
+        if cache != 'hit':
+            self.total_external_fetch_duration += datetime.timedelta(seconds=latency)
+        instrumentation.emit(
+            'request', service=self.name, method=self.current_method,
+            crypto=self.current_crypto, url=url, url_template=url_template(url),
+            http_method=method, latency=latency, cache=cache,
+            status=response.status_code if response is not None else None,
+            bytes=len(response.content or b'') if response is not None else None,
+            exception=describe_exception(exc)
+        )
+
+    def _cached_response(self, url):
+        call_responses = self.call_responses
+        if call_responses is not None:
+            cached = call_responses.get(url)
+            if cached is not None:
+                return cached
+        return self.responses.get(url)
+
+    def _cache_response(self, url, response):
+        responses = self.call_responses
+        if responses is None:
+            responses = self.responses
+        if isinstance(responses, ResponseCache):
+            responses.set(url, response, method_name=self.current_method)
+        else:
+            responses[url] = response
+
     def get_current_price(self, crypto, fiat):
         """
         Makes call to external service, and returns the price for given
@@ -285,6 +459,19 @@ class Service(object):
             "Or rather it has no defined 'get_transactions_multi' method."
         )
 
+    def get_transactions_page(self, crypto, address, cursor=None):
+        """
+        One page of the transactions returned by `get_transactions`, most
+        recent first. `cursor` is None for the first page, otherwise the
+        cursor returned along with the page before. Returned is a two item
+        tuple: the list of transactions, and the cursor of the next page (None
+        when this is the last page).
+        """
+        raise NotImplementedError(
+            self.name + " does not support paging through historical transactions. "
+            "Or rather it has no defined 'get_transactions_page' method."
+        )
+
     def get_single_transaction(self, crypto, txid):
         """
         Get detailed information about a single transaction.
@@ -504,26 +691,53 @@ class AutoFallbackFetcher(object):
     Calls a succession of services until one returns a value.
     """
 
-    def __init__(self, services=None, verbose=False, responses=None, timeout=None, random_wait_seconds=0):
+    default_hedge_delay = 1.0 # seconds, used by hedge='p95' until enough latencies are recorded
+
+    def __init__(self, services=None, verbose=False, responses=None, timeout=None, random_wait_seconds=0, chain_store=None, hedge=None, adaptive=False, deadline=None):
         """
-        Each service class is instantiated here so the service instances stay
-        in scope for the entire life of this object. This way the service
-        objects can cache responses.
+        Service instances come from `service_instances`, which keeps them
+        alive across fetcher calls so they can keep immutable responses
+        (confirmed transactions, blocks by hash) cached. Other responses are
+        cached by this fetcher, for as long as it is used. When a `responses`
+        cache is passed in, new instances using it are made instead. `chain_store` is a `ChainDataStore` that
+        is checked before any service is called, it defaults to the store
+        enabled with `use_chain_data_store`.
+
+        `hedge` is either a number of seconds, or the string 'p95'. When set,
+        if a service has not responded within that many seconds (or within
+        its observed 95th percentile latency), the next service is called in
+        parallel and the first to respond is used.
+
+        `adaptive` when True, services are tried in order of expected time to
+        a successful result (from `service_stats`) instead of the order given.
+
+        `deadline` is the total number of seconds (or a `Deadline`) all
+        services together may take. Each request is given only what is left
+        of it as its timeout, and `DeadlineExceeded` is raised once it has
+        passed.
         """
         if not services:
             from moneywagon import ALL_SERVICES
             services = ALL_SERVICES
 
-        self.services = []
-        for ServiceClass in services:
-            self.services.append(
-                ServiceClass(verbose=verbose, responses=responses, timeout=timeout)
-            )
+        self.services = [
+            service_instances.get(ServiceClass, verbose=verbose, responses=responses, timeout=timeout)
+            for ServiceClass in services
+        ]
 
         self.verbose = verbose
+        self.timeout = timeout
+        self.responses = responses
+        # pooled instances are shared by every fetcher, responses this fetcher
+        # gets from them are cached here instead.
+        self._call_responses = ResponseCache() if responses is None else None
         self._successful_service = None # gets filled in after success
         self._failed_services = []
         self.random_wait_seconds = random_wait_seconds
+        self.chain_store = chain_store if chain_store is not None else get_chain_data_store()
+        self.hedge = hedge
+        self.adaptive = adaptive
+        self.deadline = as_deadline(deadline)
 
     def _try_services(self, method_name, *args, **kwargs):
         """
@@ -533,48 +747,134 @@ class AutoFallbackFetcher(object):
         fixed quickly.
         """
         crypto = ((args and args[0]) or kwargs['crypto']).lower()
-        address = kwargs.get('address', '').lower()
-        fiat = kwargs.get('fiat', '').lower()
 
         if not self.services:
             raise CurrencyNotSupported("No services defined for %s for %s" % (method_name, crypto))
 
+        # identical actions running at the same time in other threads wait on
+        # this one, and get their own copy of its result. Callers with their
+        # own timeout or responses cache only share with the same ones.
+        key = (
+            'action', self.__class__.__name__, method_name, freeze(args), freeze(kwargs),
+            tuple(s.name for s in self.services), self.hedge, self.adaptive, self.deadline,
+            self.timeout, id(self.responses) if self.responses is not None else None
+        )
+        (service, ret), shared = single_flight.do(
+            key, lambda: self._walk_services(method_name, crypto, args, kwargs)
+        )
+        if shared:
+            self._successful_service = service
+            return copy.deepcopy(ret)
+
+        return ret
+
+    def _walk_services(self, method_name, crypto, args, kwargs):
+        """
+        Returned is a two item tuple, the service that succeeded and the value
+        it returned.
+        """
+        store_key, stored = self._check_chain_store(crypto, args, kwargs)
+        if stored is not None:
+            return self._successful_service, stored
+
         if self.random_wait_seconds > 0:
             # for privacy... To avoid correlating addresses to same origin
             # only gets called before the first service call. Does not pause
             # before each and every call.
-            pause_time = random.random() * self.random_wait_seconds
-            if self.verbose:
-                print("Pausing for: %.2f seconds" % pause_time)
-            time.sleep(pause_time)
+            time.sleep(self._random_pause())
+
+        candidates = self._candidates(method_name, crypto)
 
+        if self.hedge and len(candidates) > 1:
+            found = self._try_hedged(candidates, method_name, crypto, args, kwargs)
+        else:
+            found = None
+            for service in candidates:
+                if self._deadline_passed():
+                    break
+                call, ret = self._attempt(service, method_name, crypto, args, kwargs)
+                if call:
+                    found = call, ret
+                    break
+
+        ret = self._finish(found, method_name, crypto, store_key, args, kwargs)
+        return self._successful_service, ret
+
+    def _check_chain_store(self, crypto, args, kwargs):
+        """
+        Returns a two item tuple: the key this call is stored under in the
+        chain data store (or None), and the stored result if there is one.
+        """
+        store_key = None
+        if self.chain_store is not None:
+            store_key = self.chain_store_key(*args, **kwargs)
+        if store_key:
+            stored = self.chain_store.get(crypto, store_key)
+            if stored is not None:
+                if self.verbose: print("* Found in chain data store:", store_key)
+                self._successful_service = self.chain_store
+                return store_key, stored
+        return store_key, None
+
+    def _deadline_passed(self):
+        return self.deadline is not None and self.deadline.expired
+
+    def _random_pause(self):
+        pause_time = random.random() * self.random_wait_seconds
+        if self.deadline is not None:
+            pause_time = self.deadline.cap(pause_time)
+        if self.verbose:
+            print("Pausing for: %.2f seconds" % pause_time)
+        return pause_time
+
+    def _candidates(self, method_name, crypto):
+        """
+        Returns the services that support `crypto` and implement
+        `method_name`, in the order they should be tried.
+        """
+        from .capabilities import implements
+        candidates = []
         for service in self.services:
+            if not implements(service.__class__, method_name):
+                if self.verbose:
+                    print("SKIP:", "%s does not implement %s" % (service.__class__.__name__, method_name))
+                self._failed_services.append({'service': service, 'error': "Not Implemented"})
+                continue
             if service.supported_cryptos and (crypto not in service.supported_cryptos):
                 if self.verbose:
                     print("SKIP:", "%s not supported for %s" % (crypto, service.__class__.__name__))
                 continue
-            try:
-                if self.verbose: print("* Trying:", service, crypto, "%s%s" % (address, fiat))
-                ret =  getattr(service, method_name)(*args, **kwargs)
-                self._successful_service = service
-                return ret
-            except (KeyError, IndexError, TypeError, ValueError,
-                    requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
-                # API has probably changed, therefore service class broken
-                if self.verbose: print("FAIL:", service, exc.__class__.__name__, exc)
-                self._failed_services.append({
-                    'service': service,
-                    'error': "%s %s" % (exc.__class__.__name__, exc)
-                })
-            except NoService as exc:
-                # service classes can raise this exception if for whatever reason
-                # that service can't return a response, but maybe another one can.
-                if self.verbose: print("SKIP:", exc.__class__.__name__, exc)
-                self._failed_services.append({'service': service, 'error': "Skipped: %s" % str(exc)})
-            except NotImplementedError as exc:
-                if self.verbose: print("SKIP:", exc.__class__.__name__, exc)
-                self._failed_services.append({'service': service, 'error': "Not Implemented"})
+            candidates.append(service)
+
+        if self.adaptive:
+            candidates = service_stats.order_services(candidates, method_name, crypto)
+            if self.verbose:
+                print("Adaptive order:", ", ".join(s.name for s in candidates))
+
+        return candidates
 
+    def _finish(self, found, method_name, crypto, store_key, args, kwargs):
+        """
+        `found` is a two item tuple of the `ServiceCall` that succeeded and its
+        result, or None if no service succeeded. Returns the result, or raises
+        the appropriate exception.
+        """
+        if found:
+            service, ret = found
+            self._successful_service = service
+            if self.cache_forever(ret, *args, **kwargs):
+                self._make_permanent(service)
+                if store_key:
+                    self.chain_store.set(crypto, store_key, ret)
+            return ret
+
+        if self._deadline_passed():
+            failed_msg = ', '.join(
+                ["{service.name} -> {error}".format(**x) for x in self._failed_services]
+            )
+            raise DeadlineExceeded("%s! Deadline of %ss passed. Tried: %s" % (
+                self.no_service_msg(*args, **kwargs), self.deadline.seconds, failed_msg or 'nothing'
+            ))
 
         if not self._failed_services:
             raise NotImplementedError(
@@ -591,6 +891,189 @@ class AutoFallbackFetcher(object):
         )
         raise NoService(self.no_service_msg(*args, **kwargs) + "! Tried: " + failed_msg)
 
+    def _attempt(self, service, method_name, crypto, args, kwargs, started=None, slot=True):
+        """
+        Make one call to `service`. Returned is a two item tuple, the first item
+        is a `ServiceCall` if the call succeeded (None if it failed), the second
+        is the value returned by the service. Failures are recorded in `self._failed_services`. Services
+        whose circuit breaker is open are skipped without being called.
+        `started` is when the call began, if earlier than now. `slot` is False
+        when the caller limits calls per service itself (`moneywagon.aio`).
+        """
+        address = kwargs.get('address', '').lower()
+        fiat = kwargs.get('fiat', '').lower()
+
+        breaker = circuit_breakers.get(service) if circuit_breakers.enabled else None
+        if breaker and not breaker.allow_request():
+            if self.verbose: print("SKIP:", service, "circuit breaker open")
+            self._failed_services.append({'service': service, 'error': "Skipped: circuit breaker open"})
+            instrumentation.emit(
+                'attempt', service=service.name, method=method_name, crypto=crypto,
+                latency=0, success=False, skipped=True, exception=None
+            )
+            return False, None
+
+        # True if the service looks down or broken, False if it returned a parsed
+        # response, None if the call says nothing either way (rate limited, skipped).
+        outage = None
+        error = None
+        start = started or time.time()
+        try:
+            if self.verbose: print("* Trying:", service, crypto, "%s%s" % (address, fiat))
+            service.current_method = method_name
+            service.current_crypto = crypto
+            service.current_deadline = self.deadline
+            service.call_responses = self._call_responses
+            service.last_url = service.last_raw_response = None
+            if slot:
+                with default_executor.service_slot(service):
+                    ret = getattr(service, method_name)(*args, **kwargs)
+            else:
+                ret = getattr(service, method_name)(*args, **kwargs)
+        except DeadlineExceeded as exc:
+            # ran out of time, which says nothing about the service's health.
+            error = exc
+            if self.verbose: print("DEADLINE:", service, exc)
+            self._failed_services.append({'service': service, 'error': "Deadline: %s" % exc})
+        except (KeyError, IndexError, TypeError, ValueError,
+                requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
+            # API has probably changed, therefore service class broken
+            error = exc
+            outage = True
+            if self.verbose: print("FAIL:", service, exc.__class__.__name__, exc)
+            service_stats.record(
+                service, method_name, crypto, time.time() - start, False, error=exc.__class__.__name__
+            )
+            self._failed_services.append({
+                'service': service,
+                'error': "%s %s" % (exc.__class__.__name__, exc)
+            })
+        except NoService as exc:
+            # service classes can raise this exception if for whatever reason
+            # that service can't return a response, but maybe another one can.
+            error = exc
+            if isinstance(exc, ServiceError):
+                outage = True
+            if self.verbose: print("SKIP:", exc.__class__.__name__, exc)
+            service_stats.record(
+                service, method_name, crypto, time.time() - start, False, error=exc.__class__.__name__
+            )
+            self._failed_services.append({'service': service, 'error': "Skipped: %s" % str(exc)})
+        except NotImplementedError as exc:
+            error = exc
+            if self.verbose: print("SKIP:", exc.__class__.__name__, exc)
+            self._failed_services.append({'service': service, 'error': "Not Implemented"})
+        else:
+            outage = False
+            service_stats.record(service, method_name, crypto, time.time() - start, True)
+            return ServiceCall(service), ret
+        finally:
+            service.current_deadline = None
+            service.call_responses = None
+            if outage is not None or error is not None:
+                instrumentation.emit(
+                    'attempt', service=service.name, method=method_name, crypto=crypto,
+                    latency=time.time() - start, success=outage is False, skipped=False,
+                    exception=describe_exception(error)
+                )
+            if breaker and outage:
+                breaker.record_failure()
+            elif breaker and outage is False:
+                breaker.record_success()
+            elif breaker:
+                breaker.release()
+
+        return False, None
+
+    def _hedge_delay(self, service, method_name, crypto):
+        """
+        How many seconds to wait on `service` before the next service is
+        started in parallel.
+        """
+        if self.hedge == 'p95':
+            observed = service_stats.percentile(service, method_name, crypto, 95)
+            return observed if observed is not None else self.default_hedge_delay
+        return self.hedge
+
+    def _try_hedged(self, candidates, method_name, crypto, args, kwargs):
+        """
+        Like the normal sequential fallback, except when the current service
+        has not responded within the hedge delay, the next service is started
+        in parallel, and whichever returns first is used. A failed service
+        starts the next one right away. Returned is a two item tuple of the
+        service and its result, or None if all services failed.
+        """
+        remaining = list(candidates)
+        pending = {}
+
+        def start_next(hedged):
+            service = remaining.pop(0)
+            if hedged:
+                if self.verbose: print("HEDGE:", service)
+                service_stats.record_hedge(service, method_name, crypto)
+            future = default_executor.submit(self._attempt, service, method_name, crypto, args, kwargs)
+            pending[future] = service
+            return service
+
+        try:
+            current = start_next(hedged=False)
+            while pending:
+                delay = self._hedge_delay(current, method_name, crypto) if remaining else None
+                if self.deadline is not None:
+                    delay = self.deadline.cap(delay)
+                done, not_done = futures.wait(
+                    list(pending), timeout=delay, return_when=futures.FIRST_COMPLETED
+                )
+                if not done:
+                    if self._deadline_passed():
+                        return None
+                    current = start_next(hedged=True)
+                    continue
+
+                for future in done:
+                    pending.pop(future)
+                    call, ret = future.result()
+                    if call:
+                        return call, ret
+
+                if remaining and not self._deadline_passed():
+                    current = start_next(hedged=False)
+
+            return None
+        finally:
+            for future in pending:
+                default_executor.abandon(future)
+
+    def cache_forever(self, result, *args, **kwargs):
+        """
+        Return True if the passed in result is immutable chain data (such as a
+        confirmed transaction) so the response it was made from never needs to
+        be fetched again. Subclasses should override.
+        """
+        return False
+
+    def chain_store_key(self, *args, **kwargs):
+        """
+        Return the key the result of this call is saved under in the chain data
+        store, or None if this kind of call is never stored. Subclasses that
+        fetch immutable data should override.
+        """
+        return None
+
+    def _make_permanent(self, service):
+        if not isinstance(service.responses, ResponseCache) or not service.last_url:
+            return
+        if service.last_url in service.responses:
+            service.responses.make_permanent(service.last_url)
+            return
+
+        # cached by this fetcher only, keep it on the service for later calls.
+        response = service.last_raw_response
+        if response is None and self._call_responses is not None:
+            response = self._call_responses.get(service.last_url)
+        if response is not None:
+            service.responses.set(service.last_url, response, ttl=None)
+
     def no_service_msg(self, *args, **kwargs):
         """
         This function is called when all Services have been tried and no value
@@ -616,7 +1099,23 @@ def enforce_service_mode(services, FetcherClass, kwargs, modes):
          verbose = [True|False] False by default. Extra output.
          random = [True|False] False by default. Randomizes service order.
          paranoid = positive int. 1 by default. Redundant Fetching.
+         quorum = positive int, used with paranoid. Return as soon as this many
+           of the `paranoid` services agree. Defaults to all of them.
          fast = positive int. 0 by default. Return as soon as recieved first n results.
+           Numeric results are averaged, otherwise the first result is returned.
+         responses = `ResponseCache` instance (or dict) shared by all services
+           used in this call. Pass the same object to many calls to share cached responses.
+         hedge = number of seconds, or 'p95'. Call the next service in parallel
+           if the current one has not responded in time. None by default.
+         adaptive = [True|False] False by default. Order services by observed
+           latency and success rate. Ignored when `random` is used.
+         aggregate = 'median', 'trimmed' or 'mad'. Call every service at once
+           and combine the numeric results that arrive within `aggregate_timeout`
+           seconds (5 by default). `trim` is the fraction cut from each end by
+           'trimmed', `outlier_threshold` the number of MADs from the median
+           past which 'mad' drops a value. See `moneywagon.aggregate`.
+         deadline = number of seconds (or a `Deadline`). Total time the whole
+           call may take, across every service tried. See `moneywagon.deadline`.
 
     """
     fast_level = modes.get('fast', 0)
@@ -624,7 +1123,18 @@ def enforce_service_mode(services, FetcherClass, kwargs, modes):
     paranoid_level = modes.get('paranoid', 0)
     private_level = modes.get('private', 0)
     verbose = modes.get('verbose', False)
-    timeout = modes.get('timeout', None)
+
+    # arguments passed on to each FetcherClass instance
+    fetcher_kwargs = dict(
+        verbose=verbose,
+        timeout=modes.get('timeout', None),
+        responses=modes.get('responses', None),
+        hedge=modes.get('hedge', None),
+        # random order is kept for privacy, so it takes precedence over adaptive ordering.
+        adaptive=modes.get('adaptive', False) and not modes.get('random', False),
+        # started here unless the caller already started it, so every fetch shares one budget.
+        deadline=as_deadline(modes.get('deadline', None)),
+    )
 
     if len(services) == 0:
         raise NoService("No services defined")
@@ -634,14 +1144,19 @@ def enforce_service_mode(services, FetcherClass, kwargs, modes):
 
     if private_level  > 0:
         results = _do_private_mode(
-            FetcherClass, services, kwargs, random_wait_seconds=private_level,
-            verbose=verbose, timeout=timeout
+            FetcherClass, services, kwargs, random_wait_seconds=private_level, **fetcher_kwargs
         )
         return results
 
+    elif modes.get('aggregate'):
+        from .aggregate import get_aggregate_results
+        used_services, consensus_results = get_aggregate_results(
+            FetcherClass, services, kwargs, modes['aggregate'], modes, **fetcher_kwargs
+        )
+
     elif average_level <= 1 and paranoid_level <= 1 and fast_level == 0:
         # only need to make 1 external call, no need for threading...
-        fetcher = FetcherClass(services=services, verbose=verbose, timeout=timeout)
+        fetcher = FetcherClass(services=services, **fetcher_kwargs)
         consensus_results = fetcher.action(**kwargs)
         used_services = [fetcher._successful_service]
 
@@ -649,36 +1164,29 @@ def enforce_service_mode(services, FetcherClass, kwargs, modes):
         # instead of checking that all results are the same, we just return the average of all results.
         # mostly useful for non-blockchain operations like price and optimal fee.
         results = _get_results(
-            FetcherClass, services, kwargs, num_results=average_level, verbose=verbose, timeout=timeout
+            FetcherClass, services, kwargs, num_results=average_level, **fetcher_kwargs
         )
 
         to_compare, used_services = _prepare_consensus(FetcherClass, results)
         consensus_results = sum(to_compare) / len(to_compare)
 
     elif paranoid_level > 1:
-        results = _get_results(
-            FetcherClass, services, kwargs, num_results=paranoid_level, verbose=verbose, timeout=timeout
+        results = _get_quorum_results(
+            FetcherClass, services, kwargs, num_results=paranoid_level,
+            quorum=min(modes.get('quorum') or paranoid_level, paranoid_level), **fetcher_kwargs
         )
-        to_compare, used_services = _prepare_consensus(FetcherClass, results)
-
-        if len(set(to_compare)) > 1:
-            full_results = zip(used_services, to_compare)
-            show_error = ", ".join("%s: %s" % (s.name, v) for s, v in full_results)
-            sd = ServiceDisagreement("No service consensus: %s" % show_error)
-            sd.network_results = {
-                service: result for service, result in full_results
-            }
-            raise sd
-
-        # if all values match, return any one (in this case the first one).
+        # return any one of the matching values (in this case the first one).
         # also return the list of all services that confirm this result.
+        used_services = [fetcher._successful_service for fetcher, value in results]
         consensus_results = results[0][1]
 
     elif fast_level >= 1:
-        raise Exception("Fast mode not yet working")
+        # all services are called at once, the first `fast_level` results to
+        # come back are used, the rest are abandoned.
         results = _get_results(
-            FetcherClass, services, kwargs, fast=fast_level, verbose=verbose
+            FetcherClass, services, kwargs, fast=fast_level, **fetcher_kwargs
         )
+        used_services, consensus_results = _fast_result(results)
 
     else:
         raise Exception("No mode specified.")
@@ -706,45 +1214,199 @@ def _prepare_consensus(FetcherClass, results):
 
     return to_compare, [fetcher._successful_service for fetcher, values in results]
 
-def _get_results(FetcherClass, services, kwargs, num_results=None, fast=0, verbose=False, timeout=None):
+def _fast_result(results):
+    """
+    Used by fast mode, where the results do not have to agree. Numeric results
+    (prices, fees) are averaged, anything else is taken from the first service
+    that responded. Returned is the list of services used and the value.
+    """
+    values = [value for fetcher, value in results]
+    used_services = [fetcher._successful_service for fetcher, value in results]
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return used_services, sum(values) / float(len(values))
+    return used_services, values[0]
+
+def _check_consensus(FetcherClass, results):
+    """
+    Raise ServiceDisagreement if the passed in results do not all match.
+    Returned is the list of services that made these results.
+    """
+    to_compare, used_services = _prepare_consensus(FetcherClass, results)
+
+    if len(set(to_compare)) > 1:
+        full_results = list(zip(used_services, to_compare))
+        show_error = ", ".join("%s: %s" % (s.name, v) for s, v in full_results)
+        sd = ServiceDisagreement("No service consensus: %s" % show_error)
+        sd.network_results = {
+            service: result for service, result in full_results
+        }
+        raise sd
+
+    return used_services
+
+def _as_completed(fetches, deadline):
+    """
+    Like `futures.as_completed`, raising `DeadlineExceeded` if `deadline`
+    passes before all of `fetches` are done.
+    """
+    try:
+        for future in futures.as_completed(fetches, timeout=deadline.remaining() if deadline else None):
+            yield future
+    except futures.TimeoutError:
+        raise DeadlineExceeded("Deadline of %ss passed waiting on %s calls" % (
+            deadline.seconds, len([f for f in fetches if not f.done()])
+        ))
+
+def _get_results(FetcherClass, services, kwargs, num_results=None, fast=0, **fetcher_kwargs):
     """
     Does the fetching in multiple threads of needed. Used by paranoid and fast mode.
+    In fast mode, every service is called at once (without falling back to
+    the others), and as soon as `fast` results have come back, the rest of
+    the calls are cancelled or abandoned without waiting for them to finish.
     """
     results = []
+    fetches = _submit_fetches(FetcherClass, services, kwargs, num_results, fast, fetcher_kwargs)
+
+    try:
+        if not fast:
+            for future in _as_completed(fetches, fetcher_kwargs.get('deadline')):
+                service = fetches[future]
+                results.append([service, future.result()])
+            return results
+
+        errors = []
+        for future in _as_completed(fetches, fetcher_kwargs.get('deadline')):
+            service = fetches[future]
+            try:
+                results.append([service, future.result()])
+            except (NoService, NotImplementedError) as exc:
+                errors.append(str(exc))
+                continue
 
+            if len(results) >= fast:
+                if fetcher_kwargs.get('verbose'):
+                    print("Fast mode: got %s results, abandoning %s calls" % (
+                        len(results), len([f for f in fetches if not f.done()])
+                    ))
+                return results
+
+        raise NoService("Fast mode needed %s results, only got %s: %s" % (
+            fast, len(results), ", ".join(errors)
+        ))
+    finally:
+        # when in fast mode, do not wait for the abandoned calls.
+        for future in fetches:
+            default_executor.abandon(future)
+
+def _submit_fetches(FetcherClass, services, kwargs, num_results, fast, fetcher_kwargs):
+    """
+    Start one fetch for each of the first `num_results` services (all of
+    them in fast mode). Returned is a dict of future -> fetcher.
+    """
     if not num_results or fast:
         num_results = len(services)
 
-    with futures.ThreadPoolExecutor(max_workers=len(services)) as executor:
-        fetches = {}
-        for service in services[:num_results]:
+    fetches = {}
+    for service in services[:num_results]:
+        if fast:
+            fallback = [service]
+        else:
             tail = [x for x in services if x is not service]
             random.shuffle(tail)
-            srv = FetcherClass(services=[service] + tail, verbose=verbose, timeout=timeout)
-            fetches[executor.submit(srv.action, **kwargs)] = srv
-
-        if fast == 1:
-            raise NotImplementedError
-            # ths code is a work in progress. futures.FIRST_COMPLETED works differently than I thought...
-            to_iterate, still_going = futures.wait(fetches, return_when=futures.FIRST_COMPLETED)
-            for x in still_going:
-                try:
-                    x.result(timeout=1.001)
-                except futures._base.TimeoutError:
-                    pass
+            fallback = [service] + tail
+        srv = FetcherClass(services=fallback, **fetcher_kwargs)
+        fetches[default_executor.submit(srv.action, **kwargs)] = srv
+    return fetches
 
-        elif fast > 1:
-            raise Exception("fast level greater than 1 not yet implemented")
-        else:
-            to_iterate = futures.as_completed(fetches)
-
-        for future in to_iterate:
-            service = fetches[future]
-            results.append([service, future.result()])
+def _get_quorum_results(FetcherClass, services, kwargs, num_results, quorum, **fetcher_kwargs):
+    """
+    Used by paranoid mode. `num_results` services are called at once, each
+    on its own without falling back, so every agreeing result comes from a
+    different service. A service that fails is replaced by the next one not
+    yet called. As soon as `quorum` services agree on a value, the list of
+    those [fetcher, value] results is returned and the rest of the calls are
+    abandoned. `ServiceDisagreement` is raised once agreement is no longer
+    possible.
+    """
+    deadline = fetcher_kwargs.get('deadline')
+    waiting = list(services) # not called yet
+    fetches = {}
+
+    def start_next():
+        fetcher = FetcherClass(services=[waiting.pop(0)], **fetcher_kwargs)
+        future = default_executor.submit(fetcher.action, **kwargs)
+        fetches[future] = fetcher
+        return future
+
+    for i in range(min(num_results, len(services))):
+        start_next()
+    num_results = len(fetches) # may be fewer services than asked for
+    quorum = min(quorum, num_results)
+    groups = {} # value stripped for consensus -> results agreeing on it
+    errors = []
+    reverted = 0 # services that do not implement the method
+    pending = set(fetches)
 
-    return results
+    try:
+        while pending:
+            done, pending = futures.wait(
+                pending, timeout=deadline.remaining() if deadline else None,
+                return_when=futures.FIRST_COMPLETED
+            )
+            if not done:
+                raise DeadlineExceeded("Deadline of %ss passed waiting on %s calls" % (
+                    deadline.seconds, len(pending)
+                ))
 
-def _do_private_mode(FetcherClass, services, kwargs, random_wait_seconds, timeout, verbose):
+            for future in done:
+                fetcher = fetches[future]
+                try:
+                    value = future.result()
+                except (NoService, NotImplementedError) as exc:
+                    reverted += isinstance(exc, RevertToPrivateMode)
+                    errors.append(str(exc))
+                    if waiting:
+                        pending.add(start_next())
+                    continue
+
+                to_compare, used = _prepare_consensus(FetcherClass, [[fetcher, value]])
+                group = groups.setdefault(to_compare[0], [])
+                group.append([fetcher, value])
+                if len(group) >= quorum:
+                    if fetcher_kwargs.get('verbose'):
+                        print("Paranoid mode: %s of %s agree, abandoning %s calls" % (
+                            len(group), num_results, len(pending)
+                        ))
+                    return group
+
+            best = max([len(g) for g in groups.values()] or [0])
+            if best + len(pending) + len(waiting) < quorum:
+                break
+    finally:
+        for future in fetches:
+            default_executor.abandon(future)
+
+    if reverted and reverted == len(fetches):
+        # no service implements the method (the `*_multi` ones).
+        raise RevertToPrivateMode(errors[-1])
+
+    if len(groups) > 1:
+        full_results = [
+            (fetcher._successful_service, stripped)
+            for stripped, group in groups.items() for fetcher, value in group
+        ]
+        show_error = ", ".join("%s: %s" % (s.name, v) for s, v in full_results)
+        sd = ServiceDisagreement("No service consensus (%s of %s needed): %s" % (
+            quorum, num_results, show_error
+        ))
+        sd.network_results = dict(full_results)
+        raise sd
+
+    raise NoService("Paranoid mode needed %s matching results, only got %s: %s" % (
+        quorum, max([len(g) for g in groups.values()] or [0]), ", ".join(errors)
+    ))
+
+def _do_private_mode(FetcherClass, services, kwargs, random_wait_seconds, **fetcher_kwargs):
     """
     Private mode is only applicable to address_balance, unspent_outputs, and
     historical_transactions. There will always be a list for the `addresses`
@@ -753,27 +1415,23 @@ def _do_private_mode(FetcherClass, services, kwargs, random_wait_seconds, timeou
     """
     addresses = kwargs.pop('addresses')
     results = {}
+    fetcher_kwargs['timeout'] = fetcher_kwargs.get('timeout') or 5.0
 
-    with futures.ThreadPoolExecutor(max_workers=len(addresses)) as executor:
-        fetches = {}
-        for address in addresses:
-            k = kwargs
-            k['address'] = address
-            random.shuffle(services)
-            srv = FetcherClass(
-                services=services, verbose=verbose, timeout=timeout or 5.0,
-                random_wait_seconds=random_wait_seconds
-            )
-            # address is returned because balance needs to be returned
-            # attached to the address. Other methods (get_transaction, unspent_outputs, etc)
-            # do not need to be indexed by address. (upstream they are stripped out)
-            fetches[executor.submit(srv.action, **k)] = (srv, address)
-
-        to_iterate = futures.as_completed(fetches)
+    fetches = {}
+    for address in addresses:
+        k = dict(kwargs, address=address)
+        random.shuffle(services)
+        srv = FetcherClass(
+            services=services, random_wait_seconds=random_wait_seconds, **fetcher_kwargs
+        )
+        # address is returned because balance needs to be returned
+        # attached to the address. Other methods (get_transaction, unspent_outputs, etc)
+        # do not need to be indexed by address. (upstream they are stripped out)
+        fetches[default_executor.submit(srv.action, **k)] = (srv, address)
 
-        for future in to_iterate:
-            service, address = fetches[future]
-            results[address] = future.result()
+    for future in _as_completed(fetches, fetcher_kwargs.get('deadline')):
+        service, address = fetches[future]
+        results[address] = future.result()
 
     return results
 
@@ -801,24 +1459,23 @@ def currency_to_protocol(amount):
     return int(amount.replace(".", '')) # avoiding float math
 
 def get_optimal_services(crypto, type_of_service):
-    from .crypto_data import crypto_data
+    """
+    Returns a new list of the best services (from the curated list in
+    crypto_data) for this currency and type of service.
+    """
+    from .capabilities import capability_index
     try:
-        # get best services from curated list
-        services = crypto_data[crypto.lower()]['services']
-    except (KeyError, TypeError):
+        services = capability_index.services_for(crypto.lower(), type_of_service)
+    except KeyError:
         raise CurrencyNotSupported("Unknown cryptocurrency symbol: %s" % crypto)
 
-    try:
-        s = services[type_of_service]
-        if not s:
-            raise KeyError()
-        return s
-    except KeyError:
+    if not services:
         raise NoServicesDefined("No %s services defined for %s" % (type_of_service, crypto))
+    return services
 
 
 def get_magic_bytes(crypto):
-    from .crypto_data import crypto_data
+    crypto_data = get_crypto_data()
     try:
         pub_byte = crypto_data[crypto]['address_version_byte']
         priv_byte = crypto_data[crypto]['private_key_prefix']
@@ -829,6 +1486,41 @@ def get_magic_bytes(crypto):
     except KeyError:
         raise ValueError("Cryptocurrency symbol not found: %s" % crypto)
 
+def get_crypto_data():
+    """
+    Returns the `moneywagon.crypto_data.crypto_data` dict. The definitions
+    (and both service modules they reference) are imported on first use, so
+    `import moneywagon` stays fast.
+    """
+    from ._crypto_data import crypto_data
+    return crypto_data
+
+class LazyCryptoData(MutableMapping):
+    """
+    Stands in for `moneywagon.crypto_data.crypto_data`, loading it on the
+    first lookup. See `get_crypto_data`.
+    """
+    def _data(self):
+        return get_crypto_data()
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def __setitem__(self, key, value):
+        self._data()[key] = value
+
+    def __delitem__(self, key):
+        del self._data()[key]
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self):
+        return len(self._data())
+
+    def __repr__(self):
+        return "<LazyCryptoData: %s currencies>" % len(self)
+
 def make_standard_halfing_eras(start, interval, start_reward, halfing_func=None, total_eras=10):
     if not halfing_func:
         halfing_func = lambda x, y: y / float(2 ** (x))
@@ -0,0 +1,83 @@
+"""
+API keys for services, read from `~/.exchange_keys` once per process
+instead of every time a service is instantiated. The file is a JSON object
+of service name -> {attribute name: value}, for example:
+
+    {"Bitstamp": {"api_key": "...", "api_secret": "...", "customer_id": "..."}}
+
+Call `reload_credentials()` after the file is changed by another process.
+"""
+import os
+import json
+import threading
+
+DEFAULT_PATH = '~/.exchange_keys'
+
+
+class CredentialStore(object):
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.error = None # message of why the file could not be read, if it couldn't
+        self._keys = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        self.error = None
+        try:
+            with open(os.path.expanduser(self.path)) as f:
+                keys = json.loads(f.read())
+        except (IOError, OSError):
+            keys = {} # no file, no keys
+        except Exception as exc:
+            self.error = str(exc)
+            keys = {}
+
+        if not isinstance(keys, dict):
+            self.error = "%s does not contain a JSON object" % self.path
+            keys = {}
+        return keys
+
+    def _all(self):
+        keys = self._keys
+        if keys is None:
+            with self._lock:
+                if self._keys is None:
+                    self._keys = self._load()
+                keys = self._keys
+        return keys
+
+    def get(self, service_name):
+        """
+        Returns a dict of the keys stored for this service (empty if none).
+        """
+        return dict(self._all().get(service_name) or {})
+
+    def reload(self, path=None):
+        """
+        Read the file again, optionally from a different path.
+        """
+        with self._lock:
+            if path:
+                self.path = path
+            self._keys = self._load()
+
+    def install(self, service_name, key_type, value):
+        """
+        Save a key for a service to the file, and to this store. Raises
+        ValueError, leaving the file untouched, if it can't be read, as
+        writing it would lose the keys already in it.
+        """
+        with self._lock:
+            keys = self._load()
+            if self.error:
+                raise ValueError("Not saving key, %s could not be read: %s" % (self.path, self.error))
+            keys.setdefault(service_name, {})[key_type] = value
+            with open(os.path.expanduser(self.path), 'w') as f:
+                f.write(json.dumps(keys, indent=4))
+            self._keys = keys
+
+
+credentials = CredentialStore()
+
+def reload_credentials(path=None):
+    credentials.reload(path)
@@ -0,0 +1,59 @@
+"""
+A total time budget for one high level call, across every service it falls
+back to. Pass `deadline` (in seconds) along with the other modes:
+
+    get_address_balance('btc', address, deadline=3)
+
+Each service call is given only what is left of the budget as its timeout,
+and once the budget is used up `DeadlineExceeded` is raised without calling
+any more services. This is unlike `timeout`, which applies to each request
+on its own.
+"""
+import time
+
+
+class Deadline(object):
+    """
+    A point in time, `seconds` from when it is made. Passing the same
+    instance to many calls makes them share one budget.
+    """
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires = time.time() + seconds
+
+    def remaining(self):
+        return max(self.expires - time.time(), 0)
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires
+
+    def cap(self, timeout):
+        """
+        Returns `timeout` (which may be None), shortened to what is left of
+        the budget.
+        """
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self):
+        return "<Deadline: %.2fs of %ss left>" % (self.remaining(), self.seconds)
+
+
+def as_deadline(deadline):
+    """
+    `deadline` is a number of seconds, a `Deadline` or None.
+    """
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(float(deadline))
+
+
+def start_deadline(modes):
+    """
+    Returns `modes` with its `deadline` started, for high level functions
+    that make several fetches that should all share one budget.
+    """
+    if modes.get('deadline') is None:
+        return modes
+    return dict(modes, deadline=as_deadline(modes['deadline']))
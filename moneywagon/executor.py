@@ -0,0 +1,174 @@
+"""
+One process wide thread pool used for every concurrent fetch (paranoid,
+average, fast and private modes, hedging and `fetch_wallet_balances`), so
+the number of threads stays the same no matter how many addresses or
+services are involved.
+
+Code running inside the pool may submit more work to the pool (for
+instance `fetch_wallet_balances` calling `get_address_balance` in paranoid
+mode). When no thread is free, that work is run right away in the
+submitting thread instead of being queued, so the pool can never deadlock
+waiting on itself.
+
+Calls abandoned by fast, hedged, quorum and aggregate modes (and bulk
+fetches) may still be waiting on a slow service. `abandon` stops counting
+them against `max_workers`, so a hung service can not hold up every other
+fetch in the process.
+"""
+import threading
+from contextlib import contextmanager
+from concurrent import futures
+
+
+class SharedExecutor(object):
+    """
+    `max_workers` is how many threads are in the pool.
+    `max_per_service` is the most number of calls made to any one service at
+      once. Services can set their own with the `max_concurrency` attribute.
+    `max_abandoned` is how many abandoned calls may keep running on top of
+      `max_workers`, `max_workers` by default. Past that, abandoned calls
+      keep their slot until they finish.
+    `request_timeout` is the timeout of requests made in the pool by
+      services that have no timeout of their own, so no call runs forever.
+    """
+    def __init__(self, max_workers=32, max_per_service=8, max_abandoned=None, request_timeout=30):
+        self.max_workers = max_workers
+        self.request_timeout = request_timeout
+        self.max_per_service = max_per_service
+        self.max_abandoned = max_abandoned
+        self._executor = None
+        self._slots = None
+        self._abandoned = None
+        self._service_slots = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self):
+        abandoned = self.max_workers if self.max_abandoned is None else self.max_abandoned
+        # enough threads that abandoned calls never make new work queue up.
+        self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers + abandoned)
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._abandoned = threading.BoundedSemaphore(abandoned) if abandoned else None
+
+    def configure(self, max_workers=None, max_per_service=None, max_abandoned=None, request_timeout=None):
+        """
+        Change the pool size and/or the per-service cap. Calls already running
+        are left to finish in the old pool.
+        """
+        with self._lock:
+            if request_timeout is not None:
+                self.request_timeout = request_timeout
+            if max_per_service is not None:
+                self.max_per_service = max_per_service
+                self._service_slots = {}
+            resize = max_workers is not None and max_workers != self.max_workers
+            if max_abandoned is not None and max_abandoned != self.max_abandoned:
+                self.max_abandoned, resize = max_abandoned, True
+            if resize:
+                self.max_workers = max_workers or self.max_workers
+                old = self._executor
+                self._start()
+                old.shutdown(wait=False)
+
+    def in_worker(self):
+        return getattr(self._local, 'in_worker', False)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Like `ThreadPoolExecutor.submit`. Work is never queued: from outside the
+        pool this blocks until a thread is free, from inside the pool the work
+        is run in the calling thread if no thread is free.
+        """
+        executor, slots, abandoned = self._executor, self._slots, self._abandoned
+        if self.in_worker():
+            if not slots.acquire(False):
+                return self._run_inline(fn, args, kwargs)
+        else:
+            slots.acquire()
+
+        lock = threading.Lock()
+        held = [slots] # semaphore this call is counted against, None once given back
+
+        def give_back():
+            with lock:
+                semaphore, held[0] = held[0], None
+            if semaphore is not None:
+                semaphore.release()
+
+        def move_to_abandoned():
+            with lock:
+                if held[0] is not slots or abandoned is None or not abandoned.acquire(False):
+                    return
+                held[0] = abandoned
+            slots.release()
+
+        def run():
+            self._local.in_worker = True
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.in_worker = False
+                give_back()
+
+        try:
+            future = executor.submit(run)
+        except RuntimeError:
+            # pool was shut down by `configure` after it was picked up above.
+            slots.release()
+            return self.submit(fn, *args, **kwargs)
+
+        # a future cancelled before a thread picked it up never calls `run`.
+        future.add_done_callback(lambda f: f.cancelled() and give_back())
+        future._abandon = move_to_abandoned
+        return future
+
+    def abandon(self, future):
+        """
+        For when the result of `future` is no longer wanted. It is cancelled
+        if it has not started, otherwise it stops counting against
+        `max_workers` while it finishes.
+        """
+        if future.cancel() or future.done():
+            return
+        abandon = getattr(future, '_abandon', None)
+        if abandon:
+            abandon()
+
+    def _run_inline(self, fn, args, kwargs):
+        future = futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    @contextmanager
+    def service_slot(self, service):
+        """
+        Wait until fewer than the allowed number of calls are being made to
+        `service`, then hold a place for the duration of the `with` block.
+        """
+        name = service.name
+        semaphore = self._service_slots.get(name)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._service_slots.get(name)
+                if semaphore is None:
+                    limit = getattr(service, 'max_concurrency', None) or self.max_per_service
+                    semaphore = self._service_slots[name] = threading.BoundedSemaphore(limit)
+
+        with semaphore:
+            yield
+
+    def thread_count(self):
+        return len(self._executor._threads)
+
+
+default_executor = SharedExecutor()
+
+def configure_executor(**kwargs):
+    """
+    Change the size of the shared thread pool. See `SharedExecutor`.
+    """
+    default_executor.configure(**kwargs)
@@ -6,7 +6,6 @@ import arrow
 import pytz
 
 from .core import Service, NoData
-from .crypto_data import crypto_data
 
 quandl_exchange_btc_to_fiat = {
     'ARS': 'localbtc',
@@ -59,6 +58,7 @@ class Quandl(Service):
 
         at_time = arrow.get(at_time).datetime
 
+        from .crypto_data import crypto_data
         data = crypto_data[crypto]
         name, date_created = data['name'], data['genesis_date']
 
@@ -0,0 +1,228 @@
+"""
+Address transaction history fetched a page at a time, for addresses with
+too many transactions to download in one go.
+
+    it = iter_transactions('btc', address)
+    for tx in it:
+        process(tx)
+        if tired:
+            save(it.cursor) # JSON-able
+
+    for tx in iter_transactions('btc', address, cursor=load()):
+        ... # carries on after the last transaction processed
+
+Services that page through history implement `get_transactions_page`. When
+none of the services do, the whole history is fetched with
+`get_transactions` and treated as a single page.
+
+`HistorySync` polls many addresses and returns only what changed since the
+last poll.
+"""
+from concurrent import futures
+
+from .core import AutoFallbackFetcher, NoService, get_optimal_services
+from .capabilities import implements
+from .executor import default_executor
+
+
+class TransactionPage(AutoFallbackFetcher):
+    def action(self, crypto, address, cursor=None):
+        return self._try_services(
+            'get_transactions_page', crypto=crypto, address=address, cursor=cursor
+        )
+
+    def no_service_msg(self, crypto, address, cursor=None):
+        return "Could not get transactions for: %s:%s (page: %s)" % (crypto, address, cursor)
+
+
+class TransactionIterator(object):
+    """
+    Yields the transactions of `address`, most recent first, fetching each
+    page only when the one before has been used up.
+
+    `cursor` is where iteration has got to: a dict of the service being
+    paged through, that service's cursor for the current page and the txid
+    last yielded. Pass it back in to resume. Once it has been used, only the
+    service named in the cursor is called, as pages from different services
+    do not line up.
+
+    New transactions arriving while paging push older ones onto later
+    pages; transactions already yielded from the page before are skipped.
+
+    A `deadline` in seconds applies to fetching each page. Pass a `Deadline`
+    instead to have all pages share one.
+    """
+    def __init__(self, crypto, address, cursor=None, services=None, verbose=False, timeout=None, responses=None, deadline=None):
+        self.crypto = crypto
+        self.address = address
+        self.cursor = dict(cursor) if cursor else None
+        self.services = services or get_optimal_services(crypto, 'historical_transactions')
+        self.fetcher_kwargs = dict(verbose=verbose, timeout=timeout, responses=responses, deadline=deadline)
+        self.finished = False
+        self.pages = 0 # number of pages fetched so far
+
+    def __iter__(self):
+        paging = [s for s in self.services if implements(s, 'get_transactions_page')]
+        if not paging:
+            return self._iter_all()
+
+        if self.cursor and self.cursor.get('service'):
+            paging = [s for s in paging if s.name == self.cursor['service']]
+            if not paging:
+                raise ValueError("Cursor is for %s, which is not one of the services" % self.cursor['service'])
+
+        return self._iter_pages(paging)
+
+    def _fetch(self, FetcherClass, services, **kwargs):
+        fetcher = FetcherClass(services=services, **self.fetcher_kwargs)
+        ret = fetcher.action(self.crypto, self.address, **kwargs)
+        self.pages += 1
+        return fetcher._successful_service.name, ret
+
+    def _skip_seen(self, txs, after):
+        """
+        Returns the transactions that come after txid `after` in `txs`, or
+        None if `after` is not in this page.
+        """
+        for i, tx in enumerate(txs):
+            if tx['txid'] == after:
+                return txs[i + 1:]
+        return None
+
+    def _iter_pages(self, services):
+        page = self.cursor['page'] if self.cursor else None
+        after = self.cursor['txid'] if self.cursor else None
+        previous = set()
+        missed = 0
+
+        while True:
+            service, (txs, next_page) = self._fetch(TransactionPage, services, cursor=page)
+            services = [s for s in services if s.name == service]
+
+            if after:
+                rest = self._skip_seen(txs, after)
+                if rest is None and missed == 0 and next_page is not None:
+                    # pushed onto the next page by newer transactions
+                    missed += 1
+                    page = next_page
+                    continue
+                txs, after = (rest if rest is not None else txs), None
+
+            for tx in txs:
+                if tx['txid'] in previous:
+                    continue
+                self.cursor = {'service': service, 'page': page, 'txid': tx['txid']}
+                yield tx
+
+            if next_page is None:
+                self.finished = True
+                return
+
+            previous = set(tx['txid'] for tx in txs)
+            page = next_page
+
+    def _iter_all(self):
+        from moneywagon import HistoricalTransactions
+
+        service, txs = self._fetch(HistoricalTransactions, self.services)
+        after = self.cursor and self.cursor.get('txid')
+        if after:
+            rest = self._skip_seen(txs, after)
+            txs = rest if rest is not None else txs
+
+        for tx in txs:
+            self.cursor = {'service': None, 'page': None, 'txid': tx['txid']}
+            yield tx
+        self.finished = True
+
+
+def iter_transactions(crypto, address, cursor=None, services=None, **modes):
+    """
+    Returns a `TransactionIterator` for `address`. Of the fetching modes, only
+    `verbose`, `timeout`, `responses` and `deadline` apply.
+    """
+    return TransactionIterator(
+        crypto, address, cursor=cursor, services=services, verbose=modes.get('verbose', False),
+        timeout=modes.get('timeout'), responses=modes.get('responses'), deadline=modes.get('deadline')
+    )
+
+
+class HistorySync(object):
+    """
+    Polls addresses for new transactions, reading only as far back as the
+    newest transaction already seen with at least `confirmations`
+    confirmations (the "anchor"). Transactions newer than the anchor that
+    had fewer confirmations are remembered so their confirmation counts can
+    be updated on later polls.
+
+    `state` is a dict of address -> cursor that is JSON-able, so it can be
+    saved between runs and passed back in. Each cursor looks like:
+
+        {'anchor': txid or None, 'pending': {txid: confirmations}}
+
+    `modes` are passed on to `iter_transactions`.
+    """
+    def __init__(self, crypto, state=None, services=None, confirmations=6, **modes):
+        self.crypto = crypto
+        self.state = state if state is not None else {}
+        self.services = services
+        self.confirmations = confirmations
+        self.modes = modes
+
+    def poll(self, address):
+        """
+        Returned is a dict with:
+
+        `new` - transactions not returned by an earlier poll, most recent first.
+        `updated` - pending transactions whose confirmation count has changed.
+        `dropped` - txids of pending transactions no longer in the history
+          (double spent or evicted from the mempool).
+        """
+        cursor = self.state.get(address) or {'anchor': None, 'pending': {}}
+        pending = dict(cursor['pending'])
+        new, updated, seen = [], [], set()
+        anchor = None
+
+        txs = iter_transactions(self.crypto, address, services=self.services, **self.modes)
+        for tx in txs:
+            txid = tx['txid']
+            if txid == cursor['anchor']:
+                break # everything from here back was settled on an earlier poll
+            seen.add(txid)
+
+            confirmations = tx.get('confirmations') or 0
+            if txid in pending:
+                if confirmations != pending[txid]:
+                    updated.append(tx)
+            else:
+                new.append(tx)
+
+            if confirmations >= self.confirmations:
+                pending.pop(txid, None)
+                if anchor is None:
+                    anchor = txid
+            else:
+                pending[txid] = confirmations
+
+        dropped = [txid for txid in pending if txid not in seen]
+        for txid in dropped:
+            del pending[txid]
+
+        self.state[address] = {'anchor': anchor or cursor['anchor'], 'pending': pending}
+        return {'new': new, 'updated': updated, 'dropped': dropped}
+
+    def poll_many(self, addresses):
+        """
+        Polls each address at the same time. Returned is a dict of address ->
+        the result of `poll`, or {'error': message} if it could not be fetched.
+        """
+        fetches = dict(
+            (default_executor.submit(self.poll, address), address) for address in addresses
+        )
+        results = {}
+        for future in futures.as_completed(fetches):
+            try:
+                results[fetches[future]] = future.result()
+            except NoService as exc:
+                results[fetches[future]] = {'error': str(exc)}
+        return results
@@ -0,0 +1,546 @@
+"""
+A local HTTP server that speaks the Insight API (the one `BitpayInsight`
+uses), serving a synthetic chain made up on start up. For load testing and
+benchmarking without hitting public block explorers.
+
+    from moneywagon.insight_server import InsightServer
+
+    with InsightServer(latency=0.05, error_rate=0.1) as server:
+        LocalInsight = server.service_class()
+        address = server.chain.addresses[0]
+        get_address_balance('btc', address, services=[LocalInsight])
+
+Any other service can be pointed at it by setting `domain` to
+`server.domain` and `protocol` to 'http'. It can also be run on its own:
+
+    python -m moneywagon.insight_server --port 3001 --latency 0.05
+
+Endpoints (all under /api): addr/{address}, addr/{address}/balance,
+addr/{address}/utxo, addrs/{addresses}/utxo, addrs/{addresses}/txs,
+txs?address={address}&pageNum={n}, txs?block={hash}, tx/{txid}, tx/send,
+block/{hash}, block-index/{height}, status and utils/estimatefee. Balances
+are returned in whole coins, as `BitpayInsight` expects.
+"""
+from __future__ import print_function
+
+import re
+import sys
+import json
+import time
+import errno
+import random
+import hashlib
+import threading
+from binascii import hexlify
+
+from base58 import b58encode_check, b58decode_check
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs
+
+COIN = 100000000
+TXS_PER_PAGE = 10
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def _coins(satoshis):
+    return satoshis / float(COIN)
+
+def _p2pkh_script(hash160):
+    return "76a914%s88ac" % hash160
+
+
+class SyntheticChain(object):
+    """
+    A made up chain of `blocks` blocks. Each block has a coinbase paying
+    `miner` and `txs_per_block` transactions moving coins between
+    `addresses`. The same `seed` always makes the same chain.
+    """
+    def __init__(self, blocks=100, addresses=10, txs_per_block=3, seed=0,
+                 start_time=1500000000, block_interval=600):
+        self.seed = seed
+        self.start_time = start_time
+        self.block_interval = block_interval
+        self.txs_per_block = txs_per_block
+        self._random = random.Random(seed)
+
+        self._hash160 = {}
+        self.miner = self._make_address('miner')
+        self.addresses = [self._make_address(i) for i in range(addresses)]
+
+        self.blocks = [] # by height
+        self.block_by_hash = {}
+        self.txs = {}
+        self.address_txids = {} # address -> txids, oldest first
+        self.utxos = {} # (txid, n) -> (address, satoshis, height)
+        self.spent = {} # (txid, n) -> spending txid
+
+        self.add_blocks(blocks)
+
+    def add_blocks(self, count=1):
+        """
+        Mine `count` more blocks on top of the chain.
+        """
+        for i in range(count):
+            self._add_block(len(self.blocks), self._random, self.txs_per_block)
+
+    def _make_address(self, label):
+        hash160 = _sha256("%s-%s" % (self.seed, label))[:40]
+        address = b58encode_check(b'\x00' + bytearray.fromhex(hash160))
+        if not isinstance(address, str):
+            address = address.decode('ascii')
+        self._hash160[address] = hash160
+        return address
+
+    def _add_tx(self, height, inputs, outputs, coinbase=False):
+        """
+        `inputs` is a list of (txid, n), `outputs` a list of (address, satoshis).
+        """
+        txid = _sha256(json.dumps([self.seed, height, inputs, outputs]))
+        self.txs[txid] = {
+            'txid': txid, 'height': height, 'coinbase': coinbase,
+            'inputs': [(prev, n) + self.utxos.pop((prev, n))[:2] for prev, n in inputs],
+            'outputs': outputs,
+        }
+        involved = [a for prev, n, a, v in self.txs[txid]['inputs']] + [a for a, v in outputs]
+        for address in sorted(set(involved), key=involved.index):
+            self.address_txids.setdefault(address, []).append(txid)
+        for prev, n in inputs:
+            self.spent[(prev, n)] = txid
+        for n, (address, satoshis) in enumerate(outputs):
+            self.utxos[(txid, n)] = (address, satoshis, height)
+        return txid
+
+    def _add_block(self, height, rand, txs_per_block):
+        spendable = sorted(k for k, v in self.utxos.items() if v[2] < height)
+        txids = [self._add_tx(height, [], [(self.miner, 50 * COIN)], coinbase=True)]
+
+        for i in range(min(txs_per_block, len(spendable))):
+            prev = spendable.pop(rand.randrange(len(spendable)))
+            sender, value = self.utxos[prev][:2]
+            fee = 1000
+            if value <= fee * 2:
+                continue
+            amount = rand.randint(1, value - fee)
+            outputs = [(rand.choice(self.addresses), amount)]
+            if value - amount - fee > 0:
+                outputs.append((sender, value - amount - fee))
+            txids.append(self._add_tx(height, [prev], outputs))
+
+        previous = self.blocks[-1]['hash'] if self.blocks else None
+        block = {
+            'height': height,
+            'hash': _sha256(json.dumps([self.seed, height, previous, txids])),
+            'previousblockhash': previous,
+            'time': self.start_time + height * self.block_interval,
+            'tx': txids,
+        }
+        if previous:
+            self.blocks[-1]['nextblockhash'] = block['hash']
+        self.blocks.append(block)
+        self.block_by_hash[block['hash']] = block
+
+    @property
+    def tip(self):
+        return self.blocks[-1]
+
+    def confirmations(self, height):
+        return self.tip['height'] - height + 1
+
+    def balance(self, address):
+        return sum(v for a, v, h in self.utxos.values() if a == address)
+
+    def render_tx(self, txid):
+        tx = self.txs[txid]
+        block = self.blocks[tx['height']]
+        if tx['coinbase']:
+            vin = [{'coinbase': _sha256(txid)[:16], 'n': 0, 'sequence': 4294967295}]
+        else:
+            vin = [{
+                'txid': prev, 'vout': n, 'n': i, 'addr': address,
+                'value': _coins(satoshis), 'valueSat': satoshis,
+                'scriptSig': {'hex': _sha256(prev)[:32], 'asm': ''},
+                'sequence': 4294967295, 'doubleSpentTxID': None,
+            } for i, (prev, n, address, satoshis) in enumerate(tx['inputs'])]
+
+        vout = [{
+            'value': "%.8f" % _coins(satoshis), 'n': n,
+            'scriptPubKey': {
+                'hex': _p2pkh_script(self._hash160[address]),
+                'asm': "OP_DUP OP_HASH160 %s OP_EQUALVERIFY OP_CHECKSIG" % self._hash160[address],
+                'addresses': [address], 'type': 'pubkeyhash',
+            },
+            'spentTxId': self.spent.get((txid, n)),
+        } for n, (address, satoshis) in enumerate(tx['outputs'])]
+
+        value_in = sum(x[3] for x in tx['inputs'])
+        value_out = sum(v for a, v in tx['outputs'])
+        ret = {
+            'txid': txid, 'version': 1, 'locktime': 0, 'vin': vin, 'vout': vout,
+            'blockhash': block['hash'], 'blockheight': block['height'],
+            'confirmations': self.confirmations(block['height']),
+            'time': block['time'], 'blocktime': block['time'],
+            'valueOut': _coins(value_out), 'size': 100 + 150 * len(vin) + 34 * len(vout),
+        }
+        if tx['coinbase']:
+            ret['isCoinBase'] = True
+        else:
+            ret['valueIn'] = _coins(value_in)
+            ret['fees'] = _coins(value_in - value_out)
+        return ret
+
+    def render_utxo(self, txid, n):
+        address, satoshis, height = self.utxos[(txid, n)]
+        return {
+            'address': address, 'txid': txid, 'vout': n,
+            'scriptPubKey': _p2pkh_script(self._hash160[address]),
+            'amount': _coins(satoshis), 'satoshis': satoshis, 'height': height,
+            'confirmations': self.confirmations(height),
+        }
+
+    def render_block(self, block):
+        return {
+            'hash': block['hash'], 'height': block['height'], 'version': 536870912,
+            'size': 80 + sum(self.render_tx(t)['size'] for t in block['tx']),
+            'merkleroot': _sha256("".join(block['tx'])), 'tx': list(block['tx']),
+            'time': block['time'], 'nonce': block['height'], 'bits': '1d00ffff',
+            'difficulty': 1.0, 'confirmations': self.confirmations(block['height']),
+            'previousblockhash': block['previousblockhash'],
+            'nextblockhash': block.get('nextblockhash'),
+            'reward': 50.0, 'isMainChain': True,
+        }
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super(HTTPError, self).__init__(message)
+        self.status = status
+
+
+def _valid_address(address):
+    try:
+        b58decode_check(address)
+    except Exception:
+        raise HTTPError(400, "Invalid address: %s. Code:1" % address)
+    return address
+
+def _addresses(text):
+    return [_valid_address(a) for a in text.split(',')]
+
+
+class InsightAPI(object):
+    """
+    Maps Insight API paths to data from a `SyntheticChain`. Returns a
+    (status, body) tuple, where body is JSON-able, or a string.
+    """
+    def __init__(self, chain):
+        self.chain = chain
+        self.routes = [
+            ('GET', r'^/addr/([^/]+)/balance$', self.balance),
+            ('GET', r'^/addr/([^/]+)/utxo$', self.utxo),
+            ('GET', r'^/addrs/([^/]+)/utxo$', self.utxo_multi),
+            ('GET', r'^/addrs/([^/]+)/txs$', self.txs_multi),
+            ('GET', r'^/addr/([^/]+)$', self.addr),
+            ('GET', r'^/txs/?$', self.txs),
+            ('POST', r'^/tx/send$', self.send),
+            ('GET', r'^/tx/([0-9a-f]+)$', self.tx),
+            ('GET', r'^/block/([0-9a-f]+)$', self.block),
+            ('GET', r'^/block-index/([0-9]+)$', self.block_index),
+            ('GET', r'^/status$', self.status),
+            ('GET', r'^/utils/estimatefee$', self.estimatefee),
+        ]
+
+    def handle(self, method, path, query):
+        """
+        `query` holds the query string parameters, and for POSTs the form body.
+        """
+        for route_method, pattern, view in self.routes:
+            match = re.match(pattern, path)
+            if match and route_method == method:
+                try:
+                    return 200, view(query, *match.groups())
+                except HTTPError as exc:
+                    return exc.status, str(exc)
+        return 404, "Not found"
+
+    def balance(self, query, address):
+        return _coins(self.chain.balance(_valid_address(address)))
+
+    def addr(self, query, address):
+        chain = self.chain
+        txids = chain.address_txids.get(_valid_address(address), [])
+        received = sum(
+            v for t in txids for a, v in chain.txs[t]['outputs'] if a == address
+        )
+        balance = chain.balance(address)
+        return {
+            'addrStr': address, 'balance': _coins(balance), 'balanceSat': balance,
+            'totalReceived': _coins(received), 'totalReceivedSat': received,
+            'totalSent': _coins(received - balance), 'totalSentSat': received - balance,
+            'unconfirmedBalance': 0, 'unconfirmedBalanceSat': 0, 'unconfirmedTxApperances': 0,
+            'txApperances': len(txids), 'transactions': list(reversed(txids)),
+        }
+
+    def utxo(self, query, address):
+        return self.utxo_multi(query, address)
+
+    def utxo_multi(self, query, addresses):
+        addresses = set(_addresses(addresses))
+        return [
+            self.chain.render_utxo(txid, n) for (txid, n), (address, value, height)
+            in sorted(self.chain.utxos.items(), key=lambda x: -x[1][2]) if address in addresses
+        ]
+
+    def _txids_for(self, addresses):
+        txids = set()
+        for address in addresses:
+            txids.update(self.chain.address_txids.get(address, []))
+        # newest first
+        return sorted(txids, key=lambda t: (-self.chain.txs[t]['height'], t))
+
+    def txs(self, query):
+        if 'block' in query:
+            block = self.chain.block_by_hash.get(query['block'])
+            if not block:
+                raise HTTPError(404, "Not found")
+            txids = block['tx']
+        elif 'address' in query:
+            txids = self._txids_for([_valid_address(query['address'])])
+        else:
+            raise HTTPError(400, "Block hash or address expected")
+
+        pages = max(1, (len(txids) + TXS_PER_PAGE - 1) // TXS_PER_PAGE)
+        page = int(query.get('pageNum', 0))
+        page_txids = txids[page * TXS_PER_PAGE:(page + 1) * TXS_PER_PAGE]
+        return {'pagesTotal': pages, 'txs': [self.chain.render_tx(t) for t in page_txids]}
+
+    def txs_multi(self, query, addresses):
+        txids = self._txids_for(_addresses(addresses))
+        start = int(query.get('from', 0))
+        end = min(int(query.get('to', start + 10)), start + 50)
+        return {
+            'totalItems': len(txids), 'from': start, 'to': min(end, len(txids)),
+            'items': [self.chain.render_tx(t) for t in txids[start:end]],
+        }
+
+    def tx(self, query, txid):
+        if txid not in self.chain.txs:
+            raise HTTPError(404, "Not found")
+        return self.chain.render_tx(txid)
+
+    def send(self, query):
+        rawtx = query.get('rawtx')
+        if not rawtx:
+            raise HTTPError(400, "Missing parameter: rawtx")
+        try:
+            raw = bytearray.fromhex(rawtx)
+        except ValueError:
+            raise HTTPError(400, "TX decode failed")
+        txid = hashlib.sha256(hashlib.sha256(bytes(raw)).digest()).digest()
+        return {'txid': hexlify(txid[::-1]).decode('ascii')}
+
+    def block(self, query, block_hash):
+        block = self.chain.block_by_hash.get(block_hash)
+        if not block:
+            raise HTTPError(404, "Not found")
+        return self.chain.render_block(block)
+
+    def block_index(self, query, height):
+        height = int(height)
+        if height >= len(self.chain.blocks):
+            raise HTTPError(404, "Block height out of range. Code:-8")
+        return {'blockHash': self.chain.blocks[height]['hash']}
+
+    def status(self, query):
+        tip = self.chain.tip
+        if query.get('q') == 'getLastBlockHash':
+            return {'syncTipHash': tip['hash'], 'lastblockhash': tip['hash']}
+        return {'info': {'blocks': tip['height'], 'difficulty': 1.0, 'network': 'livenet'}}
+
+    def estimatefee(self, query):
+        return dict((n, 0.0001) for n in query.get('nbBlocks', '2').split(','))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _serve(self, method):
+        server = self.server.insight
+        parsed = urlparse(self.path)
+        query = dict((k, v[-1]) for k, v in parse_qs(parsed.query).items())
+
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length).decode('utf-8')
+            query.update((k, v[-1]) for k, v in parse_qs(raw).items())
+
+        delay, error = server._misbehave()
+        if delay:
+            time.sleep(delay)
+
+        path = parsed.path
+        if not path.startswith(server.api_prefix):
+            status, content = 404, "Not found"
+        elif error:
+            status, content = error, "Injected error"
+        else:
+            status, content = server.api.handle(method, path[len(server.api_prefix):], query)
+
+        server._count(status)
+        if isinstance(content, str) and status != 200:
+            payload, content_type = content, 'text/plain'
+        else:
+            payload, content_type = json.dumps(content), 'application/json'
+
+        payload = payload.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._serve('GET')
+
+    def do_POST(self):
+        self._serve('POST')
+
+    def log_message(self, *args):
+        if self.server.insight.verbose:
+            BaseHTTPRequestHandler.log_message(self, *args)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        exc = sys.exc_info()[1]
+        if getattr(exc, 'errno', None) in (errno.EPIPE, errno.ECONNRESET):
+            return # the client timed out before the (delayed) response was sent
+        HTTPServer.handle_error(self, request, client_address)
+
+
+class InsightServer(object):
+    """
+    Serves a `SyntheticChain` (a default one is made if none is passed in)
+    over HTTP. `port` 0 picks a free port. Every response is delayed by
+    `latency` seconds plus up to `jitter` more, and `error_rate` (0 to 1) of
+    requests fail with an `error_status` response. These can be changed
+    while the server is running.
+    """
+    api_prefix = '/api'
+
+    def __init__(self, chain=None, host='127.0.0.1', port=0, latency=0, jitter=0,
+                 error_rate=0, error_status=500, seed=None, verbose=False):
+        self.chain = chain or SyntheticChain()
+        self.api = InsightAPI(self.chain)
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.verbose = verbose
+        self.requests = 0
+        self.statuses = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    def _misbehave(self):
+        with self._lock:
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0)
+            error = self.error_status if self._random.random() < self.error_rate else None
+        return delay, error
+
+    def _count(self, status):
+        with self._lock:
+            self.requests += 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    @property
+    def domain(self):
+        return "%s:%s" % (self.host, self.port)
+
+    @property
+    def url(self):
+        return "http://%s%s" % (self.domain, self.api_prefix)
+
+    def start(self):
+        self._httpd = _ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.insight = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def service_class(self, base=None, name=None):
+        """
+        Returns a subclass of `base` (`BitpayInsight` by default) that makes
+        its requests to this server.
+        """
+        if base is None:
+            from .services.blockchain_services import BitpayInsight as base
+
+        name = name or "LocalInsight%s" % self.port
+        return type(str(name), (base,), {
+            'domain': self.domain, 'protocol': 'http', 'name': name,
+            'supported_cryptos': ['btc'], 'ssl_verify': False,
+        })
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local Insight API server with a synthetic chain")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3001)
+    parser.add_argument('--blocks', type=int, default=100)
+    parser.add_argument('--addresses', type=int, default=10)
+    parser.add_argument('--txs-per-block', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0, help='up to this many more seconds, at random')
+    parser.add_argument('--error-rate', type=float, default=0, help='fraction of requests that fail')
+    parser.add_argument('--error-status', type=int, default=500)
+    parser.add_argument('--verbose', action='store_true')
+    argv = parser.parse_args()
+
+    chain = SyntheticChain(
+        blocks=argv.blocks, addresses=argv.addresses,
+        txs_per_block=argv.txs_per_block, seed=argv.seed
+    )
+    server = InsightServer(
+        chain, host=argv.host, port=argv.port, latency=argv.latency, jitter=argv.jitter,
+        error_rate=argv.error_rate, error_status=argv.error_status, verbose=argv.verbose
+    )
+    server.start()
+    print("Serving %s blocks on %s" % (len(chain.blocks), server.url))
+    for address in chain.addresses:
+        print("  %s  %.8f" % (address, _coins(chain.balance(address))))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,46 @@
+"""
+Long lived service instances shared by all fetchers, so services are not
+re-created on every call. Their own response caches only keep immutable
+data (confirmed transactions, blocks by hash), other responses are cached
+by the fetcher that made the call (see `AutoFallbackFetcher`); pass a
+`ResponseCache` as `responses` to share them between calls. State of a call
+in progress (the last url fetched and so on) is kept per thread by the
+`Service` class, so shared instances are safe to use from many threads at
+once.
+"""
+import threading
+
+
+class ServiceInstancePool(object):
+    """
+    Holds one instance per service class and configuration. Instances using
+    a caller supplied `responses` cache are not pooled, as the cache belongs
+    to the caller. Set `enabled` to False to create new instances every time.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def get(self, ServiceClass, verbose=False, responses=None, timeout=None):
+        if not self.enabled or responses is not None:
+            return ServiceClass(verbose=verbose, responses=responses, timeout=timeout)
+
+        key = (ServiceClass, bool(verbose), timeout)
+        instance = self._instances.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    instance = self._instances[key] = ServiceClass(verbose=verbose, timeout=timeout)
+        return instance
+
+    def __len__(self):
+        return len(self._instances)
+
+    def clear(self):
+        with self._lock:
+            self._instances = {}
+
+
+service_instances = ServiceInstancePool()
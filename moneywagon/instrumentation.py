@@ -0,0 +1,197 @@
+"""
+Events fired for every external request and every fallback attempt, for
+finding slow or broken services.
+
+    from moneywagon.instrumentation import instrumentation, JSONLinesSink
+    instrumentation.add_hook(JSONLinesSink('/var/log/moneywagon.jsonl'))
+
+A hook is any callable that takes one event dict. Every event has these keys:
+
+    type - 'request' (one external HTTP request) or 'attempt' (one call to a
+      service method by `AutoFallbackFetcher`)
+    time - unix timestamp of when the event ended
+    service - name of the service
+    method - name of the service method being called, e.g. 'get_balance'
+    crypto - currency code, or None if not known
+    latency - seconds
+    exception - name and message of the exception raised, or None
+
+Request events also have `url`, `url_template` (the url with addresses,
+hashes and numbers replaced by {}), `http_method`, `status`, `bytes` and
+`cache` ('hit', 'miss', or 'shared' when the response came from an
+identical request made at the same time by another thread). Attempt events
+also have `success` (True or False) and `skipped` (True when the service was
+not called because its circuit breaker is open).
+
+`histograms` is a `HistogramSink` that is always installed.
+"""
+import re
+import json
+import time
+import threading
+
+_variable_part = re.compile(r'(?<=[/=,;])(?:[0-9]+|[0-9a-zA-Z_\-]{20,})(?=$|[/?&.,;])')
+
+def url_template(url):
+    """
+    Returns the url with the parts that change from call to call replaced
+    with {}, so requests to the same endpoint can be grouped.
+
+    >>> url_template("https://example.com/addr/1BoatSLRHtKNngkdXEeobR76b53LETtpyT/utxo?limit=50")
+    'https://example.com/addr/{}/utxo?limit={}'
+    """
+    if not url:
+        return url
+    scheme, sep, rest = url.partition('://')
+    return scheme + sep + _variable_part.sub('{}', rest)
+
+
+class Instrumentation(object):
+    def __init__(self):
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        with self._lock:
+            self._hooks = self._hooks + [hook]
+        return hook
+
+    def remove_hook(self, hook):
+        with self._lock:
+            self._hooks = [h for h in self._hooks if h is not hook]
+
+    def emit(self, event_type, **fields):
+        """
+        Send an event to every hook. Exceptions raised by hooks are ignored so
+        a broken hook can never break a fetch.
+        """
+        hooks = self._hooks
+        if not hooks:
+            return
+
+        fields['type'] = event_type
+        fields['time'] = time.time()
+        for hook in hooks:
+            try:
+                hook(fields)
+            except Exception:
+                pass
+
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+class HistogramSink(object):
+    """
+    Keeps a latency histogram for each (type, service, method, crypto) along
+    with counts of errors, cache hits, bytes and HTTP status codes.
+    `buckets` are the upper bounds (in seconds) of each histogram bucket.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = (event['type'], event['service'], event['method'], event['crypto'])
+        latency = event['latency'] or 0
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'count': 0, 'errors': 0, 'cache_hits': 0, 'bytes': 0,
+                    'total_latency': 0.0, 'max_latency': 0.0,
+                    'histogram': [0] * len(self.buckets), 'statuses': {},
+                }
+            stats['count'] += 1
+            stats['total_latency'] += latency
+            stats['max_latency'] = max(stats['max_latency'], latency)
+            if event['exception']:
+                stats['errors'] += 1
+            if event.get('cache') == 'hit':
+                stats['cache_hits'] += 1
+            if event.get('bytes'):
+                stats['bytes'] += event['bytes']
+            if event.get('status'):
+                stats['statuses'][event['status']] = stats['statuses'].get(event['status'], 0) + 1
+
+            for i, bound in enumerate(self.buckets):
+                if latency <= bound:
+                    stats['histogram'][i] += 1
+                    break
+
+    def _matching(self, event_type, service=None, method=None):
+        with self._lock:
+            return [
+                (key, stats) for key, stats in self._stats.items()
+                if key[0] == event_type and service in (None, key[1]) and method in (None, key[2])
+            ]
+
+    def percentile(self, service, method, percent, event_type='request'):
+        """
+        Returns the upper bound of the histogram bucket that `percent` percent
+        of calls completed within, or None if there have been no calls.
+        """
+        histogram = [0] * len(self.buckets)
+        for key, stats in self._matching(event_type, service, method):
+            histogram = [a + b for a, b in zip(histogram, stats['histogram'])]
+
+        count = sum(histogram)
+        if not count:
+            return None
+
+        seen = 0
+        for bound, n in zip(self.buckets, histogram):
+            seen += n
+            if seen >= percent / 100.0 * count:
+                return bound
+
+    def slowest(self, n=10, event_type='request'):
+        """
+        Returns the `n` (service, method, crypto) with the highest average
+        latency, slowest first, as a list of (key, average latency) tuples.
+        """
+        averages = [
+            (key[1:], stats['total_latency'] / stats['count'])
+            for key, stats in self._matching(event_type)
+        ]
+        return sorted(averages, key=lambda x: x[1], reverse=True)[:n]
+
+    def summary(self):
+        with self._lock:
+            return dict(
+                (key, dict(stats, histogram=list(stats['histogram']), statuses=dict(stats['statuses'])))
+                for key, stats in self._stats.items()
+            )
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+class JSONLinesSink(object):
+    """
+    Writes each event as one line of JSON to `file`, which is either a path
+    (opened in append mode) or an open file object.
+    """
+    def __init__(self, file):
+        if hasattr(file, 'write'):
+            self.file = file
+            self._close = False
+        else:
+            self.file = open(file, 'a')
+            self._close = True
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        line = json.dumps(event, default=str, sort_keys=True)
+        with self._lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def close(self):
+        if self._close:
+            self.file.close()
+
+
+instrumentation = Instrumentation()
+histograms = instrumentation.add_hook(HistogramSink())
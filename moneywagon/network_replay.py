@@ -4,6 +4,7 @@ import random
 from .crypto_data import crypto_data
 from moneywagon import get_block, push_tx, get_single_transaction, watch_mempool
 from .core import to_rawtx
+from .cache import get_chain_data_store
 from moneywagon.services import BitpayInsight, ChainSo, LocalBitcoinsChain, BlockDozer
 
 class NetworkReplay(object):
@@ -77,7 +78,7 @@ class NetworkReplay(object):
         if self.block_fetcher:
             transaction = self.block_fetcher(currency=self.source, txid=txid)
         else:
-            transaction = self.tx_fetcher.get_single_transaction(self.source, txid=txid)
+            transaction = self._fetch_tx(txid)
 
         first_input = transaction['inputs'][0]
         if first_input.get('coinbase') or first_input.get("addresses") == "coinbase":
@@ -99,5 +100,23 @@ class NetworkReplay(object):
 
         return ret
 
+    def _fetch_tx(self, txid):
+        """
+        Get transaction from the chain data store if one is enabled, otherwise
+        from `tx_fetcher`. Confirmed transactions are saved to the store.
+        """
+        store = get_chain_data_store()
+        key = "tx:%s" % txid.lower()
+        if store is not None:
+            transaction = store.get(self.source, key)
+            if transaction is not None:
+                return transaction
+
+        transaction = self.tx_fetcher.get_single_transaction(self.source, txid=txid)
+        if store is not None and transaction.get('confirmations'):
+            store.set(self.source, key, transaction)
+
+        return transaction
+
     def replay_mempool(self):
         watch_mempool(self.source, self._replay_tx)
@@ -0,0 +1,144 @@
+"""
+Client side rate limiting of requests made to each service.
+
+Services declare their limit with the `rate_limit` and `rate_limit_burst`
+class attributes. Each service gets a token bucket. When a service answers
+with HTTP 429 or a `Retry-After` header, its bucket is shrunk so fewer
+requests are sent. The original rate comes back after `recovery_seconds`
+without another 429.
+"""
+import time
+import threading
+from email.utils import parsedate_tz, mktime_tz
+
+
+def parse_retry_after(value):
+    """
+    Returns the number of seconds to wait from the value of a `Retry-After`
+    header, which can either be a number of seconds or a HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parsed = parsedate_tz(value)
+    if parsed:
+        return max(0.0, mktime_tz(parsed) - time.time())
+    return None
+
+
+class TokenBucket(object):
+    """
+    `rate` is how many requests per second are allowed.
+    `burst` is how many requests can be made at once.
+    """
+    def __init__(self, rate, burst=1):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.time()
+        self.blocked_until = 0
+        self.penalized_at = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<TokenBucket: %.2f/s (burst %s)>" % (self.rate, self.burst)
+
+    def _refill(self, now, recovery_seconds):
+        if self.penalized_at and now - self.penalized_at > recovery_seconds:
+            self.rate = self.base_rate
+            self.penalized_at = None
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, max_wait, recovery_seconds=60):
+        """
+        Take a token. Returned is the number of seconds to wait before the
+        request can be made. If that would be more than `max_wait`, no token
+        is taken and None is returned.
+        """
+        with self._lock:
+            now = time.time()
+            self._refill(now, recovery_seconds)
+
+            wait = max(0.0, self.blocked_until - now)
+            if self.tokens < 1:
+                wait = max(wait, (1 - self.tokens) / self.rate)
+
+            if wait > max_wait:
+                return None
+
+            self.tokens -= 1
+            return wait
+
+    def penalize(self, retry_after=None):
+        """
+        The service said it is getting too many requests. Halve the rate, and
+        if the service said how long to wait, do not allow any requests until
+        then.
+        """
+        with self._lock:
+            now = time.time()
+            self.rate = self.rate / 2.0
+            self.tokens = min(self.tokens, 0)
+            self.penalized_at = now
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RateLimiterRegistry(object):
+    """
+    Holds one `TokenBucket` for each service. Services without a declared
+    `rate_limit` are not limited until they respond with a 429, then they
+    get a bucket of `default_rate` (which is then halved by the 429).
+    """
+    def __init__(self, default_rate=2.0, recovery_seconds=60):
+        self.default_rate = default_rate
+        self.recovery_seconds = recovery_seconds
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get(self, service, create=False):
+        name = service.name
+        bucket = self._buckets.get(name)
+        if bucket is None and (create or service.rate_limit):
+            with self._lock:
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    bucket = self._buckets[name] = TokenBucket(
+                        service.rate_limit or self.default_rate,
+                        service.rate_limit_burst or 1
+                    )
+        return bucket
+
+    def reserve(self, service):
+        """
+        Returns how many seconds to wait before calling `service`, or None if
+        that would be longer than `service.rate_limit_wait`.
+        """
+        bucket = self.get(service)
+        if bucket is None:
+            return 0
+        return bucket.reserve(service.rate_limit_wait, self.recovery_seconds)
+
+    def penalize(self, service, retry_after=None):
+        self.get(service, create=True).penalize(parse_retry_after(retry_after))
+
+    def states(self):
+        with self._lock:
+            return dict(
+                (name, {'rate': b.rate, 'base_rate': b.base_rate, 'blocked_until': b.blocked_until})
+                for name, b in self._buckets.items()
+            )
+
+    def reset(self):
+        with self._lock:
+            self._buckets = {}
+
+
+rate_limiters = RateLimiterRegistry()
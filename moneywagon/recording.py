@@ -0,0 +1,175 @@
+"""
+Record the HTTP traffic of services to fixture files, and serve it back
+later without touching the network. Useful for tests and benchmarks that
+should not hammer public block explorers.
+
+    from moneywagon.recording import recording, replaying
+
+    with recording('fixtures/'):
+        get_address_balance('btc', '1HLoD9E4SDFFPDiYfNYnkBLQ85Y51J3Zb1')
+
+    with replaying('fixtures/'):
+        get_address_balance('btc', '1HLoD9E4SDFFPDiYfNYnkBLQ85Y51J3Zb1') # no network
+
+Both pools can also be set on a single service class with
+`MyService.session_pool = ReplayPool('fixtures/')`. Each fixture is one JSON
+file holding the request (method, url, body) and the response (status code,
+headers, content).
+"""
+import os
+import json
+import base64
+import hashlib
+import threading
+from contextlib import contextmanager
+
+import requests
+
+from .core import Service, SkipThisService
+from .session_pool import default_session_pool, positional_argument
+
+
+class FixtureNotFound(SkipThisService):
+    pass
+
+
+def request_body(method, args, kwargs):
+    """
+    What, besides the url, makes a request different from others to the
+    same url: the body (`data` or `json`) and the query `params`, whether
+    passed by name or positionally.
+    """
+    body = {}
+    if args:
+        body[positional_argument(method)] = args[0]
+    for name in ('data', 'json', 'params'):
+        if kwargs.get(name) is not None:
+            body[name] = kwargs[name]
+    return body
+
+
+def fixture_key(method, url, data=None):
+    """
+    Name of the fixture file for a request. `data` is from `request_body`.
+    """
+    body = json.dumps(data, sort_keys=True, default=str) if data else ''
+    digest = hashlib.sha1(("%s %s %s" % (method.upper(), url, body)).encode('utf-8'))
+    return "%s-%s.json" % (method.lower(), digest.hexdigest())
+
+
+def serialize_response(method, url, data, response):
+    content = response.content or b''
+    try:
+        text, encoding = content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        text, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+
+    return {
+        'request': {'method': method.upper(), 'url': url, 'data': data},
+        'status_code': response.status_code,
+        'headers': dict(response.headers),
+        'content': text,
+        'content_encoding': encoding,
+    }
+
+
+def deserialize_response(fixture):
+    """
+    Build a `requests.Response` from a fixture, so services can't tell it
+    apart from a real one.
+    """
+    response = requests.Response()
+    response.status_code = fixture['status_code']
+    response.headers.update(fixture.get('headers') or {})
+    response.url = fixture['request']['url']
+    response.encoding = 'utf-8'
+    if fixture.get('content_encoding') == 'base64':
+        response._content = base64.b64decode(fixture['content'])
+    else:
+        response._content = fixture['content'].encode('utf-8')
+    return response
+
+
+class RecordingPool(object):
+    """
+    Makes requests through `pool` (the shared session pool by default) and
+    writes every response to `directory`. Responses already on disk are
+    overwritten, so recording again refreshes the fixtures.
+    """
+    def __init__(self, directory, pool=None):
+        self.directory = directory
+        self.pool = pool
+        self.recorded = 0
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def request(self, method, url, *args, **kwargs):
+        response = (self.pool or default_session_pool).request(method, url, *args, **kwargs)
+        data = request_body(method, args, kwargs)
+        fixture = serialize_response(method, url, data, response)
+        path = os.path.join(self.directory, fixture_key(method, url, data))
+        with self._lock:
+            with open(path, 'w') as f:
+                f.write(json.dumps(fixture, indent=2, sort_keys=True))
+            self.recorded += 1
+        return response
+
+
+class ReplayPool(object):
+    """
+    Serves responses from fixtures written by `RecordingPool`. Requests with
+    no fixture raise `FixtureNotFound`, which makes the fetcher move on to
+    the next service just like a service that is down.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.misses = []
+        self._fixtures = {}
+        self._lock = threading.Lock()
+
+    def _load(self, key):
+        fixture = self._fixtures.get(key)
+        if fixture is None:
+            path = os.path.join(self.directory, key)
+            if not os.path.exists(path):
+                return None
+            with open(path) as f:
+                fixture = json.loads(f.read())
+            with self._lock:
+                self._fixtures[key] = fixture
+        return fixture
+
+    def request(self, method, url, *args, **kwargs):
+        data = request_body(method, args, kwargs)
+        fixture = self._load(fixture_key(method, url, data))
+        if fixture is None:
+            with self._lock:
+                self.misses.append((method.upper(), url))
+            raise FixtureNotFound("No fixture for %s %s" % (method.upper(), url))
+        return deserialize_response(fixture)
+
+
+@contextmanager
+def use_session_pool(pool, ServiceClass=Service):
+    """
+    Make all requests by `ServiceClass` (and its subclasses that do not set
+    their own pool) go through `pool` for the duration of the block.
+    """
+    had_own = 'session_pool' in ServiceClass.__dict__
+    old = ServiceClass.__dict__.get('session_pool')
+    ServiceClass.session_pool = pool
+    try:
+        yield pool
+    finally:
+        if had_own:
+            ServiceClass.session_pool = old
+        else:
+            # go back to inheriting the pool from its base class.
+            del ServiceClass.session_pool
+
+def recording(directory, ServiceClass=Service):
+    return use_session_pool(RecordingPool(directory), ServiceClass)
+
+def replaying(directory, ServiceClass=Service):
+    return use_session_pool(ReplayPool(directory), ServiceClass)
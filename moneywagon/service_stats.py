@@ -0,0 +1,145 @@
+"""
+Process wide statistics of how each service performs, recorded by
+`AutoFallbackFetcher` for every service call. Used for hedging and for
+ordering services by how quickly they are expected to return a result.
+"""
+import threading
+from collections import deque
+
+
+class ServiceStats(object):
+    """
+    Keeps counts, error classes, an exponentially weighted moving average
+    (EWMA) of latency and recent latencies for each (service, method, crypto).
+
+    `max_samples` is how many of the most recent latencies are kept for
+      calculating percentiles.
+    `ewma_alpha` is the weight given to the newest latency in the EWMA.
+    `prior_latency` is the latency (in seconds) assumed for services that
+      have not been called yet.
+    """
+    def __init__(self, max_samples=100, ewma_alpha=0.3, prior_latency=1.0):
+        self.max_samples = max_samples
+        self.ewma_alpha = ewma_alpha
+        self.prior_latency = prior_latency
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {
+                'calls': 0,
+                'successes': 0,
+                'failures': 0,
+                'hedged': 0,
+                'errors': {},
+                'ewma_latency': None,
+                'latencies': deque(maxlen=self.max_samples),
+            }
+        return stats
+
+    @staticmethod
+    def _key(service, method_name, crypto):
+        return (getattr(service, 'name', service), method_name, (crypto or '').lower())
+
+    def record(self, service, method_name, crypto, latency, success, error=None):
+        """
+        Record the outcome of one service call. `latency` is in seconds.
+        `error` is the name of the exception class when the call failed.
+        """
+        with self._lock:
+            stats = self._get(self._key(service, method_name, crypto))
+            stats['calls'] += 1
+            stats['successes' if success else 'failures'] += 1
+            stats['latencies'].append(latency)
+
+            if error:
+                stats['errors'][error] = stats['errors'].get(error, 0) + 1
+
+            if stats['ewma_latency'] is None:
+                stats['ewma_latency'] = latency
+            else:
+                stats['ewma_latency'] = (
+                    self.ewma_alpha * latency + (1 - self.ewma_alpha) * stats['ewma_latency']
+                )
+
+    def record_hedge(self, service, method_name, crypto):
+        """
+        Record that `service` was called in parallel because the service
+        before it was too slow to respond.
+        """
+        with self._lock:
+            self._get(self._key(service, method_name, crypto))['hedged'] += 1
+
+    def percentile(self, service, method_name, crypto, percent, min_samples=5):
+        """
+        Returns the latency (in seconds) that `percent` percent of recent calls
+        completed within. Returns None if not enough calls have been made yet.
+        """
+        with self._lock:
+            stats = self._stats.get(self._key(service, method_name, crypto))
+            if not stats or len(stats['latencies']) < min_samples:
+                return None
+            latencies = sorted(stats['latencies'])
+
+        index = int(round(percent / 100.0 * (len(latencies) - 1)))
+        return latencies[index]
+
+    def expected_time(self, service, method_name, crypto):
+        """
+        Expected number of seconds until this service returns a successful
+        result: the EWMA latency divided by the success rate. The success rate
+        is smoothed so that services with few calls are not written off (or
+        trusted) too quickly.
+        """
+        with self._lock:
+            stats = self._stats.get(self._key(service, method_name, crypto))
+            if not stats:
+                return self.prior_latency / 0.5
+            success_rate = (stats['successes'] + 1.0) / (stats['calls'] + 2.0)
+            latency = stats['ewma_latency']
+
+        if latency is None:
+            latency = self.prior_latency
+        return latency / success_rate
+
+    def order_services(self, services, method_name, crypto):
+        """
+        Returns the passed in services sorted by expected time to a successful
+        result, fastest first. Services with equal expectations (such as ones
+        that have never been called) keep their original order.
+        """
+        return sorted(
+            services, key=lambda s: self.expected_time(s, method_name, crypto)
+        )
+
+    def get(self, service, method_name, crypto):
+        with self._lock:
+            stats = self._stats.get(self._key(service, method_name, crypto))
+            if not stats:
+                return None
+            ret = dict(stats)
+            ret['errors'] = dict(stats['errors'])
+            ret['latencies'] = list(stats['latencies'])
+            return ret
+
+    def summary(self):
+        """
+        Returns a dict of (service name, method, crypto) -> counts for every
+        service call recorded so far.
+        """
+        with self._lock:
+            return {
+                key: dict(
+                    (k, dict(v) if k == 'errors' else v)
+                    for k, v in stats.items() if k != 'latencies'
+                ) for key, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+service_stats = ServiceStats()
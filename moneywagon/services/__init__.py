@@ -30,19 +30,11 @@ def _get_all_services(crypto=None, just_exchange=False):
 
         # price services are defined as dictionaries, all other services
         # are defined as a list.
-        price_services = data['services']['current_price']
-        del data['services']['current_price']
-
-        all_services = list(price_services.values())
-        if not just_exchange:
-            all_services += list(data['services'].values())
-
-        # replace
-        data['services']['current_price'] = price_services
-
-        services.append([
-            item for sublist in all_services for item in sublist
-        ])
+        for type_of_service, type_services in data['services'].items():
+            if type_of_service == 'current_price':
+                services.extend(type_services.values())
+            elif not just_exchange:
+                services.append(type_services)
 
     return sorted(
         set([item for sublist in services for item in sublist]),
@@ -106,6 +106,7 @@ class FullNodeCLIInterface(Service):
 class BlockCypher(Service):
     service_id = 2
     supported_cryptos = ['btc', 'ltc', 'doge']
+    rate_limit = 3 # free tier, no api token
     api_homepage = "http://dev.blockcypher.com/"
 
     explorer_address_url = "https://live.blockcypher.com/{crypto}/address/{address}"
@@ -281,6 +282,8 @@ class SmartBitAU(Service):
     name = "SmartBit"
 
     supported_cryptos = ['btc']
+    max_addresses_per_call = 100
+    max_txids_per_call = 50
 
     def get_balance(self, crypto, address, confirmations=1):
         url = "%s/address/%s" % (self.base_url, address)
@@ -357,8 +360,16 @@ class SmartBitAU(Service):
 
     def get_single_transaction(self, crypto, txid):
         url = "%s/tx/%s" % (self.base_url, txid)
-        r = self.get_url(url).json()['transaction']
+        return self._format_single_tx(self.get_url(url).json()['transaction'], txid)
 
+    def get_single_transaction_multi(self, crypto, txids):
+        url = "%s/tx/%s" % (self.base_url, ",".join(txids))
+        response = self.get_url(url).json()
+        if 'transactions' in response:
+            return [self._format_single_tx(r, r['txid']) for r in response['transactions']]
+        return [self._format_single_tx(response['transaction'], txids[0])]
+
+    def _format_single_tx(self, r, txid):
         ins = [
             {
                 'address': x['addresses'][0],
@@ -435,7 +446,8 @@ class ChainSo(Service):
         if len(items) == 0:
             raise SkipThisService("Chain.so can't get price for %s/%s" % (crypto, fiat))
 
-        self.name = "%s via Chain.so" % items[0]['exchange']
+        # price is from items[0]['exchange']. self.name is not changed, as
+        # this instance is shared with other calls.
         return float(items[0]['price'])
 
     def get_balance(self, crypto, address, confirmations=1):
@@ -1002,6 +1014,16 @@ class BitpayInsight(Service):
             transactions.append(self._format_tx(tx, [address]))
         return transactions
 
+    def get_transactions_page(self, crypto, address, cursor=None):
+        page = cursor or 0
+        url = "%s://%s/%s/txs/?address=%s&pageNum=%s" % (
+            self.protocol, self.domain, self.api_tag, address, page
+        )
+        response = self.get_url(url).json()
+        transactions = [self._format_tx(tx, [address]) for tx in response['txs']]
+        next_page = page + 1 if page + 1 < response.get('pagesTotal', 0) else None
+        return transactions, next_page
+
     def get_transactions_multi(self, crypto, addresses):
         url = "%s://%s/%s/addrs/%s/txs" % (
             self.protocol, self.domain, self.api_tag, ','.join(addresses)
@@ -1288,6 +1310,7 @@ class Blockonomics(Service):
     api_homepage = "https://www.blockonomics.co/views/api.html"
     name = "Blockonomics"
     base_url = "https://www.blockonomics.co"
+    max_addresses_per_call = 50
 
     def get_balance(self, crypto, address, confirmations=1):
         return self.get_balance_multi(crypto, [address], confirmations)[address]
@@ -1810,6 +1833,7 @@ class BitcoinChain(Service):
     service_id = 50
     base = "https://api-r.bitcoinchain.com"
     supported_cryptos = ['btc']
+    max_addresses_per_call = 40
 
     def get_balance(self, crypto, address, confirmations=1):
         url = "%s/v1/address/%s" % (self.base, address)
@@ -2051,6 +2075,7 @@ class Etherscan(Service):
     service_id = 58
     name = "Etherscan"
     supported_cryptos = ['eth']
+    rate_limit = 5
 
     def get_balance(self, crypto, address, confirmations=1):
         url = "https://api.etherscan.io/api?module=account&action=balance&address=%s&tag=latest" % address
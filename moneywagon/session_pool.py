@@ -0,0 +1,122 @@
+"""
+Keep-alive HTTP connection pooling for Service classes.
+
+Instead of opening a fresh TCP+TLS connection for every external request, all
+services share one `requests.Session` per domain. Sessions (and the urllib3
+connection pools behind them) are safe to share between the threads started
+by `_get_results` and `_do_private_mode`.
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from urlparse import urlparse
+except ImportError:
+    from urllib.parse import urlparse
+
+
+def positional_argument(method):
+    return 'params' if method.lower() == 'get' else 'data'
+
+
+class SessionPool(object):
+    """
+    Holds one `requests.Session` for each domain (scheme + host + port).
+
+    `pool_connections` is how many distinct hosts each session's adapter
+      keeps connections open for (usually 1 host per session).
+    `pool_maxsize` is how many simultaneous keep-alive connections are held
+      open to a single domain. Should be at least as large as the number of
+      threads that may hit the same domain at once.
+    `keep_alive` when False, a `Connection: close` header is sent so the
+      connection is torn down after each request.
+    `max_retries` is passed on to the underlying `HTTPAdapter`.
+    """
+    def __init__(self, pool_connections=1, pool_maxsize=20, keep_alive=True, max_retries=0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<SessionPool: %s domains, maxsize=%s>" % (len(self._sessions), self.pool_maxsize)
+
+    @staticmethod
+    def domain_key(url):
+        parsed = urlparse(url)
+        return "%s://%s" % (parsed.scheme.lower(), parsed.netloc.lower())
+
+    def _make_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def get_session(self, url):
+        """
+        Returns the session for the domain of the passed in url. Creates it
+        if this is the first request to that domain.
+        """
+        key = self.domain_key(url)
+        session = self._sessions.get(key)
+        if session:
+            return session
+
+        with self._lock:
+            if key not in self._sessions:
+                self._sessions[key] = self._make_session()
+            return self._sessions[key]
+
+    def request(self, method, url, *args, **kwargs):
+        """
+        Like `requests.get(url, params)` and `requests.post(url, data)`: a
+        positional argument is the query params of a GET, and the body of
+        anything else.
+        """
+        if args:
+            kwargs[positional_argument(method)] = args[0]
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def configure(self, pool_connections=None, pool_maxsize=None, keep_alive=None, max_retries=None):
+        """
+        Change the pool settings. Already open sessions are closed so the
+        new settings take effect on the next request.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+        if max_retries is not None:
+            self.max_retries = max_retries
+        self.close()
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.close()
+
+
+default_session_pool = SessionPool()
+
+def configure_session_pool(**kwargs):
+    """
+    Change the settings of the process-wide session pool used by all services.
+    Accepts the same arguments as `SessionPool.configure`.
+    """
+    default_session_pool.configure(**kwargs)
@@ -0,0 +1,88 @@
+"""
+Request coalescing. When many threads make the same call at the same time,
+only the first one (the "leader") actually makes it. The others wait for
+the leader to finish and get its result (or its exception).
+
+Used by `Service._external_request` for GET requests, and by
+`AutoFallbackFetcher` so that identical fetcher actions running at the same
+time share one walk through the services.
+"""
+import threading
+
+
+def freeze(obj):
+    """
+    Turn `obj` into something hashable so it can be used in a key. Dicts and
+    lists are turned into tuples, anything else unhashable into its repr.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = [freeze(x) for x in obj]
+        return tuple(sorted(items, key=repr) if isinstance(obj, (set, frozenset)) else items)
+    try:
+        hash(obj)
+    except TypeError:
+        return repr(obj)
+    return obj
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.exc = None
+
+
+class SingleFlight(object):
+    """
+    Set `enabled` to False to make every call on its own.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.shared = 0 # how many calls were answered by another thread's call.
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """
+        Call `func` unless a call with the same `key` is already in progress,
+        in which case wait for it. Returned is a two item tuple, the first
+        item is the result, the second is True if the result came from
+        another thread's call.
+        """
+        if not self.enabled:
+            return func(), False
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            with self._lock:
+                self.shared += 1
+            if call.exc is not None:
+                raise call.exc
+            return call.value, True
+
+        try:
+            call.value = func()
+        except BaseException as exc:
+            call.exc = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.value, False
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+single_flight = SingleFlight()
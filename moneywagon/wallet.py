@@ -3,6 +3,8 @@ from __future__ import print_function
 from concurrent import futures
 from moneywagon import get_address_balance, get_current_price
 from moneywagon.core import NoService
+from moneywagon.deadline import start_deadline
+from moneywagon.executor import default_executor
 
 def fetch_wallet_balances(wallets, fiat, **modes):
     """
@@ -13,7 +15,10 @@ def fetch_wallet_balances(wallets, fiat, **modes):
         ['btc', '1PZ3Ps9RvCmUW1s1rHE25FeR8vtKUrhEai'],
         ['ltc', 'Lb78JDGxMcih1gs3AirMeRW6jaG5V9hwFZ']
     ]
+
+    A `deadline` is shared by every fetch.
     """
+    modes = start_deadline(modes)
     price_fetch = set([x[0] for x in wallets])
     balances = {}
     prices = {}
@@ -49,34 +54,33 @@ def fetch_wallet_balances(wallets, fiat, **modes):
         if modes.get('verbose', False):
             print("Need to make", fetch_length, "external calls")
 
-        with futures.ThreadPoolExecutor(max_workers=int(fetch_length / 2)) as executor:
-            future_to_key = dict(
-                (executor.submit(
-                    get_current_price, crypto, fiat, report_services=True, **modes
-                ), crypto) for crypto in price_fetch
-            )
-
-            future_to_key.update(dict(
-                (executor.submit(
-                    get_address_balance, crypto, address.strip(), **modes
-                ), address) for crypto, address in wallets
-            ))
-
-            done, not_done = futures.wait(future_to_key, return_when=futures.ALL_COMPLETED)
-            if len(not_done) > 0:
-                print (not_done)
-                import debug
-                raise Exception("Broke") #not_done.pop().exception()
-
-            for future in done:
-                key = future_to_key[future]
-                if len(key) > 5: # this will break if a crypto symbol is longer than 5 chars.
-                    which = balances
-                else:
-                    which = prices
-
-                res = future.result()
-                which[key] = res
+        future_to_key = dict(
+            (default_executor.submit(
+                get_current_price, crypto, fiat, report_services=True, **modes
+            ), crypto) for crypto in price_fetch
+        )
+
+        future_to_key.update(dict(
+            (default_executor.submit(
+                get_address_balance, crypto, address.strip(), **modes
+            ), address) for crypto, address in wallets
+        ))
+
+        done, not_done = futures.wait(future_to_key, return_when=futures.ALL_COMPLETED)
+        if len(not_done) > 0:
+            print (not_done)
+            import debug
+            raise Exception("Broke") #not_done.pop().exception()
+
+        for future in done:
+            key = future_to_key[future]
+            if len(key) > 5: # this will break if a crypto symbol is longer than 5 chars.
+                which = balances
+            else:
+                which = prices
+
+            res = future.result()
+            which[key] = res
 
     ret = []
 
@@ -1,7 +1,39 @@
 import datetime
+import time
+import os
+import sys
+import tempfile
+import subprocess
 
 from moneywagon.supply_estimator import SupplyEstimator
 from moneywagon.crypto_data import crypto_data
+from moneywagon.session_pool import SessionPool
+from moneywagon.cache import ResponseCache, ChainDataStore
+from moneywagon.core import Service
+from moneywagon.service_stats import service_stats, ServiceStats
+from moneywagon import (
+    CurrentPrice, AddressBalance, get_optimal_services, get_address_balance, get_unspent_outputs,
+    get_block, get_single_transaction, push_tx, ExchangeUniverse
+)
+from moneywagon.circuit_breaker import circuit_breakers
+from moneywagon.core import (
+    RevertToPrivateMode, ServiceDisagreement, DeadlineExceeded, NoService, ServiceError, RateLimited,
+    enforce_service_mode
+)
+from moneywagon.capabilities import implements
+from moneywagon.credentials import CredentialStore
+from moneywagon.instance_pool import service_instances
+from moneywagon.circuit_breaker import CircuitBreaker
+from moneywagon.rate_limit import TokenBucket, parse_retry_after
+from moneywagon.single_flight import single_flight
+from moneywagon.executor import SharedExecutor
+from moneywagon.instrumentation import instrumentation, HistogramSink
+from moneywagon.insight_server import InsightServer
+from moneywagon.recording import recording, replaying
+from moneywagon.history import iter_transactions, HistorySync
+from moneywagon.bulk import BulkBalance, iter_single_transactions
+from moneywagon.aggregate import aggregate_mad
+from concurrent import futures
 
 def test_blocktime_adjustments():
     sd = {
@@ -34,9 +66,699 @@ def test_blocktime_adjustments():
         assert s.estimate_height_from_date(datetime.datetime(2017, 1, 1, 0, 8)) == 4
         assert s.estimate_height_from_date(datetime.datetime(2017, 1, 1, 0, 13)) == 9
 
+def test_session_pool_shares_sessions_by_domain():
+    pool = SessionPool(pool_maxsize=5)
+    s1 = pool.get_session("https://insight.bitpay.com/api/addr/1abc/balance")
+    s2 = pool.get_session("https://INSIGHT.bitpay.com/api/tx/abc")
+    s3 = pool.get_session("http://insight.bitpay.com/api/tx/abc")
+    assert s1 is s2
+    assert s1 is not s3
 
+    pool.configure(keep_alive=False)
+    s4 = pool.get_session("https://insight.bitpay.com/api/tx/abc")
+    assert s4 is not s1
+    assert s4.headers['Connection'] == 'close'
+
+def test_response_cache_lru_and_ttl():
+    cache = ResponseCache(max_entries=2, method_ttls={'get_balance': 0})
+    cache.set('a', 'x' * 10)
+    cache.set('b', 'y' * 10)
+    assert cache.get('a') is not None # 'a' is now most recently used
+    cache.set('c', 'z' * 10)
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert cache.evictions == 1
+
+    cache.set('balance', 'w', method_name='get_balance')
+    assert cache.get('balance') is None
+
+    cache.set('tx', 'v', ttl=None)
+    assert cache['tx'] == 'v'
+    assert cache.stats()['hits'] == 2
+
+def test_chain_data_store_roundtrip():
+    store = ChainDataStore(':memory:')
+    tx = {
+        'txid': 'abc', 'confirmations': 3, 'fee': 1000,
+        'time': datetime.datetime(2017, 1, 1, 0, 16),
+        'inputs': [{'address': '1abc', 'amount': 5000}],
+    }
+    store.set('BTC', 'tx:abc', tx)
+    assert store.get('btc', 'tx:abc') == tx
+    assert store.get('ltc', 'tx:abc') is None
+    assert len(store) == 1
+
+class SlowPriceService(Service):
+    service_id = 0
+    def get_current_price(self, crypto, fiat):
+        time.sleep(0.5)
+        return 1.0
+
+class QuickPriceService(Service):
+    service_id = 0
+    def get_current_price(self, crypto, fiat):
+        return 2.0
+
+def test_hedged_fetch_uses_first_response():
+    service_stats.reset()
+    fetcher = CurrentPrice(services=[SlowPriceService, QuickPriceService], hedge=0.05)
+    t0 = time.time()
+    assert fetcher.action('btc', 'usd') == 2.0
+    assert time.time() - t0 < 0.4
+    assert fetcher._successful_service.name == 'QuickPriceService'
+    assert service_stats.get('QuickPriceService', 'get_current_price', 'btc')['hedged'] == 1
+
+def test_service_stats_orders_by_expected_time():
+    stats = ServiceStats()
+    for i in range(10):
+        stats.record('Slow', 'get_balance', 'btc', 2.0, True)
+        stats.record('Flaky', 'get_balance', 'btc', 0.1, i % 5 == 0, error=None if i % 5 == 0 else 'ServiceError')
+        stats.record('Fast', 'get_balance', 'btc', 0.2, True)
+
+    assert stats.get('Flaky', 'get_balance', 'btc')['errors'] == {'ServiceError': 8}
+    ordered = stats.order_services(['Slow', 'Unknown', 'Flaky', 'Fast'], 'get_balance', 'BTC')
+    assert ordered == ['Fast', 'Flaky', 'Unknown', 'Slow']
+
+def test_circuit_breaker_states():
+    breaker = CircuitBreaker('Test', failure_threshold=2, cooldown=0.05)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.status()['state'] == 'open'
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.allow_request() # half-open probe
+    assert not breaker.allow_request() # only one probe at a time
+    breaker.record_failure()
+    assert breaker.status()['state'] == 'open'
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.status()['state'] == 'closed'
+    assert breaker.times_opened == 2
+
+    class ThrottledPriceService(Service):
+        service_id = 0
+        def get_current_price(self, crypto, fiat):
+            raise RateLimited("ThrottledPriceService rate limit reached")
+
+    class ChangedApiPriceService(Service):
+        service_id = 0
+        def get_current_price(self, crypto, fiat):
+            return {}['price']
+
+    # a throttled probe neither closes the breaker nor keeps the probe
+    breaker = circuit_breakers.get(ThrottledPriceService)
+    breaker.cooldown = 0
+    for i in range(breaker.failure_threshold):
+        breaker.record_failure()
+    for i in range(2):
+        try:
+            CurrentPrice(services=[ThrottledPriceService]).action('btc', 'usd')
+        except NoService:
+            pass
+        assert breaker.status()['state'] == 'half-open'
+
+    # unparseable responses count as failures
+    breaker = circuit_breakers.get(ChangedApiPriceService)
+    for i in range(breaker.failure_threshold):
+        try:
+            CurrentPrice(services=[ChangedApiPriceService]).action('btc', 'usd')
+        except NoService:
+            pass
+    assert breaker.status()['state'] == 'open'
+    circuit_breakers.reset()
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve(max_wait=0) == 0
+    assert bucket.reserve(max_wait=0) == 0
+    assert bucket.reserve(max_wait=0) is None # would have to wait, spill over
+    assert 0 < bucket.reserve(max_wait=1) <= 0.1
+
+    bucket.penalize(retry_after=parse_retry_after("5"))
+    assert bucket.rate == 5
+    assert bucket.reserve(max_wait=1) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+class CountingPriceService(Service):
+    service_id = 0
+    calls = 0
+
+    def get_current_price(self, crypto, fiat):
+        CountingPriceService.calls += 1
+        time.sleep(0.2)
+        return {'price': 3.0}
+
+def test_single_flight_shares_identical_actions():
+    CountingPriceService.calls = 0
+    shared_before = single_flight.shared
+    action = lambda i: CurrentPrice(services=[CountingPriceService]).action('btc', 'usd')
+    with futures.ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(action, range(5)))
+
+    assert CountingPriceService.calls == 1
+    assert single_flight.shared - shared_before == 4
+    assert results == [{'price': 3.0}] * 5
+    assert len(set(id(r) for r in results)) == 5 # each caller gets its own copy
+
+    # a caller with a shorter timeout does not wait on one with a longer timeout
+    CountingPriceService.calls = 0
+    action = lambda timeout: CurrentPrice(services=[CountingPriceService], timeout=timeout).action('btc', 'usd')
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(action, [30, 1]))
+    assert CountingPriceService.calls == 2
+
+def test_shared_executor_stays_bounded():
+    executor = SharedExecutor(max_workers=4)
+
+    def outer(i):
+        # nested submissions run inline when the pool is full instead of deadlocking
+        inner = [executor.submit(lambda x: x * 2, i + n) for n in range(3)]
+        return sum(f.result() for f in inner)
+
+    fetches = [executor.submit(outer, i) for i in range(200)]
+    assert [f.result() for f in fetches] == [6 * i + 6 for i in range(200)]
+    assert executor.thread_count() <= 4
+
+    # futures cancelled before they start (as fast mode does) give back their thread
+    for i in range(50):
+        fetches = [executor.submit(time.sleep, 0.001) for n in range(4)]
+        for future in fetches:
+            future.cancel()
+    assert executor.submit(lambda: 'free').result(timeout=5) == 'free'
+
+    # calls abandoned while still running (a hung service) do not hold up new work
+    hung = [executor.submit(time.sleep, 1) for n in range(4)]
+    for future in hung:
+        executor.abandon(future)
+    t0 = time.time()
+    assert executor.submit(lambda: 'free').result(timeout=5) == 'free'
+    assert time.time() - t0 < 0.5
+
+class FakeResponse(object):
+    status_code = 200
+    content = b'{"price": 4.0}'
+    headers = {}
+
+    def json(self):
+        return {'price': 4.0}
+
+class FakePool(object):
+    def request(self, method, url, **kwargs):
+        return FakeResponse()
+
+class BrokenPriceService(Service):
+    service_id = 0
+
+    def get_current_price(self, crypto, fiat):
+        raise ValueError("api changed")
+
+class PooledPriceService(Service):
+    service_id = 0
+    session_pool = FakePool()
+
+    def get_current_price(self, crypto, fiat):
+        url = "https://example.com/price/%s/%s/1234567" % (crypto, fiat)
+        return self.get_url(url).json()['price'] + self.get_url(url).json()['price']
+
+def test_instrumentation_events():
+    events = []
+    sink = instrumentation.add_hook(HistogramSink())
+    instrumentation.add_hook(events.append)
+    try:
+        # the second request is answered from the fetcher's own cache.
+        fetcher = CurrentPrice(services=[BrokenPriceService, PooledPriceService])
+        assert fetcher.action('btc', 'usd') == 8.0
+    finally:
+        instrumentation.remove_hook(sink)
+        instrumentation.remove_hook(events.append)
+
+    assert [(e['type'], e['service']) for e in events] == [
+        ('attempt', 'BrokenPriceService'),
+        ('request', 'PooledPriceService'),
+        ('request', 'PooledPriceService'),
+        ('attempt', 'PooledPriceService'),
+    ]
+    assert events[0]['exception'] == 'ValueError: api changed'
+    assert [e['cache'] for e in events[1:3]] == ['miss', 'hit']
+    assert events[1]['url_template'] == "https://example.com/price/btc/usd/{}"
+    assert events[1]['method'] == 'get_current_price' and events[1]['crypto'] == 'btc'
+
+    stats = sink.summary()[('request', 'PooledPriceService', 'get_current_price', 'btc')]
+    assert stats['count'] == 2 and stats['cache_hits'] == 1 and stats['statuses'] == {200: 2}
+    assert sink.percentile('PooledPriceService', 'get_current_price', 99) == 0.05
+
+    # benchmarks only count this universe's own instances, not earlier calls
+    universe = ExchangeUniverse(services=[PooledPriceService])
+    assert universe.get_benchmarks() == {}
+    universe.services[0].get_current_price('btc', 'usd')
+    assert list(universe.get_benchmarks()) == ['PooledPriceService']
+
+class CountingBalanceService(Service):
+    service_id = 0
+    calls = 0
+
+    def get_balance(self, crypto, address, confirmations=1):
+        CountingBalanceService.calls += 1
+        return 1.0
+
+def test_capability_index():
+    assert implements(CountingBalanceService, 'get_balance')
+    assert not implements(CountingBalanceService, 'get_balance_multi')
+
+    services = get_optimal_services('btc', 'push_tx')
+    services.pop()
+    assert len(get_optimal_services('btc', 'push_tx')) == len(services) + 1
+
+    CountingBalanceService.calls = 0
+    fetcher = AddressBalance(services=[CountingPriceService, CountingBalanceService])
+    assert fetcher.action('btc', address='1abc') == 1.0
+    try:
+        fetcher.action('btc', addresses=['1abc', '1def'])
+        assert False, "should have reverted to private mode"
+    except RevertToPrivateMode:
+        pass
+    assert CountingBalanceService.calls == 1
+
+def test_credential_store():
+    path = os.path.join(tempfile.mkdtemp(), 'exchange_keys')
+    store = CredentialStore(path)
+    assert store.get('Bitstamp') == {}
+
+    store.install('Bitstamp', 'api_key', 'abc')
+    with open(path, 'w') as f:
+        f.write('{"Bitstamp": {"api_key": "changed"}}')
+    assert store.get('Bitstamp') == {'api_key': 'abc'} # not read again until reloaded
+
+    store.reload()
+    assert store.get('Bitstamp') == {'api_key': 'changed'}
+
+    with open(path, 'w') as f:
+        f.write('{"Bitstamp": {"api_key": "changed"},') # broken JSON
+    try:
+        store.install('Poloniex', 'api_key', 'def')
+        assert False, "malformed file was overwritten"
+    except ValueError:
+        with open(path) as f:
+            assert f.read() == '{"Bitstamp": {"api_key": "changed"},'
+
+class EchoBalanceService(Service):
+    service_id = 0
+    session_pool = FakePool()
+
+    def get_balance(self, crypto, address, confirmations=1):
+        self.get_url("https://example.com/balance/%s" % address)
+        time.sleep(0.05)
+        return float(len(address))
+
+def test_pooled_service_instances():
+    service_instances.clear()
+
+    def fetch(address):
+        fetcher = AddressBalance(services=[EchoBalanceService])
+        return fetcher.action('btc', address=address), fetcher
+
+    addresses = ['1a', '1bb', '1ccc', '1dddd']
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch, addresses))
+
+    assert len(set(id(fetcher.services[0]) for balance, fetcher in results)) == 1
+    for address, (balance, fetcher) in zip(addresses, results):
+        # per-call state is not mixed up between threads sharing the instance
+        assert balance == len(address)
+        assert fetcher._successful_service.last_url.endswith("/" + address)
+
+def test_default_calls_see_chain_changes():
+    service_instances.clear()
+    with InsightServer() as server:
+        services = [server.service_class()]
+        chain, miner = server.chain, server.chain.miner
+
+        def fetch():
+            return (
+                get_address_balance('btc', miner, services=services),
+                len(get_unspent_outputs('btc', miner, services=services)),
+                get_block('btc', latest=True, services=services)['block_number'],
+            )
+
+        before = fetch()
+        chain.add_blocks(5)
+        after = fetch()
+        assert after[0] > before[0] and after[1] == before[1] + 5 and after[2] == before[2] + 5
+
+        # confirmed transactions are still only fetched once
+        txid = chain.address_txids[miner][0]
+        get_single_transaction('btc', txid, services=services)
+        requests_made = server.requests
+        get_single_transaction('btc', txid, services=services)
+        assert server.requests == requests_made
+
+def test_record_and_replay_local_insight():
+    fixtures = tempfile.mkdtemp()
+    with InsightServer() as server:
+        LocalInsight = server.service_class()
+        address = server.chain.addresses[0]
+        expected = server.chain.balance(address) / 1e8
+
+        with recording(fixtures) as pool:
+            fetcher = AddressBalance(services=[LocalInsight], responses={})
+            assert fetcher.action('btc', address=address) == expected
+            # same url, different bodies
+            pushed = [push_tx('btc', raw, services=[LocalInsight]) for raw in ('aa' * 60, 'bb' * 60)]
+        assert pool.recorded == 3 and pushed[0] != pushed[1]
+
+        server.error_rate = 1
+        fetcher = AddressBalance(services=[LocalInsight], responses={})
+        try:
+            fetcher.action('btc', address=address)
+            assert False, "injected error not raised"
+        except Exception as exc:
+            assert "500" in str(exc)
+
+    # server is gone, response comes from the fixture
+    with replaying(fixtures) as pool:
+        fetcher = AddressBalance(services=[LocalInsight], responses={})
+        assert fetcher.action('btc', address=address) == expected
+        fetcher = AddressBalance(services=[LocalInsight], responses={})
+        try:
+            fetcher.action('btc', address=server.chain.addresses[1])
+            assert False, "request with no fixture did not fail"
+        except Exception:
+            assert len(pool.misses) == 1
+        assert push_tx('btc', 'aa' * 60, services=[LocalInsight]) == pushed[0]
+
+    # a subclass goes back to inheriting its pool afterwards
+    assert 'session_pool' not in LocalInsight.__dict__
+    with replaying(fixtures, LocalInsight):
+        pass
+    assert 'session_pool' not in LocalInsight.__dict__
+
+def test_iter_transactions_pages_and_resumes():
+    with InsightServer() as server:
+        LocalInsight = server.service_class()
+        address = server.chain.addresses[0]
+
+        it = iter_transactions('btc', address, services=[LocalInsight])
+        txids = [tx['txid'] for tx in it]
+        assert sorted(txids) == sorted(server.chain.address_txids[address])
+        assert it.pages > 1 and it.finished
+
+        it = iter_transactions('btc', address, services=[LocalInsight])
+        first = [tx['txid'] for n, tx in zip(range(15), it)]
+        rest = [tx['txid'] for tx in iter_transactions('btc', address, cursor=it.cursor, services=[LocalInsight])]
+        assert first + rest == txids
+
+def test_history_sync_returns_only_changes():
+    with InsightServer() as server:
+        LocalInsight = server.service_class()
+        chain = server.chain
+        address = chain.addresses[0]
+
+        sync = HistorySync('btc', services=[LocalInsight], confirmations=3, responses={})
+        assert len(sync.poll(address)['new']) == len(chain.address_txids[address])
+        pending = sync.state[address]['pending']
+
+        chain.add_blocks(3)
+        requests = server.requests
+        sync = HistorySync('btc', state=sync.state, services=[LocalInsight], confirmations=3, responses={})
+        delta = sync.poll(address)
+        assert server.requests - requests == 1 # only the first page
+        mined = set(txid for block in chain.blocks[-3:] for txid in block['tx'])
+        assert set(tx['txid'] for tx in delta['new']) == mined & set(chain.address_txids[address])
+        assert sorted(tx['txid'] for tx in delta['updated']) == sorted(pending)
+        assert not delta['dropped']
+
+class ChunkedBalanceService(Service):
+    service_id = 0
+    max_addresses_per_call = 7
+    chunks = []
+
+    def get_balance_multi(self, crypto, addresses, confirmations=1):
+        self.chunks.append(len(addresses))
+        return dict((a, float(len(a))) for a in addresses if not a.endswith('9'))
+
+class DownBalanceService(Service):
+    service_id = 0
+
+    def get_balance_multi(self, crypto, addresses, confirmations=1):
+        raise ValueError("down")
+
+class OneAtATimeBalanceService(Service):
+    service_id = 0
+
+    def get_balance(self, crypto, address, confirmations=1):
+        return float(len(address))
+
+def test_bulk_balance_chunks_and_retries():
+    addresses = ["1addr%s" % i for i in range(100)]
+    bulk = BulkBalance('btc', services=[DownBalanceService, ChunkedBalanceService, OneAtATimeBalanceService])
+    balances = bulk.fetch(addresses)
+
+    assert balances == dict((a, float(len(a))) for a in addresses)
+    assert max(ChunkedBalanceService.chunks) <= 7
+    assert not bulk.failed
+    # addresses ending in 9 are left out by the chunked service, so are retried one at a time.
+    assert bulk.calls['OneAtATimeBalanceService'] >= 10
+
+    services, balances = get_address_balance(
+        'btc', addresses=addresses[:20], services=[DownBalanceService, ChunkedBalanceService, OneAtATimeBalanceService],
+        bulk=True, report_services=True
+    )
+    assert [s.name for s in services] == ['ChunkedBalanceService', 'OneAtATimeBalanceService']
+    assert balances['total_balance'] == sum(float(len(a)) for a in addresses[:20])
+
+    bulk = BulkBalance('btc', services=[DownBalanceService])
+    assert bulk.fetch(addresses[:3]) == {}
+    assert sorted(bulk.failed) == addresses[:3]
+
+    # a half-open service is probed by the bulk fetch and recovers
+    breaker = circuit_breakers.get(ChunkedBalanceService)
+    breaker.cooldown = 0
+    for i in range(breaker.failure_threshold):
+        breaker.record_failure()
+    bulk = BulkBalance('btc', services=[ChunkedBalanceService], chunk_size=2)
+    assert bulk.fetch(addresses[:8]) == dict((a, float(len(a))) for a in addresses[:8])
+    assert breaker.status()['state'] == 'closed'
+    circuit_breakers.reset()
+
+class BatchTransactionService(Service):
+    service_id = 0
+    max_txids_per_call = 4
+    batches = []
+
+    def get_single_transaction_multi(self, crypto, txids):
+        self.batches.append(len(txids))
+        # leaves out the last txid of each batch, to be fetched elsewhere
+        return [{'txid': txid, 'confirmations': 0} for txid in txids[:-1]]
+
+def test_single_transactions_stream_and_fall_back():
+    with InsightServer() as server:
+        LocalInsight = server.service_class()
+        txids = sorted(server.chain.txs)[:20]
+
+        stream = iter_single_transactions('btc', txids, services=[BatchTransactionService, LocalInsight])
+        first_txid, first_tx = next(stream)
+        assert first_txid in txids
+        fetched = dict([(first_txid, first_tx)] + list(stream))
+
+    assert sorted(fetched) == txids
+    assert max(BatchTransactionService.batches) <= 4
+    from_insight = [txid for txid, tx in fetched.items() if 'outputs' in tx]
+    assert len(from_insight) == len(BatchTransactionService.batches)
+
+def make_price_service(name, price, delay):
+    def get_current_price(self, crypto, fiat):
+        time.sleep(delay)
+        return price
+    return type(name, (Service,), {'service_id': 0, 'get_current_price': get_current_price})
+
+def make_down_service(name):
+    def get_current_price(self, crypto, fiat):
+        raise ServiceError("503 - Temporarily out of service.")
+    return type(name, (Service,), {'service_id': 0, 'get_current_price': get_current_price})
+
+def test_paranoid_quorum_exits_early():
+    quick = [make_price_service("QuorumQuick%s" % i, 10.0, 0.01 * i) for i in range(3)]
+    wrong = make_price_service("QuorumWrong", 11.0, 0.02)
+    slow = make_price_service("QuorumSlow", 10.0, 1)
+    kwargs = {'crypto': 'btc', 'fiat': 'usd'}
+
+    t0 = time.time()
+    services, price = enforce_service_mode(
+        quick + [wrong, slow], CurrentPrice, kwargs, modes={'paranoid': 5, 'quorum': 3, 'report_services': True}
+    )
+    assert price == 10.0 and len(services) == 3
+    assert time.time() - t0 < 0.5
+
+    t0 = time.time()
+    try:
+        enforce_service_mode([quick[0], wrong, slow], CurrentPrice, kwargs, modes={'paranoid': 3})
+        assert False, "disagreement not raised"
+    except ServiceDisagreement:
+        assert time.time() - t0 < 0.5 # did not wait for the slow service
+
+    # every agreeing result comes from a different service, failed ones are replaced
+    down = [make_down_service("QuorumDown%s" % i) for i in range(2)]
+    try:
+        enforce_service_mode([quick[0]] + down, CurrentPrice, kwargs, modes={'paranoid': 3})
+        assert False, "one service counted as three"
+    except NoService:
+        pass
+    services, price = enforce_service_mode(
+        [quick[0]] + down + quick[1:], CurrentPrice, kwargs, modes={'paranoid': 3, 'report_services': True}
+    )
+    assert sorted(s.name for s in services) == ['QuorumQuick0', 'QuorumQuick1', 'QuorumQuick2']
+
+def test_fast_mode_returns_first_results():
+    quick = [make_price_service("FastQuick%s" % i, 10.0 + i, 0.05 * i) for i in range(3)]
+    slow = make_price_service("FastSlow", 10.0, 1)
+    down = make_down_service("FastDown")
+    kwargs = {'crypto': 'btc', 'fiat': 'usd'}
+
+    t0 = time.time()
+    services, price = enforce_service_mode(
+        [slow, down] + quick, CurrentPrice, kwargs, modes={'fast': 2, 'report_services': True}
+    )
+    # the results need not agree, prices are averaged
+    assert price == 10.5 and [s.name for s in services] == ['FastQuick0', 'FastQuick1']
+    assert time.time() - t0 < 0.5 # the slow service was abandoned, not waited for
+
+    try:
+        enforce_service_mode([quick[0], down], CurrentPrice, kwargs, modes={'fast': 2})
+        assert False, "fast mode returned too few results"
+    except NoService as exc:
+        assert "only got 1" in str(exc)
+
+def test_aggregate_modes_reject_outliers():
+    prices = [99.0, 100.0, 100.5, 101.0, 10000.0]
+    services = [make_price_service("Aggregate%s" % i, p, 0.01) for i, p in enumerate(prices)]
+    slow = make_price_service("AggregateSlow", 5.0, 1)
+    kwargs = {'crypto': 'btc', 'fiat': 'usd'}
+
+    def fetch(how, **modes):
+        modes = dict(modes, aggregate=how, aggregate_timeout=0.3, report_services=True)
+        return enforce_service_mode(services + [slow], CurrentPrice, kwargs, modes=modes)
+
+    t0 = time.time()
+    report, price = fetch('median')
+    assert price == 100.5 and len(report) == 5
+    assert time.time() - t0 < 0.9 # the slow service was not waited for
+    assert [s['status'] for s in report.sources if s['service'] == 'AggregateSlow'] == ['late']
+
+    report, price = fetch('trimmed')
+    assert price == 100.5 and len(report) == 3
+
+    report, price = fetch('mad')
+    assert price == 100.125
+    outliers = [s['service'] for s in report.sources if s['status'] == 'outlier']
+    assert outliers == ['Aggregate4']
+
+    # most services agree exactly, a slightly different value is not an outlier
+    assert aggregate_mad([100.0, 100.0, 100.0, 100.5, 10000.0]) == (100.125, [0, 1, 2, 3])
+    assert aggregate_mad([100.0, 100.0, 100.0, 10000.0, 10000.0]) == (100.0, [0, 1, 2])
+    assert aggregate_mad([5.0, 5.0, 5.0]) == (5.0, [0, 1, 2])
+
+def test_deadline_covers_whole_fallback_chain():
+    with InsightServer(latency=0.6) as server:
+        services = [server.service_class(name="DeadlineInsight%s" % i) for i in range(4)]
+        address = server.chain.addresses[0]
+
+        t0 = time.time()
+        try:
+            get_address_balance('btc', address, services=services, responses={}, deadline=0.3)
+            assert False, "deadline not enforced"
+        except DeadlineExceeded as exc:
+            assert "Deadline of 0.3s passed" in str(exc)
+        assert time.time() - t0 < 0.55 # not one full request, let alone four
+        assert circuit_breakers.get(services[0]).consecutive_failures == 0 # not the service's fault
+
+        server.latency = 0
+        balance = get_address_balance('btc', address, services=services, responses={}, deadline=2)
+        assert balance == server.chain.balance(address) / 1e8
+
+def test_aio_modes_against_local_insight():
+    import asyncio
+    from moneywagon import aio
+
+    with InsightServer() as server:
+        chain = server.chain
+        with InsightServer(chain=chain, error_rate=1) as down, InsightServer(chain=chain, latency=1) as slow:
+            up = [server.service_class(name="AioUp%s" % i) for i in range(2)]
+            Down, Slow = down.service_class(name="AioDown"), slow.service_class(name="AioSlow")
+            address = chain.addresses[0]
+            expected = chain.balance(address) / 1e8
+
+            def balance(services, **modes):
+                return asyncio.run(aio.get_address_balance(
+                    'btc', address, services=services, report_services=True, **modes
+                ))
+
+            # the down service falls back to the next one
+            used, value = balance([Down] + up)
+            assert value == expected and [s.name for s in used] == ['AioUp0']
+
+            t0 = time.time()
+            used, value = balance([Slow, Down] + up, fast=2)
+            assert value == expected and sorted(s.name for s in used) == ['AioUp0', 'AioUp1']
+            assert time.time() - t0 < 0.8 # the slow service was not waited for
+            try:
+                balance([Slow, Down], fast=2, deadline=2)
+                assert False, "fast mode returned too few results"
+            except NoService:
+                pass
+
+            used, value = balance(up + [Down], paranoid=2)
+            assert value == expected and sorted(s.name for s in used) == ['AioUp0', 'AioUp1']
+
+            t0 = time.time()
+            try:
+                balance([Slow], deadline=0.3)
+                assert False, "deadline not enforced"
+            except DeadlineExceeded:
+                assert time.time() - t0 < 0.6
+
+def test_crypto_data_survives_submodule_imports():
+    import moneywagon
+    assert moneywagon.crypto_data['btc']['name'] == crypto_data['btc']['name']
+
+    # in a fresh interpreter, a submodule importing crypto_data is loaded first
+    script = (
+        "import moneywagon; from moneywagon.supply_estimator import SupplyEstimator; "
+        "from moneywagon import crypto_data; print(crypto_data['btc']['name'])"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=here)
+    assert output.decode().strip() == crypto_data['btc']['name']
 
 
 if __name__ == '__main__':
     test_blocktime_adjustments()
+    test_session_pool_shares_sessions_by_domain()
+    test_response_cache_lru_and_ttl()
+    test_chain_data_store_roundtrip()
+    test_hedged_fetch_uses_first_response()
+    test_service_stats_orders_by_expected_time()
+    test_circuit_breaker_states()
+    test_token_bucket()
+    test_single_flight_shares_identical_actions()
+    test_shared_executor_stays_bounded()
+    test_instrumentation_events()
+    test_capability_index()
+    test_credential_store()
+    test_pooled_service_instances()
+    test_default_calls_see_chain_changes()
+    test_record_and_replay_local_insight()
+    test_iter_transactions_pages_and_resumes()
+    test_history_sync_returns_only_changes()
+    test_bulk_balance_chunks_and_retries()
+    test_single_transactions_stream_and_fall_back()
+    test_paranoid_quorum_exits_early()
+    test_fast_mode_returns_first_results()
+    test_aggregate_modes_reject_outliers()
+    test_deadline_covers_whole_fallback_chain()
+    test_aio_modes_against_local_insight()
+    test_crypto_data_survives_submodule_imports()
     print("all tests passed")